@@ -0,0 +1,77 @@
+# Cache do programa analisado (src/ast/ast_cache.py): tempo das análises léxica, sintática e
+# semântica de um fonte (com o caminho padrão, lexer e parser do ANTLR, e com o lexer regex +
+# parser descendente recursivo) x carga do mesmo programa do cache, e o tamanho da entrada.
+# Confere que o TAC gerado a partir do programa do cache é o mesmo.
+# Uso: python -m benchmarks.bench_ast_cache [--lines 5000 20000 100000]
+import argparse
+import os
+import tempfile
+import time
+from src.lexer.poglin_lexer import PoglinLexerAnalyzer
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.ast.lowering import lower
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast import ast_cache
+from benchmarks.corpus import generate_program
+
+def front_end(path, backend):
+    lexer = PoglinLexerAnalyzer(path, backend="antlr" if backend == "antlr" else "regex")
+    lexer.analyze()
+    if backend == "antlr":
+        parser = PoglinParserAnalyzer(lexer.get_antlr_token_stream())
+        parser.analyze()
+        program = lower(parser.get_parse_tree())
+    else:
+        parser = PoglinRDParserAnalyzer(lexer.get_antlr_token_stream())
+        parser.analyze()
+        program = parser.get_ast()
+    semantic = SemanticAnalyzer()
+    assert semantic.visit(program)
+    return program, semantic.symbol_table
+
+def tac_of(program, symbol_table):
+    tac = TACGenerator()
+    tac.set_symbol_table(symbol_table)
+    tac.visit(program)
+    return [str(instr) for instr in tac.get_tac()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Léxico+parse+semântica x carga do programa do cache de AST")
+    parser.add_argument("--lines", type=int, nargs="+", default=[5000, 20000, 100000])
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    ast_cache.CACHE_DIR = os.path.join(workdir, "ast")
+    print(f"{'linhas':>8} {'ANTLR':>8} {'regex+RD':>9} {'chave':>8} {'cache':>8} {'ganho':>13} {'entrada':>10}")
+    for n_lines in args.lines:
+        path = os.path.join(workdir, f"p{n_lines}.pog")
+        with open(path, "w") as f:
+            f.write(generate_program(n_lines))
+
+        start = time.perf_counter()
+        front_end(path, "antlr")
+        antlr_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        program, symbol_table = front_end(path, "rd")
+        rd_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        key = ast_cache.source_key(path)
+        key_seconds = time.perf_counter() - start
+        assert ast_cache.save(key, program, symbol_table)
+
+        start = time.perf_counter()
+        cached_program, cached_table = ast_cache.load(key)
+        load_seconds = time.perf_counter() - start
+
+        assert tac_of(program, symbol_table) == tac_of(cached_program, cached_table)
+        size = os.path.getsize(ast_cache.entry_path(key))
+        total = key_seconds + load_seconds
+        gain = f"{antlr_seconds / total:.0f}x/{rd_seconds / total:.1f}x"
+        print(f"{n_lines:8} {antlr_seconds:7.2f}s {rd_seconds:8.2f}s {key_seconds:7.3f}s {load_seconds:7.3f}s "
+              f"{gain:>13} {size / 1e6:7.2f} MB")
+
+if __name__ == "__main__":
+    main()
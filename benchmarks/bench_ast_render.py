@@ -0,0 +1,75 @@
+# Geração do DOT da AST: graphviz.Digraph em memória (como antes, com o texto montado no fim
+# para o 'dot') x DotWriter escrevendo no arquivo durante a visita. Mede tempo e pico de
+# memória da geração, e quantos nós sobram no desenho com os limites de profundidade/bloco.
+# O layout do Graphviz não entra na medida; ele é proporcional aos nós desenhados.
+# Uso: python -m benchmarks.bench_ast_render [--lines 20000 100000] [--depth 2] [--block 20]
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from graphviz import Digraph
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.ast.ast_generator import ASTGenerator
+from src.ast.dot_writer import DotWriter
+from benchmarks.corpus import generate_program
+
+class DigraphGenerator(ASTGenerator):
+    # Mesmos nós e arestas, acumulados no Digraph até o fim da visita
+    def generate(self, program, path):
+        self.dot = Digraph(comment='Abstract Syntax Tree', graph_attr={'rankdir': 'TB'})
+        self.visit(program)
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write(self.dot.source)
+
+class StreamGenerator(ASTGenerator):
+    def generate(self, program, path):
+        with open(path, 'w', encoding='utf-8') as out:
+            self.dot = DotWriter(out, graph_attr={'rankdir': 'TB'})
+            self.visit(program)
+            self.dot.close()
+
+def parse(n_lines):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(generate_program(n_lines))))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def measure(generator, program, path):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    generator.generate(program, path)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, generator.node_count, os.path.getsize(path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Geração do DOT da AST: Digraph em memória x escrita incremental, com e sem limites")
+    parser.add_argument("--lines", type=int, nargs="+", default=[20000, 100000])
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--block", type=int, default=20)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "ast.dot")
+    print(f"{'linhas':>8} {'gerador':>18} {'tempo':>7} {'pico':>10} {'nós':>8} {'DOT':>9}")
+    for n_lines in args.lines:
+        program = parse(n_lines)
+        cases = [
+            ("Digraph", DigraphGenerator()),
+            ("DotWriter", StreamGenerator()),
+            (f"DotWriter d={args.depth} b={args.block}", StreamGenerator(args.depth, args.block)),
+        ]
+        for name, generator in cases:
+            seconds, peak, nodes, size = measure(generator, program, path)
+            print(f"{n_lines:8} {name:>18} {seconds:6.2f}s {peak / 1e6:7.2f} MB {nodes:8} {size / 1e6:6.2f} MB")
+    os.remove(path)
+
+if __name__ == "__main__":
+    main()
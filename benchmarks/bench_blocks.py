@@ -0,0 +1,69 @@
+# Escala do acesso aos blocos do if/while: programa com um único 'while' cujo corpo tem N
+# comandos. "block" é a conversão para a AST pelo rótulo ctx.body (sub-regra 'block' da
+# gramática); "varredura" repete o laço antigo das fases, que procurava as chaves com
+# ctx.LBRACE(0)/ctx.RBRACE(0) a cada filho e por isso era quadrático no tamanho do bloco.
+# Uso: python -m benchmarks.bench_blocks [--statements 6250 12500 25000 50000] [--scan-max 12500]
+import argparse
+import gc
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.lexer.poglinParser import poglinParser
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.ast.lowering import lower
+
+def generate_loop(n_statements):
+    body = "".join(f"        a = a + {i};\n" for i in range(n_statements))
+    return f"start {{\n    var a : Int = 0;\n    while (a < 10) {{\n{body}    }}\n}} end\n"
+
+def brace_scan(ctx):
+    # Laço das versões antigas de TACGenerator/SemanticAnalyzer/ASTGenerator. ctx.LBRACE(0)
+    # era getToken(LBRACE, 0), que percorre a lista de filhos a cada chamada.
+    statements = []
+    in_block = False
+    brace_count = 0
+    for child in ctx.children:
+        if child == ctx.getToken(poglinParser.LBRACE, 0):
+            in_block = True
+            brace_count += 1
+            continue
+        if child == ctx.getToken(poglinParser.RBRACE, 0) and brace_count == 1:
+            break
+        if in_block and isinstance(child, poglinParser.StatementContext):
+            statements.append(child)
+    return statements
+
+def main():
+    parser = argparse.ArgumentParser(description="Escala linear do acesso ao corpo de um while com até 50k comandos")
+    parser.add_argument("--statements", type=int, nargs="+", default=[6250, 12500, 25000, 50000])
+    parser.add_argument("--scan-max", type=int, default=12500, help="maior bloco medido com a varredura antiga")
+    args = parser.parse_args()
+
+    print(f"{'comandos':>9} {'parse':>8} {'block':>8} {'block/cmd':>10} {'varredura':>10}")
+    for n_statements in args.statements:
+        stream = CommonTokenStream(PoglinRegexLexer(TextStream(generate_loop(n_statements))))
+        stream.fill()
+        analyzer = PoglinParserAnalyzer(stream)
+        start = time.perf_counter()
+        if not analyzer.analyze():
+            raise SystemExit("Falha no parse do programa sintético.")
+        parse_seconds = time.perf_counter() - start
+        tree = analyzer.get_parse_tree()
+
+        gc.collect()
+        start = time.perf_counter()
+        program = lower(tree)
+        lower_seconds = time.perf_counter() - start
+        assert len(program.statements[1].body) == n_statements
+
+        scan = "-"
+        if n_statements <= args.scan_max:
+            start = time.perf_counter()
+            assert len(brace_scan(tree.statement(1).body)) == n_statements
+            scan = f"{time.perf_counter() - start:9.2f}s"
+        print(f"{n_statements:9} {parse_seconds:7.2f}s {lower_seconds:7.3f}s "
+              f"{lower_seconds / n_statements * 1e6:8.1f}µs {scan:>10}")
+
+if __name__ == "__main__":
+    main()
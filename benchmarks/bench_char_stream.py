@@ -0,0 +1,81 @@
+# Memória do stream de caracteres: FileStream (ANTLR) x MmapFileStream sobre um fonte grande.
+# Cada stream é criado num processo separado; o pico do heap Python vem do tracemalloc e
+# o pico de memória residente do processo de ru_maxrss (o mapeamento do mmap conta no RSS
+# só pelas páginas tocadas).
+# Uso: python -m benchmarks.bench_char_stream [--mb 200] [--keep]
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from antlr4 import FileStream
+from src.lexer.char_streams import MmapFileStream
+from benchmarks.corpus import BLOCK_TEMPLATE
+
+STREAMS = {
+    "FileStream": lambda path: FileStream(path, encoding="utf-8"),
+    "MmapFileStream": lambda path: MmapFileStream(path, encoding="utf-8"),
+}
+
+def write_sized_program(path, n_bytes):
+    # Escreve bloco a bloco até passar de n_bytes, sem montar o programa inteiro em memória
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("start {\n")
+        written, i = 0, 0
+        while written < n_bytes:
+            block = BLOCK_TEMPLATE.format(i=i)
+            f.write(block)
+            written += len(block)
+            i += 1
+        f.write("} end\n")
+    return path
+
+def measure(name, path, results):
+    tracemalloc.start()
+    start = time.perf_counter()
+    stream = STREAMS[name](path)
+    elapsed = time.perf_counter() - start
+    # Percorre o fonte como o lexer faria (LA/consume) numa amostra, para tocar o buffer
+    for _ in range(min(stream.size, 1 << 20)):
+        stream.LA(1)
+        stream.consume()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 # ru_maxrss em KiB no Linux
+    results[name] = (elapsed, peak, rss, stream.size)
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória do FileStream x MmapFileStream num fonte de 200 MB")
+    parser.add_argument("--mb", type=int, default=200, help="tamanho do fonte gerado em MB")
+    parser.add_argument("--keep", action="store_true", help="não apaga o arquivo gerado")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".pog")
+    os.close(fd)
+    try:
+        write_sized_program(path, args.mb * 1000 * 1000)
+        file_size = os.path.getsize(path)
+        print(f"Fonte sintético: {file_size / 1e6:.1f} MB")
+        context = multiprocessing.get_context("spawn") # processo limpo para cada medição
+        with context.Manager() as manager:
+            results = manager.dict()
+            for name in STREAMS:
+                process = context.Process(target=measure, args=(name, path, results))
+                process.start()
+                process.join()
+                if name not in results:
+                    print(f"  {name:15} falhou (código de saída {process.exitcode})")
+                    continue
+                elapsed, peak, rss, size = results[name]
+                print(f"  {name:15} {elapsed:6.2f}s  heap pico {peak / 1e6:8.1f} MB "
+                      f"({peak / size:5.2f} B/caractere)  RSS pico {rss / 1e6:8.1f} MB")
+    finally:
+        if args.keep:
+            print(f"Arquivo mantido em {path}")
+        else:
+            os.remove(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Latência do --check (só diagnósticos, em JSON) x compilação padrão, em processos novos, para
+# cada tests/*.pog e para um programa sintético grande. A compilação e o --check rodam sem o
+# cache de AST (--no-ast-cache); "rd" é o --check com --regex-lexer --rd-parser e "cache" é o
+# --check padrão com o fonte já no cache de AST (o caso de um editor ou hook que verifica de
+# novo um arquivo inalterado). Confere também, com -X importtime, que o --check não carrega
+# llvmlite nem graphviz.
+# Uso: python -m benchmarks.bench_check [--lines 50000] [--runs 5]
+import argparse
+import glob
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.corpus import generate_program
+
+def run(cmd, env):
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return time.perf_counter() - start, result.stderr
+
+def heavy_imports(path, env):
+    _, stderr = run([sys.executable, "-X", "importtime", "main.py", path, "--check", "--no-ast-cache"], env)
+    modules = {line.rsplit("|", 1)[-1].strip().split(".")[0] for line in stderr.splitlines() if line.startswith("import time:")}
+    return sorted(modules & {"llvmlite", "graphviz"})
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência do --check x compilação em tests/*.pog e num programa de 50k linhas")
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, POGLIN_CACHE_DIR=cache_dir)
+        big = os.path.join(cache_dir, f"corpus_{args.lines}.pog")
+        with open(big, "w") as f:
+            f.write(generate_program(args.lines))
+        files = sorted(glob.glob(os.path.join("tests", "*.pog"))) + [big]
+        run([sys.executable, "main.py", files[0]], env) # Preenche o cache de ATN/DFA
+
+        print(f"mediana de {args.runs} processos")
+        print(f"{'arquivo':<24} {'compilação':>12} {'--check':>10} {'rd':>10} {'cache':>10}")
+        for path in files:
+            name = os.path.basename(path)
+            timings = []
+            for flags in (["--no-ast-cache"], ["--check", "--no-ast-cache"], ["--check", "--no-ast-cache", "--regex-lexer", "--rd-parser"], ["--check"]):
+                cmd = [sys.executable, "main.py", path] + flags
+                run(cmd, env) # Aquece o cache do sistema de arquivos (e, sem --no-ast-cache, o de AST)
+                timings.append(statistics.median(run(cmd, env)[0] for _ in range(args.runs)))
+            full, check, rd, cached = (seconds * 1e3 for seconds in timings)
+            print(f"{name:<24} {full:9.1f} ms {check:7.1f} ms {rd:7.1f} ms {cached:7.1f} ms")
+        loaded = heavy_imports(files[0], env)
+        print(f"módulos pesados carregados pelo --check: {', '.join(loaded) if loaded else 'nenhum'}")
+
+if __name__ == "__main__":
+    main()
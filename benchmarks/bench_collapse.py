@@ -0,0 +1,75 @@
+# Árvore de parse do ANTLR completa x com as regras de repasse colapsadas durante o parse
+# (--collapse-tree). Mede o número de contextos, a memória retida pela árvore, o tempo de
+# parse e o de conversão para a AST. Os tokens são criados antes do tracemalloc e um parse de
+# aquecimento preenche o cache de DFA, então a memória medida é só a da árvore.
+# Uso: python -m benchmarks.bench_collapse [--lines 5000 20000]
+import argparse
+import gc
+import time
+import tracemalloc
+from antlr4 import CommonTokenStream, ParserRuleContext
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast.lowering import lower
+from benchmarks.corpus import generate_program
+
+def count_contexts(tree):
+    count, stack = 0, [tree]
+    while stack:
+        ctx = stack.pop()
+        if isinstance(ctx, ParserRuleContext):
+            count += 1
+            if ctx.children is not None:
+                stack.extend(ctx.children)
+    return count
+
+def token_stream(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    return stream
+
+def measure(text, collapse):
+    stream = token_stream(text)
+    gc.collect()
+    tracemalloc.start()
+    analyzer = PoglinParserAnalyzer(stream, collapse=collapse)
+    start = time.perf_counter()
+    if not analyzer.analyze():
+        raise SystemExit("Falha no parse do programa sintético.")
+    parse_seconds = time.perf_counter() - start
+    tree = analyzer.get_parse_tree()
+    analyzer.release()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.collect()
+    start = time.perf_counter()
+    program = lower(tree)
+    lower_seconds = time.perf_counter() - start
+    tac = TACGenerator()
+    tac.visit(program)
+    return count_contexts(tree), retained, parse_seconds, lower_seconds, [str(instr) for instr in tac.get_tac()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Contextos, memória da árvore e tempos com e sem o colapso das regras de repasse")
+    parser.add_argument("--lines", type=int, nargs="+", default=[5000, 20000])
+    args = parser.parse_args()
+
+    for collapse in (False, True):
+        measure(generate_program(200), collapse)
+    print(f"{'linhas':>8} {'árvore':>10} {'contextos':>10} {'retida':>10} {'parse':>7} {'lowering':>9}")
+    for n_lines in args.lines:
+        text = generate_program(n_lines)
+        results = {}
+        for name, collapse in (("completa", False), ("colapsada", True)):
+            contexts, retained, parse_seconds, lower_seconds, tac = measure(text, collapse)
+            results[name] = tac
+            print(f"{n_lines:8} {name:>10} {contexts:10} {retained / 1e6:7.2f} MB "
+                  f"{parse_seconds:6.2f}s {lower_seconds:8.3f}s")
+        assert results["completa"] == results["colapsada"]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# Custo de despacho por nó: accept() (double dispatch, como os contextos do ANTLR) x tabela
+# classe -> método montada no construtor. Mede:
+#   - "contagem": visitante mínimo que só percorre a AST tipada (overhead puro por nó);
+#   - "sem+TAC": SemanticAnalyzer + TACGenerator sobre a AST;
+#   - "lowering": conversão da árvore de parse, com um visit por regra de repasse
+#     (expression -> logicalOr -> ... -> primary) x a tabela com as regras de repasse descidas
+#     num laço.
+# Uso: python -m benchmarks.bench_dispatch [--lines 20000] [--repeat 3]
+import argparse
+import time
+from antlr4 import CommonTokenStream, ParseTreeVisitor
+from antlr4.tree.Tree import TerminalNode
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.lexer.poglinParser import poglinParser
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast.lowering import ParseTreeLowering
+from src.ast.nodes import NodeVisitor, BinaryExpr, UnaryExpr, IntLiteral, StringLiteral, Name
+from benchmarks.corpus import generate_program
+
+class Counter(NodeVisitor):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def visit_all(self, nodes):
+        for node in nodes:
+            self.visit(node)
+
+    def visitProgram(self, node):
+        self.count += 1
+        self.visit_all(node.statements)
+
+    def visitVarDecl(self, node):
+        self.count += 1
+        self.visit(node.value)
+
+    visitAssign = visitVarDecl
+    visitPrint = visitVarDecl
+
+    def visitIf(self, node):
+        self.count += 1
+        self.visit(node.condition)
+        self.visit_all(node.then_body)
+        if node.else_body is not None:
+            self.visit_all(node.else_body)
+
+    def visitWhile(self, node):
+        self.count += 1
+        self.visit(node.condition)
+        self.visit_all(node.body)
+
+    def visitBinaryExpr(self, node):
+        self.count += 1
+        self.visit_all(node.operands)
+
+    def visitUnaryExpr(self, node):
+        self.count += 1
+        self.visit(node.operand)
+
+    def visitLeaf(self, node):
+        self.count += 1
+
+    visitRead = visitPog = visitIntLiteral = visitStringLiteral = visitName = visitLeaf
+
+def accept_visit(self, node):
+    # Despacho de antes: accept() do nó e getattr pelo nome do método
+    return node.accept(self)
+
+class AcceptCounter(Counter):
+    visit = accept_visit
+
+class AcceptSemanticAnalyzer(SemanticAnalyzer):
+    visit = accept_visit
+
+class AcceptTACGenerator(TACGenerator):
+    visit = accept_visit
+
+class AcceptLowering(ParseTreeLowering):
+    # Conversão de antes: accept() dos contextos gerados e um visit por regra de repasse
+    visit = ParseTreeVisitor.visit
+
+    def lower_expression(self, ctx):
+        return self.visit(ctx)
+
+    def visitExpression(self, ctx):
+        return self.visit(ctx.getChild(0))
+
+    def lower_chain(self, ctx):
+        children = ctx.children
+        if len(children) == 1:
+            return self.visit(children[0])
+        ops, positions, operands = [], [], [self.visit(children[0])]
+        for index in range(1, len(children), 2):
+            op = children[index].symbol
+            ops.append(op.text)
+            positions.append((op.line, op.column))
+            operands.append(self.visit(children[index + 1]))
+        return BinaryExpr(ops, positions, operands)
+
+    visitLogicalOrExpression = visitLogicalAndExpression = visitEqualityExpression = lower_chain
+    visitRelationalExpression = visitAdditiveExpression = visitMultiplicativeExpression = lower_chain
+
+    def visitUnaryExpression(self, ctx):
+        if ctx.NOT() is not None:
+            op = ctx.NOT().symbol
+            return UnaryExpr(op.text, self.visit(ctx.unaryExpression()), op.line, op.column)
+        return self.visit(ctx.primary())
+
+    def visitPrimary(self, ctx):
+        first = ctx.getChild(0)
+        if not isinstance(first, TerminalNode):
+            return None
+        token = first.symbol
+        if token.type == poglinParser.INT:
+            return IntLiteral(int(token.text), token.line, token.column)
+        if token.type == poglinParser.STRING:
+            return StringLiteral(token.text, token.line, token.column)
+        if token.type == poglinParser.ID:
+            return Name(token.text, token.line, token.column)
+        return self.visit(ctx.expression())
+
+def best_of(repeat, run):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def semantic_and_tac(semantic_class, tac_class, program):
+    def run():
+        semantic = semantic_class()
+        semantic.visit(program)
+        tac_class().visit(program)
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo por nó do accept() x tabela de despacho (visitas, fases e lowering)")
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(generate_program(args.lines))))
+    stream.fill()
+    analyzer = PoglinParserAnalyzer(stream)
+    if not analyzer.analyze():
+        raise SystemExit("Falha no parse do programa sintético.")
+    tree = analyzer.get_parse_tree()
+    program = ParseTreeLowering().visit(tree)
+    counter = Counter()
+    counter.visit(program)
+    nodes = counter.count
+
+    cases = [
+        ("contagem", lambda: AcceptCounter().visit(program), lambda: Counter().visit(program)),
+        ("sem+TAC", semantic_and_tac(AcceptSemanticAnalyzer, AcceptTACGenerator, program),
+                    semantic_and_tac(SemanticAnalyzer, TACGenerator, program)),
+        ("lowering", lambda: AcceptLowering().visit(tree), lambda: ParseTreeLowering().visit(tree)),
+    ]
+    print(f"{nodes} nós na AST ({args.lines} linhas)")
+    print(f"{'medida':<10} {'accept':>10} {'tabela':>10} {'ns/nó (acc/tab)':>17} {'ganho':>6}")
+    for name, before, after in cases:
+        before_seconds = best_of(args.repeat, before)
+        after_seconds = best_of(args.repeat, after)
+        per_node = f"{before_seconds / nodes * 1e9:.0f}/{after_seconds / nodes * 1e9:.0f}"
+        print(f"{name:<10} {before_seconds:9.3f}s {after_seconds:9.3f}s {per_node:>17} {before_seconds / after_seconds:5.2f}x")
+
+if __name__ == "__main__":
+    main()
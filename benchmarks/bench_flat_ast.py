@@ -0,0 +1,75 @@
+# Memória retida e tempo das fases sobre a AST tipada (um objeto por nó) x FlatAST (arrays
+# paralelos). O parse é feito pelo parser descendente recursivo; os tokens são criados antes
+# do tracemalloc, então a memória medida é só a da AST montada (nós, constantes e posições).
+# Uso: python -m benchmarks.bench_flat_ast [--lines 20000 100000]
+import argparse
+import gc
+import time
+import tracemalloc
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast.nodes import Node
+from benchmarks.corpus import generate_program
+
+def count_nodes(node):
+    # Nós da AST tipada (listas de comandos e de operandos incluídas)
+    count, stack = 0, [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, Node):
+            count += 1
+            for slot in ('statements', 'value', 'condition', 'then_body', 'else_body', 'body', 'operands', 'operand'):
+                child = getattr(item, slot, None)
+                if isinstance(child, (list, Node)):
+                    stack.append(child)
+    return count
+
+def measure(text, flat):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    gc.collect()
+    tracemalloc.start()
+    analyzer = PoglinRDParserAnalyzer(stream, flat=flat)
+    start = time.perf_counter()
+    if not analyzer.analyze():
+        raise SystemExit("Falha no parse do programa sintético.")
+    parse_seconds = time.perf_counter() - start
+    analyzer.release()
+    del stream
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    program = analyzer.get_ast()
+    nodes = len(analyzer.get_flat_ast()) if flat else count_nodes(program)
+    start = time.perf_counter()
+    semantic = SemanticAnalyzer()
+    semantic.visit(program)
+    tac = TACGenerator()
+    tac.set_symbol_table(semantic.symbol_table)
+    tac.visit(program)
+    phases_seconds = time.perf_counter() - start
+    return nodes, retained, parse_seconds, phases_seconds, analyzer.get_flat_ast()
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória e tempo das fases com a AST tipada x FlatAST")
+    parser.add_argument("--lines", type=int, nargs="+", default=[20000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'linhas':>8} {'AST':>6} {'nós':>9} {'retida':>10} {'bytes/nó':>9} {'arrays/nó':>10} {'parse':>7} {'sem+TAC':>8}")
+    for n_lines in args.lines:
+        text = generate_program(n_lines)
+        for name, flat in (("tipada", False), ("flat", True)):
+            nodes, retained, parse_seconds, phases_seconds, flat_ast = measure(text, flat)
+            per_node = f"{flat_ast.node_bytes() / nodes:.1f}" if flat_ast else "-"
+            print(f"{n_lines:8} {name:>6} {nodes:9} {retained / 1e6:7.2f} MB {retained / nodes:9.1f} {per_node:>10} "
+                  f"{parse_seconds:6.2f}s {phases_seconds:7.2f}s")
+
+if __name__ == "__main__":
+    main()
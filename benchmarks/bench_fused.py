@@ -0,0 +1,74 @@
+# Semântica + TAC em duas visitas (SemanticAnalyzer e depois TACGenerator) x uma passada só
+# (FusedGenerator, --fused), com visita recursiva e com pilha explícita. Confere que o TAC
+# (texto e ids dos símbolos dos operandos) é o mesmo nas duas formas. Cada medida roda com o
+# TAC das anteriores já liberado: objetos vivos a mais encarecem as coletas do gc e distorcem
+# a comparação.
+# Uso: python -m benchmarks.bench_fused [--lines 100000] [--repeat 3]
+import argparse
+import gc
+import hashlib
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.intermediario.fused_generator import FusedGenerator
+from benchmarks.corpus import generate_program
+
+def parse(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def run(visitor, program, iterative):
+    return visitor.walk(program) if iterative else visitor.visit(program)
+
+def two_passes(program, iterative):
+    semantic = SemanticAnalyzer()
+    assert run(semantic, program, iterative)
+    tac = TACGenerator()
+    tac.set_symbol_table(semantic.symbol_table)
+    run(tac, program, iterative)
+    return tac.get_tac()
+
+def fused(program, iterative):
+    generator = FusedGenerator()
+    assert run(generator, program, iterative)
+    return generator.get_tac()
+
+def timed(phases, program, iterative):
+    # (segundos, número de instruções, resumo do TAC)
+    gc.collect()
+    start = time.perf_counter()
+    instructions = phases(program, iterative)
+    seconds = time.perf_counter() - start
+    return seconds, len(instructions), digest(instructions)
+
+def digest(instructions):
+    summary = hashlib.sha256()
+    for instr in instructions:
+        ids = [getattr(operand, 'symbol_id', None) for operand in (instr.dest, instr.src1, instr.src2)]
+        summary.update(f"{instr} {ids}\n".encode())
+    return summary.hexdigest()
+
+def main():
+    parser = argparse.ArgumentParser(description="Semântica e TAC em duas visitas x numa passada só (--fused), com TAC idêntico")
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    program = parse(generate_program(args.lines))
+    print(f"{'visita':<12} {'duas passadas':>14} {'fundida':>10} {'razão':>7} {'instruções TAC':>15}")
+    for name, iterative in (("recursiva", False), ("iterativa", True)):
+        separate, count, expected = min(timed(two_passes, program, iterative) for _ in range(args.repeat))
+        single, _, summary = min(timed(fused, program, iterative) for _ in range(args.repeat))
+        assert summary == expected
+        print(f"{name:<12} {separate:12.3f} s {single:8.3f} s {single / separate:7.2f} {count:>15}")
+    print("TAC idêntico nas duas formas")
+
+if __name__ == "__main__":
+    main()
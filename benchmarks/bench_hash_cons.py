@@ -0,0 +1,103 @@
+# Hash-consing das expressões (--hash-cons): tempo de semântica + TAC sem e com a tabela de
+# formas (o tempo de internar a AST entra na conta), visitas evitadas, instruções TAC e a
+# memória a mais da tabela (os nós não são compartilhados). "repetido" repete as condições do tests/classify_triangle.pog em cada bloco;
+# "corpus" é o programa sintético dos outros benchmarks, com pouca repetição. Antes das medidas,
+# confere que no SHADOWED a String x, que sombreia a Int x, recebe uma temporária calculada a
+# partir dela mesma, e não o x + 1 da Int reaproveitado, nas duas visitas.
+# Uso: python -m benchmarks.bench_hash_cons [--lines 20000] [--repeat 3]
+import argparse
+import gc
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast.hash_cons import ExpressionTable
+from benchmarks.corpus import generate_program
+
+REPEATED_BLOCK = """    var a{i} : Int = {i};
+    var b{i} : Int = a{i} + 1;
+    var c{i} : Int = a{i} + b{i};
+    if (a{i} + b{i} > c{i} && a{i} + c{i} > b{i} && b{i} + c{i} > a{i}) {{
+        println(a{i} + b{i} + c{i});
+    }} else {{
+        println(a{i} + b{i} + c{i});
+    }}
+    println(a{i} + b{i} > c{i} && a{i} + c{i} > b{i});
+    println(a{i} + b{i} + c{i});
+    a{i} = a{i} + b{i} + c{i};
+    println(a{i} + b{i} + c{i});
+"""
+
+SHADOWED = """start {
+var x : Int = 5;
+if (x > 1) { println(x + 1); var x : String = x + 1; println(x); }
+} end"""
+
+def generate_repeated(n_lines):
+    blocks = max(1, n_lines // REPEATED_BLOCK.count("\n"))
+    return "start {\n" + "".join(REPEATED_BLOCK.format(i=i) for i in range(blocks)) + "} end\n"
+
+def parse(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def run(program, hash_cons):
+    gc.collect()
+    start = time.perf_counter()
+    expressions = ExpressionTable().intern_program(program) if hash_cons else None
+    semantic = SemanticAnalyzer(expressions)
+    assert semantic.visit(program)
+    tac = TACGenerator(expressions)
+    tac.set_symbol_table(semantic.symbol_table)
+    tac.visit(program)
+    seconds = time.perf_counter() - start
+    return seconds, expressions, semantic, tac
+
+def check_shadowed():
+    program = parse(SHADOWED)
+    for iterative in (False, True):
+        expressions = ExpressionTable().intern_program(program)
+        semantic = SemanticAnalyzer(expressions)
+        assert semantic.walk(program) if iterative else semantic.visit(program)
+        tac = TACGenerator(expressions)
+        tac.set_symbol_table(semantic.symbol_table)
+        tac.walk(program) if iterative else tac.visit(program)
+        instructions = tac.get_tac()
+        definitions = {} # temporária -> instrução que a calcula (a primeira que a tem em dest)
+        for instr in instructions:
+            if instr.dest is not None and instr.dest.is_temp:
+                definitions.setdefault(instr.dest.value, instr)
+        assign = [instr for instr in instructions if instr.opcode == "ASSIGN" and instr.dest.value == "x"][-1]
+        value = definitions[assign.src1.value]
+        assert value.src1.symbol_id == assign.dest.symbol_id, "temporária da x sombreada reaproveitada pelo --hash-cons"
+    print("declaração que sombreia a variável lida no inicializador: temporária recalculada")
+
+def main():
+    parser = argparse.ArgumentParser(description="Semântica+TAC com e sem hash-consing: visitas evitadas, instruções TAC e memória da tabela")
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    check_shadowed()
+
+    print(f"{'programa':<10} {'sem.':>7} {'com':>7} {'formas/nós':>14} {'repetidos':>10} {'tabela':>9} "
+          f"{'visitas evit. (sem/TAC)':>24} {'TAC (sem/com)':>15}")
+    for name, text in (("repetido", generate_repeated(args.lines)), ("corpus", generate_program(args.lines))):
+        program = parse(text)
+        plain = min(run(program, False)[0] for _ in range(args.repeat))
+        shared, expressions, semantic, tac = min((run(program, True) for _ in range(args.repeat)), key=lambda result: result[0])
+        plain_tac = len(run(program, False)[3].get_tac())
+        nodes, repeated = expressions.repetition_report()
+        shapes = f"{len(expressions)}/{nodes}"
+        avoided = f"{semantic.visits_avoided}/{tac.visits_avoided}"
+        instructions = f"{plain_tac}/{len(tac.get_tac())}"
+        print(f"{name:<10} {plain:6.2f}s {shared:6.2f}s {shapes:>14} {repeated:>10} {expressions.table_bytes() / 1e6:6.1f} MB "
+              f"{avoided:>24} {instructions:>15}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Análise incremental (src/parser/incremental.py): latência de edições no meio de um programa
+# grande x refazer léxico e parse do arquivo inteiro. Cada cenário é digitado caractere a
+# caractere (estados intermediários com erro incluídos); no fim, a AST do documento é
+# comparada com a de uma análise completa do texto final.
+# Uso: python -m benchmarks.bench_incremental [--lines 50000]
+import argparse
+import statistics
+import time
+from src.parser.incremental import IncrementalDocument
+from src.ast.ast_cache import encode
+from benchmarks.corpus import generate_program, BLOCK_LINES
+
+def type_text(document, position, text):
+    # Digita text a partir de position; retorna o tempo de cada edit()
+    times = []
+    for offset, char in enumerate(text):
+        start = time.perf_counter()
+        document.edit(position + offset, position + offset, char)
+        times.append(time.perf_counter() - start)
+    return times
+
+def timed(call):
+    start = time.perf_counter()
+    call()
+    return [time.perf_counter() - start]
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência de edições num programa de 50k linhas x análise completa")
+    parser.add_argument("--lines", type=int, default=50000)
+    args = parser.parse_args()
+
+    text = generate_program(args.lines)
+    start = time.perf_counter()
+    document = IncrementalDocument(text)
+    full_seconds = time.perf_counter() - start
+    assert document.program() is not None
+    middle = args.lines // BLOCK_LINES // 2
+    # Início da linha "a{i} = a{i} + 1 * 2 - (a{i} / 3);" do bloco do meio
+    line = 1 + middle * BLOCK_LINES + 4
+    statement = document.offset(line, 4)
+    digit = statement + document.text[statement:].index("1 * 2")
+
+    cases = [
+        ("trocar um dígito", lambda: timed(lambda: document.edit(digit, digit + 1, "7"))),
+        ("comando novo na linha", lambda: type_text(document, document.offset(line, 0), "    println(a0 + 1);\n")),
+        ("apagar um caractere", lambda: timed(lambda: document.edit(digit + 1, digit + 2, ""))),
+        ("abrir um bloco", lambda: type_text(document, document.offset(line, 0), "    while (a0 < 3) {\n")),
+        ("fechar o bloco", lambda: type_text(document, document.offset(line + 2, 0), "    }\n")),
+        ("program() depois", lambda: timed(document.program)),
+    ]
+    print(f"{args.lines} linhas: análise completa {full_seconds * 1000:.0f} ms")
+    print(f"{'edição':<24} {'edições':>8} {'mediana':>10} {'máximo':>10}")
+    for name, run in cases:
+        times = run()
+        print(f"{name:<24} {len(times):8} {statistics.median(times) * 1000:7.2f} ms {max(times) * 1000:7.2f} ms")
+
+    final = IncrementalDocument(document.text)
+    assert not document.errors and encode(document.program()) == encode(final.program())
+    print("AST incremental igual à da análise completa do texto final")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Análise de intervalos (--intervals, src/semantic/interval_analysis.py): tempo da análise no
+# programa sintético em tamanhos crescentes (deve crescer linearmente), desvios decididos e
+# instruções TAC sem e com os blocos mortos removidos. "escada if" é a escada if/else de D
+# níveis do bench_traversal, analisada com a pilha explícita (walk); "laços aninhados" tem D
+# whiles um dentro do outro, o pior caso do ponto fixo. Antes das medidas, confere que o
+# println de INNER_WRITE (x só vira 1 na 2ª volta do laço interno, então o if é vivo a partir da
+# 2ª volta do laço de fora) continua no TAC sem os blocos mortos, nas duas visitas.
+# Uso: python -m benchmarks.bench_intervals [--lines 25000 50000 100000] [--depth 100000] [--loops 8]
+import argparse
+import gc
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.semantic.interval_analysis import IntervalAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from benchmarks.corpus import generate_program
+from benchmarks.bench_traversal import if_ladder
+
+def parse(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def nested_loops(depth):
+    # Cada nível declara o seu contador, repete 3 vezes e acumula em total
+    lines = ["start {", "var total : Int = 0;"]
+    for level in range(depth):
+        lines.append(f"var i{level} : Int = 0;")
+        lines.append(f"while (i{level} < 3) {{")
+    lines.append("total = total + 1;")
+    for level in reversed(range(depth)):
+        lines.append(f"i{level} = i{level} + 1;")
+        lines.append("}")
+    lines.append("println(total);")
+    lines.append("} end")
+    return "\n".join(lines)
+
+INNER_WRITE = """start {
+var x : Int = 0;
+var i : Int = 0;
+while (i < 3) {
+    if (x == 1) { println("x is one"); }
+    var k : Int = 0;
+    while (k < 2) {
+        if (k > 0) { x = 1; }
+        k = k + 1;
+    }
+    i = i + 1;
+}
+} end"""
+
+def pruned_tac(program, symbol_table, dead, iterative):
+    tac = TACGenerator(None, dead)
+    tac.set_symbol_table(symbol_table)
+    tac.walk(program) if iterative else tac.visit(program)
+    return tac.get_tac()
+
+def tac_size(program, symbol_table, dead, iterative):
+    return len(pruned_tac(program, symbol_table, dead, iterative))
+
+def check_inner_write():
+    program = parse(INNER_WRITE)
+    for iterative in (False, True):
+        semantic = SemanticAnalyzer()
+        assert semantic.walk(program) if iterative else semantic.visit(program)
+        analyzer = IntervalAnalyzer(semantic.symbol_table)
+        assert analyzer.walk(program) if iterative else analyzer.visit(program)
+        tac = pruned_tac(program, semantic.symbol_table, analyzer.dead, iterative)
+        assert any(instr.opcode == "PRINT" for instr in tac), "println vivo removido pelo --intervals"
+    print("laço interno que só atribui em voltas seguintes: println preservado")
+
+def measure(name, lines, program, iterative=False):
+    semantic = SemanticAnalyzer()
+    assert semantic.walk(program) if iterative else semantic.visit(program)
+    analyzer = IntervalAnalyzer(semantic.symbol_table)
+    gc.collect()
+    start = time.perf_counter()
+    assert analyzer.walk(program) if iterative else analyzer.visit(program)
+    seconds = time.perf_counter() - start
+    plain = tac_size(program, semantic.symbol_table, None, iterative)
+    pruned = tac_size(program, semantic.symbol_table, analyzer.dead, iterative)
+    per_line = seconds / lines * 1e6
+    print(f"{name:<18} {lines:>8} {seconds:8.3f} s {per_line:8.2f} µs {len(analyzer.dead):>9} {len(analyzer.warnings):>7} {plain:>9} {pruned:>9}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo da análise de intervalos por linha, desvios decididos e TAC sem os blocos mortos")
+    parser.add_argument("--lines", type=int, nargs="+", default=[25000, 50000, 100000])
+    parser.add_argument("--depth", type=int, default=100000)
+    parser.add_argument("--loops", type=int, default=8)
+    args = parser.parse_args()
+
+    check_inner_write()
+    print(f"{'programa':<18} {'linhas':>8} {'análise':>10} {'por linha':>11} {'desvios':>9} {'avisos':>7} {'TAC':>9} {'TAC vivo':>9}")
+    for lines in args.lines:
+        measure("corpus", lines, parse(generate_program(lines)))
+    measure("escada if", args.depth, if_ladder(args.depth), iterative=True)
+    measure("laços aninhados", 4 * args.loops + 5, parse(nested_loops(args.loops)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Conformidade e vazão (tokens/s) do lexer de regex contra o lexer gerado pelo ANTLR.
+# Uso: python -m benchmarks.bench_lexer [--lines N] [--repeat R]
+import argparse
+import os
+import sys
+import tempfile
+import time
+from antlr4 import FileStream, CommonTokenStream
+from antlr4.error.ErrorListener import ErrorListener
+from src.lexer.poglinLexer import poglinLexer
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from benchmarks.corpus import test_programs, write_program
+
+# Casos de borda que os programas de tests/ não cobrem
+EDGE_CASES = [
+    'start { var startx : Int = 12abc; } end',
+    '"com \\"escape\\" e \\\n quebra escapada" x',
+    'a//comentario no fim',
+    'a / b // c\n/ d',
+    '== = != ! <= < >= > && || { } ( ) ; :',
+    'var çã : Int = 1;',
+    'x = "não terminada\n y;',
+    'a & b',
+    'a | b\n#\n"fim com barra\\',
+    '\ttab\r\nlinha  \n\n',
+]
+
+class CollectingErrorListener(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+def lex(lexer):
+    listener = CollectingErrorListener()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(listener)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    tokens = [(t.type, t.start, t.stop, t.line, t.column, t.text, t.tokenIndex) for t in stream.tokens]
+    return tokens, listener.errors
+
+def check_conformance(name, text):
+    expected = lex(poglinLexer(TextStream(text, name)))
+    actual = lex(PoglinRegexLexer(TextStream(text, name)))
+    if expected == actual:
+        return True
+    for i, (e, a) in enumerate(zip(expected[0], actual[0])):
+        if e != a:
+            print(f"  DIVERGE em {name}, token {i}: antlr={e} regex={a}")
+            break
+    else:
+        print(f"  DIVERGE em {name}: tokens {len(expected[0])} x {len(actual[0])}, erros {expected[1]} x {actual[1]}")
+    return False
+
+def run_conformance():
+    ok = True
+    for path in test_programs():
+        with open(path, encoding="utf-8") as f:
+            ok &= check_conformance(path, f.read())
+    for i, text in enumerate(EDGE_CASES):
+        ok &= check_conformance(f"<caso de borda {i}>", text)
+    return ok
+
+def throughput(make_lexer, path, repeat):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stream = CommonTokenStream(make_lexer(path))
+        stream.fill()
+        elapsed = time.perf_counter() - start
+        count = len(stream.tokens)
+        best = elapsed if best is None else min(best, elapsed)
+    return count, best
+
+def main():
+    parser = argparse.ArgumentParser(description="Conformidade com tests/*.pog + tokens/s (ANTLR x regex)")
+    parser.add_argument("--lines", type=int, default=20000, help="tamanho do programa sintético")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("Conformidade (tests/*.pog e casos de borda):")
+    if not run_conformance():
+        print("FALHOU: o lexer de regex diverge do lexer ANTLR.")
+        sys.exit(1)
+    print("  OK: mesmos tokens, posições e erros.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_program(os.path.join(tmp, "bench.pog"), args.lines)
+        backends = [
+            ("antlr", lambda p: poglinLexer(FileStream(p, encoding="utf-8"))),
+            ("regex", lambda p: PoglinRegexLexer(TextStream.from_file(p))),
+        ]
+        print(f"\nVazão em {args.lines} linhas (melhor de {args.repeat}):")
+        results = {}
+        for name, make_lexer in backends:
+            count, elapsed = throughput(make_lexer, path, args.repeat)
+            results[name] = elapsed
+            print(f"  {name:6} {count} tokens em {elapsed:.3f}s -> {count / elapsed:,.0f} tokens/s")
+        print(f"  speedup regex/antlr: {results['antlr'] / results['regex']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Memória retida antes e depois da conversão da árvore de parse para a AST tipada
+# (src/ast/lowering.py). "parse" é o que fica vivo quando as fases percorrem a árvore do ANTLR:
+# fonte, tokens e árvore de parse. "AST" é o que sobra depois de lower() e de liberar
+# lexer e parser, que é o que a compilação mantém hoje.
+# Uso: python -m benchmarks.bench_lowering [--lines 2000 8000 32000]
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from src.lexer.poglin_lexer import PoglinLexerAnalyzer
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.ast.lowering import lower
+from benchmarks.corpus import write_program
+
+def parse(path):
+    lexer_analyzer = PoglinLexerAnalyzer(path)
+    lexer_analyzer.analyze()
+    parser_analyzer = PoglinParserAnalyzer(lexer_analyzer.get_antlr_token_stream())
+    if not parser_analyzer.analyze():
+        raise SystemExit(f"Falha no parse de {path}")
+    return lexer_analyzer, parser_analyzer
+
+def measure(path):
+    parse(path) # Aquece os DFAs do ANTLR, que não devem entrar na conta
+    gc.collect()
+    tracemalloc.start()
+    lexer_analyzer, parser_analyzer = parse(path)
+    gc.collect()
+    parse_bytes, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    program = lower(parser_analyzer.get_parse_tree())
+    elapsed = time.perf_counter() - start
+    parser_analyzer.release()
+    lexer_analyzer.release()
+    gc.collect()
+    ast_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del program
+    return parse_bytes, ast_bytes, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória retida com a árvore de parse x só a AST tipada")
+    parser.add_argument("--lines", type=int, nargs="+", default=[2000, 8000, 32000])
+    args = parser.parse_args()
+
+    print(f"{'linhas':>8} {'parse':>11} {'AST':>11} {'redução':>8} {'lower()':>9}")
+    for n_lines in args.lines:
+        fd, path = tempfile.mkstemp(suffix=".pog")
+        os.close(fd)
+        try:
+            write_program(path, n_lines)
+            parse_bytes, ast_bytes, elapsed = measure(path)
+            print(f"{n_lines:8} {parse_bytes / 1e6:8.2f} MB {ast_bytes / 1e6:8.2f} MB "
+                  f"{parse_bytes / ast_bytes:7.1f}x {elapsed:8.3f}s")
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Análise léxica paralela (src/lexer/parallel_lexer.py): confere que os tokens juntados são
+# iguais aos do lexer sequencial (com pedaços pequenos, para forçar cortes em todo o fonte)
+# e mede o tempo com 1, 2, 4, ... processos até o número de núcleos.
+# Uso: python -m benchmarks.bench_parallel_lexer [--lines N] [--backend antlr|regex]
+import argparse
+import os
+import sys
+import tempfile
+import time
+from src.lexer import parallel_lexer
+from src.lexer.poglin_lexer import PoglinLexerAnalyzer
+from benchmarks.corpus import test_programs, write_program
+
+def token_tuples(path, backend, jobs=None):
+    analyzer = PoglinLexerAnalyzer(path, backend=backend, jobs=jobs)
+    if not analyzer.analyze():
+        return None
+    return [(t.type, t.text, t.line, t.column, t.start, t.stop, t.tokenIndex)
+            for t in analyzer.get_antlr_token_stream().tokens]
+
+def conformance(paths, backend):
+    min_chunk = parallel_lexer.MIN_CHUNK_SIZE
+    parallel_lexer.MIN_CHUNK_SIZE = 16
+    failures = 0
+    try:
+        for path in paths:
+            if token_tuples(path, backend) != token_tuples(path, backend, jobs=3):
+                print(f"  DIVERGE: {path}")
+                failures += 1
+    finally:
+        parallel_lexer.MIN_CHUNK_SIZE = min_chunk
+    return failures
+
+def timed(path, backend, jobs):
+    start = time.perf_counter()
+    analyzer = PoglinLexerAnalyzer(path, backend=backend, jobs=jobs)
+    analyzer.analyze()
+    return time.perf_counter() - start, len(analyzer.get_antlr_token_stream().tokens)
+
+def main():
+    parser = argparse.ArgumentParser(description="Conformidade e tempo do lexer paralelo com 1..N processos")
+    parser.add_argument("--lines", type=int, default=50000)
+    parser.add_argument("--backend", choices=PoglinLexerAnalyzer.BACKENDS, default="antlr")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".pog")
+    os.close(fd)
+    try:
+        write_program(path, args.lines)
+        print("Conformidade (sequencial x paralelo):")
+        failures = conformance(test_programs() + [path], args.backend)
+        print(f"  {'ok' if not failures else f'{failures} divergência(s)'}")
+
+        cores = os.cpu_count() or 1
+        job_counts = sorted({1, cores} | {2 ** k for k in range(1, cores.bit_length()) if 2 ** k <= cores})
+        base, tokens = timed(path, args.backend, None)
+        print(f"Lexer {args.backend}, {args.lines} linhas, {tokens} tokens, {cores} núcleo(s):")
+        print(f"  sequencial {base:7.2f}s")
+        for jobs in job_counts:
+            elapsed, _ = timed(path, args.backend, jobs)
+            print(f"  {jobs:3} proc.  {elapsed:7.2f}s  speedup {base / elapsed:4.1f}x")
+    finally:
+        os.remove(path)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Vazão do parser (linhas/s): PoglinParserAnalyzer (ANTLR) x parser descendente recursivo.
+# Os tokens vêm do lexer de regex para medir só a fase sintática.
+# Uso: python -m benchmarks.bench_parser [--lines N] [--skip-antlr]
+import argparse
+import sys
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.poglin_parser import PoglinParserAnalyzer
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from benchmarks.corpus import generate_program
+
+def token_stream(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    return stream
+
+def timed_parse(make_analyzer, text):
+    stream = token_stream(text)
+    analyzer = make_analyzer(stream)
+    start = time.perf_counter()
+    ok = analyzer.analyze()
+    elapsed = time.perf_counter() - start
+    if not ok:
+        print("Falha no parse do programa sintético.")
+        sys.exit(1)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Linhas/s do parser ANTLR x descendente recursivo")
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--skip-antlr", action="store_true", help="mede só o parser descendente recursivo")
+    args = parser.parse_args()
+
+    text = generate_program(args.lines)
+    lines = text.count("\n")
+    backends = [("rd", PoglinRDParserAnalyzer)]
+    if not args.skip_antlr:
+        backends.insert(0, ("antlr", PoglinParserAnalyzer))
+
+    print(f"Parse de {lines} linhas:")
+    results = {}
+    for name, make_analyzer in backends:
+        elapsed = timed_parse(make_analyzer, text)
+        results[name] = elapsed
+        print(f"  {name:6} {elapsed:.3f}s -> {lines / elapsed:,.0f} linhas/s")
+    if "antlr" in results:
+        print(f"  speedup rd/antlr: {results['antlr'] / results['rd']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Tempo de uma compilação "fria" (processo novo) com e sem o cache de ATN/DFA
+# (src/parser/atn_cache.py). Mede o processo inteiro (python main.py) e, à parte, só as
+# fases léxica e sintática, que são as que dependem do estado de predição.
+# Uso: python -m benchmarks.bench_startup [--file tests/hello.pog] [--runs 15]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PHASES_SNIPPET = """
+import sys, time
+from src.parser import atn_cache
+if sys.argv[2] == "cache":
+    atn_cache.load()
+from src.lexer.poglin_lexer import PoglinLexerAnalyzer
+from src.parser.poglin_parser import PoglinParserAnalyzer
+start = time.perf_counter()
+lexer = PoglinLexerAnalyzer(sys.argv[1])
+lexer.analyze()
+PoglinParserAnalyzer(lexer.get_antlr_token_stream()).analyze()
+print(time.perf_counter() - start)
+"""
+
+def run(cmd, env):
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    return time.perf_counter() - start, result.stdout
+
+def main():
+    parser = argparse.ArgumentParser(description="Compilação a frio de tests/hello.pog com e sem o cache de ATN/DFA")
+    parser.add_argument("--file", default=os.path.join("tests", "hello.pog"))
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, POGLIN_CACHE_DIR=cache_dir)
+        run([sys.executable, "main.py", args.file], env) # Preenche o cache
+
+        modes = (("sem cache", ["--no-atn-cache"], "none"), ("com cache", [], "cache"))
+        print(f"{args.file}, mediana de {args.runs} processos:")
+        for name, flags, phase_mode in modes:
+            total = [run([sys.executable, "main.py", args.file] + flags, env)[0] for _ in range(args.runs)]
+            phases = [float(run([sys.executable, "-c", PHASES_SNIPPET, args.file, phase_mode], env)[1])
+                      for _ in range(args.runs)]
+            print(f"  {name}: processo {statistics.median(total) * 1e3:7.1f} ms   "
+                  f"léxico+sintático {statistics.median(phases) * 1e3:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
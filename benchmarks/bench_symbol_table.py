@@ -0,0 +1,94 @@
+# Tabela de símbolos: lista de dicts percorrida do escopo interno para o externo a cada
+# consulta (como antes) x ids estáveis com pilha de sombreamento por nome. Mede declarar,
+# consultar nomes do escopo global a partir de blocos aninhados e sair dos escopos, e o
+# tempo da análise semântica + TAC de um programa com blocos aninhados.
+# Uso: python -m benchmarks.bench_symbol_table [--depth 1 8 32] [--lookups 200000]
+import argparse
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.symbol_table import SymbolTable
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+
+class ScopeChain:
+    # Mesmas operações da tabela anterior: um dict por escopo
+    def __init__(self):
+        self.scopes = [{}]
+
+    def enter_scope(self):
+        self.scopes.append({})
+
+    def exit_scope(self):
+        self.scopes.pop()
+
+    def declare(self, name, var_type, line=None):
+        self.scopes[-1][name] = var_type
+
+    def get_type(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+def exercise(table, depth, lookups):
+    names = [f"v{i}" for i in range(64)]
+    start = time.perf_counter()
+    for name in names:
+        table.declare(name, 'Int')
+    for level in range(depth):
+        table.enter_scope()
+        table.declare(f"local{level}", 'String')
+    get_type = table.get_type
+    for i in range(lookups):
+        get_type(names[i & 63])
+    for level in range(depth):
+        table.exit_scope()
+    return time.perf_counter() - start
+
+def nested_program(depth, blocks):
+    lines = ["start {", "    var total : Int = 0;"]
+    for b in range(blocks):
+        for level in range(depth):
+            lines.append("    " * (level + 1) + f"if (total < {b + level}) {{")
+            lines.append("    " * (level + 2) + f"var x{level} : Int = total + {level};")
+        lines.append("    " * (depth + 1) + "total = total + 1;")
+        for level in range(depth - 1, -1, -1):
+            lines.append("    " * (level + 1) + "}")
+    lines.append("} end")
+    return "\n".join(lines) + "\n"
+
+def compile_time(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    program = analyzer.get_ast()
+    start = time.perf_counter()
+    semantic = SemanticAnalyzer()
+    assert semantic.visit(program)
+    tac = TACGenerator()
+    tac.set_symbol_table(semantic.symbol_table)
+    tac.visit(program)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas de nomes: lista de dicts por escopo x ids com pilha de sombreamento")
+    parser.add_argument("--depth", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--lookups", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"{'profundidade':>12} {'dicts':>9} {'ids':>9} {'ganho':>7}")
+    for depth in args.depth:
+        chain = min(exercise(ScopeChain(), depth, args.lookups) for _ in range(3))
+        table = min(exercise(SymbolTable(), depth, args.lookups) for _ in range(3))
+        print(f"{depth:12} {chain * 1000:6.1f} ms {table * 1000:6.1f} ms {chain / table:6.1f}x")
+
+    for depth in args.depth:
+        seconds = compile_time(nested_program(depth, 20000 // depth))
+        print(f"semântica + TAC, blocos aninhados em {depth:2}: {seconds:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Pico de memória do pipeline léxico+sintático: CommonTokenStream.fill() x UnbufferedTokenStream.
+# O fonte é lido com MmapFileStream e o parser do ANTLR roda com buildParseTrees=False, para
+# que só o stream de tokens retenha tokens. Com o fill() o pico cresce com o programa; com
+# a janela deslizante ele fica praticamente constante.
+# Uso: python -m benchmarks.bench_token_stream [--lines 2000 8000 32000]
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from antlr4 import CommonTokenStream
+from antlr4.atn.PredictionMode import PredictionMode
+from src.lexer.char_streams import MmapFileStream
+from src.lexer.poglinLexer import poglinLexer
+from src.lexer.token_streams import UnbufferedTokenStream
+from src.lexer.poglinParser import poglinParser
+from src.parser.poglin_parser import CustomErrorListener
+from benchmarks.corpus import write_program
+
+def filled_stream(lexer):
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    return stream
+
+STREAMS = {
+    "fill": filled_stream,
+    "stream": UnbufferedTokenStream,
+}
+
+def measure(path, make_stream):
+    input_stream = MmapFileStream(path, encoding="utf-8")
+    tracemalloc.start()
+    start = time.perf_counter()
+    parser = poglinParser(make_stream(poglinLexer(input_stream)))
+    parser.buildParseTrees = False
+    parser.removeErrorListeners()
+    parser.addErrorListener(CustomErrorListener())
+    parser._interp.predictionMode = PredictionMode.LL # sem o 2º estágio, que precisa de seek(0)
+    parser.program()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    input_stream.close()
+    return elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Pico de memória do fill() x janela deslizante de tokens (parser sem árvore de parse)")
+    parser.add_argument("--lines", type=int, nargs="+", default=[2000, 8000, 32000])
+    args = parser.parse_args()
+
+    print(f"{'linhas':>8} {'modo':>7} {'tempo':>8} {'heap pico':>12}")
+    for n_lines in args.lines:
+        fd, path = tempfile.mkstemp(suffix=".pog")
+        os.close(fd)
+        try:
+            write_program(path, n_lines)
+            for name, make_stream in STREAMS.items():
+                elapsed, peak = measure(path, make_stream)
+                print(f"{n_lines:8} {name:>7} {elapsed:7.2f}s {peak / 1e6:9.2f} MB")
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    main()
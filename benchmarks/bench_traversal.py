@@ -0,0 +1,76 @@
+# Visita recursiva (visit) x pilha explícita (walk) nas fases semântica, TAC e AST.
+# Os programas profundos são montados direto como AST tipada, porque os parsers ainda são
+# recursivos: "if" é uma escada if/else com D níveis e "parênteses" é 1 + (1 + (... + 1)).
+# As condições são literais para a busca na tabela de símbolos não pesar na medida.
+# "largo" é o programa sintético do corpus, raso, para comparar o custo por nó.
+# Uso: python -m benchmarks.bench_traversal [--depths 200 100000] [--lines 20000]
+import argparse
+import time
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.intermediario.tac_generator import TACGenerator
+from src.ast.ast_generator import ASTGenerator
+from src.ast.nodes import Program, If, Pog, Print, BinaryExpr, IntLiteral
+from benchmarks.corpus import generate_program
+
+def if_ladder(depth):
+    body = [Pog(1, 1)]
+    for _ in range(depth):
+        body = [If(IntLiteral(1, 1, 1), [Pog(1, 1)], body, 1, 1)]
+    return Program(body, 1, 1)
+
+def nested_parentheses(depth):
+    expr = IntLiteral(1, 1, 1)
+    for _ in range(depth):
+        expr = BinaryExpr(['+'], [(1, 1)], [IntLiteral(1, 1, 1), expr])
+    return Program([Print(expr, 1, 1)], 1, 1)
+
+def wide(n_lines):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(generate_program(n_lines))))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def run_phases(program, iterative):
+    semantic = SemanticAnalyzer()
+    tac = TACGenerator()
+    ast = ASTGenerator()
+    start = time.perf_counter()
+    if iterative:
+        semantic.walk(program)
+        tac.walk(program)
+        ast.walk(program)
+    else:
+        semantic.visit(program)
+        tac.visit(program)
+        ast.visit(program)
+    return time.perf_counter() - start, [str(instr) for instr in tac.get_tac()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Visita recursiva x pilha explícita em programas largos e com 100k níveis")
+    parser.add_argument("--depths", type=int, nargs="+", default=[200, 100000])
+    parser.add_argument("--lines", type=int, default=20000)
+    args = parser.parse_args()
+
+    cases = [(f"largo {args.lines} linhas", wide(args.lines))]
+    for depth in args.depths:
+        cases.append((f"if {depth}", if_ladder(depth)))
+        cases.append((f"parênteses {depth}", nested_parentheses(depth)))
+
+    print(f"{'programa':<24} {'visit':>14} {'walk':>10}")
+    for name, program in cases:
+        walk_seconds, walk_tac = run_phases(program, iterative=True)
+        try:
+            visit_seconds, visit_tac = run_phases(program, iterative=False)
+            assert visit_tac == walk_tac
+            visit = f"{visit_seconds:13.3f}s"
+        except RecursionError:
+            visit = "RecursionError"
+        print(f"{name:<24} {visit:>14} {walk_seconds:9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Resultados de tipo da análise semântica: tempo da fase num programa grande (visita recursiva
+# e iterativa) e memória alocada pelos resultados. Na medição de alocações cada resultado de
+# visita fica retido numa lista (senão seria liberado logo em seguida e o tracemalloc não o
+# veria), e só contam os blocos alocados em src/semantic/semantic_analyzer.py.
+# Uso: python -m benchmarks.bench_type_info [--lines 100000] [--repeat 3]
+import argparse
+import gc
+import time
+import tracemalloc
+from antlr4 import CommonTokenStream
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.semantic import semantic_analyzer
+from src.semantic.semantic_analyzer import SemanticAnalyzer
+from benchmarks.corpus import generate_program
+
+def parse(text):
+    stream = CommonTokenStream(PoglinRegexLexer(TextStream(text)))
+    stream.fill()
+    analyzer = PoglinRDParserAnalyzer(stream)
+    analyzer.analyze()
+    return analyzer.get_ast()
+
+def timed(program, iterative):
+    gc.collect()
+    semantic = SemanticAnalyzer()
+    start = time.perf_counter()
+    assert (semantic.walk if iterative else semantic.visit)(program)
+    return time.perf_counter() - start
+
+def retaining(method, results):
+    def visit(node):
+        result = method(node)
+        results.append(result)
+        return result
+    return visit
+
+def allocations(program):
+    # (nós visitados, blocos e bytes alocados pela semântica), na visita recursiva
+    semantic = SemanticAnalyzer()
+    results = []
+    for cls, method in semantic.dispatch.items():
+        semantic.dispatch[cls] = retaining(method, results)
+    gc.collect()
+    tracemalloc.start()
+    assert semantic.visit(program)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    traces = snapshot.filter_traces([tracemalloc.Filter(True, semantic_analyzer.__file__)])
+    stats = traces.statistics('filename')
+    blocks = sum(stat.count for stat in stats)
+    size = sum(stat.size for stat in stats)
+    return len(results), blocks, size
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo da semântica em 100k linhas e memória alocada pelos resultados de tipo por nó")
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    program = parse(generate_program(args.lines))
+    recursive = min(timed(program, False) for _ in range(args.repeat))
+    iterative = min(timed(program, True) for _ in range(args.repeat))
+    nodes, blocks, size = allocations(program)
+    print(f"{args.lines} linhas, {nodes} nós visitados")
+    print(f"{'semântica (recursiva)':<26} {recursive:8.3f} s")
+    print(f"{'semântica (iterativa)':<26} {iterative:8.3f} s")
+    print(f"{'blocos alocados por nó':<26} {blocks / nodes:8.3f}")
+    print(f"{'bytes alocados por nó':<26} {size / nodes:8.1f}")
+
+if __name__ == "__main__":
+    main()
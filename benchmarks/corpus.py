@@ -0,0 +1,35 @@
+# Geração de programas Poglin sintéticos para os benchmarks.
+import os
+
+BLOCK_TEMPLATE = """    var a{i} : Int = {i};
+    var s{i} : String = "linha {i}\\t";
+    // comentario do bloco {i}
+    a{i} = a{i} + 1 * 2 - (a{i} / 3);
+    if (a{i} > 10 && a{i} != 3 || !(a{i} <= 0)) {{
+        println(s{i} + a{i});
+    }} else {{
+        s{i} = readLine();
+    }}
+    while (a{i} < 20) {{
+        a{i} = a{i} + 1;
+    }}
+    pog;
+"""
+BLOCK_LINES = BLOCK_TEMPLATE.count("\n")
+
+def generate_program(n_lines):
+    # Programa válido (léxica, sintática e semanticamente) com ~n_lines linhas
+    blocks = max(1, n_lines // BLOCK_LINES)
+    parts = ["start {\n"]
+    for i in range(blocks):
+        parts.append(BLOCK_TEMPLATE.format(i=i))
+    parts.append("} end\n")
+    return "".join(parts)
+
+def write_program(path, n_lines):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_program(n_lines))
+    return path
+
+def test_programs(tests_dir="tests"):
+    return sorted(os.path.join(tests_dir, name) for name in os.listdir(tests_dir) if name.endswith(".pog"))
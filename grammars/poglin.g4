@@ -7,8 +7,8 @@ VAR: 'var';
 IF: 'if';
 ELSE: 'else';
 WHILE: 'while';
-ESCREVA: 'escreva';
-LEIA: 'leia';
+PRINTLN: 'println';
+READLINE: 'readLine';
 POG: 'pog';
 
 INT_TYPE: 'Int';
@@ -52,16 +52,21 @@ COMMENT: '//' ~[\r\n]* -> skip ;
 
 program: START LBRACE statement* RBRACE END ;
 
+// Cada alternativa começa por um token diferente e a atribuição/leitura (ID '=' ...) está
+// fatorada à esquerda: o parser escolhe a alternativa olhando só LA(1), sem adaptivePredict.
 statement
-    : VAR ID COLON type ASSIGN expression SEMI          #varDeclaration
-    | ID ASSIGN expression SEMI                         #assignment
-    | ESCREVA LPAREN expression RPAREN SEMI             #printStatement
-    | ID ASSIGN LEIA LPAREN RPAREN SEMI                 #readStatement
-    | IF LPAREN expression RPAREN LBRACE statement* RBRACE (ELSE LBRACE statement* RBRACE)? #ifStatement
-    | WHILE LPAREN expression RPAREN LBRACE statement* RBRACE                                #whileStatement
-    | POG SEMI                                          #pogStatement
+    : VAR ID COLON type ASSIGN expression SEMI
+    | ID ASSIGN (expression | READLINE LPAREN RPAREN) SEMI
+    | PRINTLN LPAREN expression RPAREN SEMI
+    | IF LPAREN expression RPAREN thenBlock=block (ELSE elseBlock=block)?
+    | WHILE LPAREN expression RPAREN body=block
+    | POG SEMI
     ;
 
+// Os blocos do if/else/while são uma sub-regra rotulada: o contexto gerado expõe
+// ctx.thenBlock, ctx.elseBlock e ctx.body direto, sem procurar as chaves entre os filhos.
+block: LBRACE statement* RBRACE ;
+
 expression: logicalOrExpression ;
 
 logicalOrExpression
@@ -1,60 +1,167 @@
 import sys
 import os
+import io
+import re
+import json
+import contextlib
 from src.lexer.poglin_lexer import PoglinLexerAnalyzer
 from src.parser.poglin_parser import PoglinParserAnalyzer
-from src.ast.ast_generator import ASTGenerator
+from src.parser.rd_parser import PoglinRDParserAnalyzer
+from src.parser import atn_cache
+from src.ast.lowering import lower
+from src.ast import ast_cache
+from src.ast.ast_generator import ASTGenerator, AST_FORMATS
+from src.ast.hash_cons import ExpressionTable
 from src.semantic.semantic_analyzer import SemanticAnalyzer
+from src.semantic.interval_analysis import IntervalAnalyzer
 from src.intermediario.tac_generator import TACGenerator
-from src.final_code.llvm_generator import LLVMGenerator 
+from src.intermediario.fused_generator import FusedGenerator
 
-def compile_poglin(file_path, output_ast=False, output_tac=False, output_llvm=False):
-    print(f"--- Compilando arquivo: {os.path.basename(file_path)} ---")
+def parse_program(file_path, two_stage_parse, lexer_backend, parser_backend, use_mmap, streaming, lexer_jobs, use_atn_cache, parser_profile, flat_ast, collapse_tree):
+    # Análise léxica e sintática até a AST tipada; devolve None se alguma falhar
+    # ATNs e DFAs de predição salvos por execuções anteriores (ignorado se não bater com a gramática)
+    if use_atn_cache:
+        atn_cache.load()
     
     # 1. Análise Léxica: Converte o código fonte em tokens.
     print(f"\nIniciando Análise Léxica para: {file_path}")
-    lexer_analyzer = PoglinLexerAnalyzer(file_path)
+    lexer_analyzer = PoglinLexerAnalyzer(file_path, backend=lexer_backend, use_mmap=use_mmap, streaming=streaming, jobs=lexer_jobs)
     if not lexer_analyzer.analyze():
         print("\nAnálise Léxica falhou. Abortando compilação.")
-        return False
-    print("\nAnálise Léxica concluída com sucesso.")
+        return None
+    if streaming:
+        print("\nAnálise Léxica em modo streaming: os tokens são lidos sob demanda pelo parser.")
+    else:
+        print("\nAnálise Léxica concluída com sucesso.")
 
     # 2. Análise Sintática: Constrói a árvore de parse e valida a estrutura.
     print(f"\nIniciando Análise Sintática para: {file_path}")
     token_stream_for_parser = lexer_analyzer.get_antlr_token_stream()
-    parser_analyzer = PoglinParserAnalyzer(token_stream_for_parser)
-    if not parser_analyzer.analyze():
+    if parser_backend == "rd":
+        parser_analyzer = PoglinRDParserAnalyzer(token_stream_for_parser, flat=flat_ast)
+    else:
+        # O 2º estágio do parse em dois estágios rebobina o stream (seek(0)), o que a janela
+        # do modo streaming não permite: nesse modo a predição é sempre LL completa
+        parser_analyzer = PoglinParserAnalyzer(token_stream_for_parser, two_stage=two_stage_parse and not streaming, profile=parser_profile, collapse=collapse_tree)
+    parse_ok = parser_analyzer.analyze()
+    if parser_profile and parser_backend != "rd":
+        print(parser_analyzer.get_profile_report())
+    if not parse_ok:
+        if lexer_analyzer.has_lexical_errors():
+            print("\nAnálise Léxica falhou. Abortando compilação.")
+            return None
         print("\nAnálise Sintática falhou. Abortando compilação.")
-        return False
-    print("Análise Sintática concluída com sucesso.")
+        return None
+    if parser_backend == "rd":
+        # O parser descendente recursivo já entrega a AST tipada, que as fases seguintes percorrem
+        program = parser_analyzer.get_ast()
+        if flat_ast:
+            flat = parser_analyzer.get_flat_ast()
+            print(f"Análise Sintática concluída com sucesso. (parser descendente recursivo, AST achatada: {len(flat)} nós, {flat.node_bytes() / len(flat):.0f} bytes/nó)")
+        else:
+            print("Análise Sintática concluída com sucesso. (parser descendente recursivo)")
+    else:
+        # Conversão única da árvore de parse para a AST tipada
+        program = lower(parser_analyzer.get_parse_tree())
+        print(f"Análise Sintática concluída com sucesso. (predição: {parser_analyzer.get_prediction_mode()}, reparses: {parser_analyzer.get_retries()})")
+    if use_atn_cache:
+        atn_cache.save() # Só grava se os DFAs ganharam estados nesta execução
+    # Daqui em diante só a AST é usada: árvore de parse, parser, tokens e fonte são liberados
+    parser_analyzer.release()
+    lexer_analyzer.release()
+    return program
+
+def compile_poglin(file_path, output_ast=False, output_tac=False, output_llvm=False, two_stage_parse=True, lexer_backend="antlr", parser_backend="antlr", use_mmap=False, streaming=False, lexer_jobs=None, use_atn_cache=True, parser_profile=False, flat_ast=False, iterative=False, collapse_tree=False, ast_format='png', ast_engine='dot', ast_max_depth=None, ast_max_block=None, use_ast_cache=True, hash_cons=False, intervals=False, fused=False):
+    print(f"--- Compilando arquivo: {os.path.basename(file_path)} ---")
+
+    # Programa já analisado numa compilação anterior do mesmo fonte: léxico, parse e semântica
+    # são pulados (--no-ast-cache desliga; --parser-profile sempre faz o parse)
+    cache_key = None
+    cached = None
+    if use_ast_cache and not parser_profile:
+        cache_key = ast_cache.source_key(file_path)
+        cached = ast_cache.load(cache_key)
 
-    # 3. Geração da AST (Opcional): Converte a árvore de parse em uma AST e gera visualização.
+    if cached is not None:
+        program, symbol_table = cached
+        print(f"\nAnálises léxica, sintática e semântica puladas: programa carregado do cache ({cache_key[:12]}).")
+    else:
+        program = parse_program(file_path, two_stage_parse, lexer_backend, parser_backend, use_mmap, streaming, lexer_jobs, use_atn_cache, parser_profile, flat_ast, collapse_tree)
+        if program is None:
+            return False
+
+    # 3. Geração da AST (Opcional): gera a visualização da AST tipada. O DOT é escrito aqui e o
+    # layout do Graphviz roda em segundo plano; a espera fica para o fim da compilação.
+    render_job = None
     if output_ast:
         print("\nIniciando Geração da AST...")
-        ast_generator = ASTGenerator(parser_analyzer.parser)
-        parse_tree = parser_analyzer.get_parse_tree()
+        ast_generator = ASTGenerator(max_depth=ast_max_depth, max_block=ast_max_block)
         base_name = os.path.splitext(os.path.basename(file_path))[0]
         output_dir = "output"
-        ast_generator.generate_ast(parse_tree, os.path.join(output_dir, f"{base_name}_ast"))
+        render_job = ast_generator.generate_ast(program, os.path.join(output_dir, f"{base_name}_ast"), iterative=iterative, fmt=ast_format, engine=ast_engine, background=True)
     
+    # --hash-cons: formas estruturais das expressões, usadas como chave de memo na semântica e no TAC
+    expressions = None
+    if hash_cons:
+        expressions = ExpressionTable().intern_program(program)
+        nodes, repeated = expressions.repetition_report()
+        print(f"\nHash-consing: {nodes} nós de expressão, {len(expressions)} formas distintas, {repeated} nós repetidos "
+              f"(tabela de formas: {expressions.table_bytes() / 1024:.1f} KB a mais; a AST não é compartilhada)")
+
     # 4. Análise Semântica: Verifica a lógica, tipos e escopos do programa.
-    print(f"\nIniciando Análise Semântica para: {file_path}")
-    semantic_analyzer = SemanticAnalyzer()
-    parse_tree = parser_analyzer.get_parse_tree()
-    
-    if not semantic_analyzer.visit(parse_tree):
-        print("\nAnálise Semântica falhou. Erros encontrados:")
-        for error in semantic_analyzer.get_errors():
-            print(error)
-        return False
-    print("Análise Semântica concluída com sucesso. Nenhum erro encontrado.")
+    if cached is None:
+        print(f"\nIniciando Análise Semântica para: {file_path}")
+        # --fused: a mesma visita verifica os tipos e emite o TAC (descartado se houver erro)
+        semantic_analyzer = FusedGenerator() if fused else SemanticAnalyzer(expressions)
+
+        # --iterative: percorre a AST com pilha explícita (NodeVisitor.walk) em vez de recursão
+        semantic_ok = semantic_analyzer.walk(program) if iterative else semantic_analyzer.visit(program)
+        if not semantic_ok:
+            print("\nAnálise Semântica falhou. Erros encontrados:")
+            for error in semantic_analyzer.get_errors():
+                print(error)
+            wait_render(render_job)
+            return False
+        print("Análise Semântica concluída com sucesso. Nenhum erro encontrado.")
+        if hash_cons:
+            print(f"Expressões memorizadas: {semantic_analyzer.visits_avoided} visitas evitadas.")
+        symbol_table = semantic_analyzer.symbol_table
+        if cache_key is not None:
+            ast_cache.save(cache_key, program, symbol_table) # Só programas sem erros entram no cache
+
+    # --intervals: intervalos de valores das variáveis Int ao longo do fluxo (divisões por zero
+    # e blocos que nunca executam, que o TAC deixa de gerar)
+    dead_code = None
+    if intervals:
+        print(f"\nIniciando Análise de Intervalos para: {file_path}")
+        interval_analyzer = IntervalAnalyzer(symbol_table)
+        intervals_ok = interval_analyzer.walk(program) if iterative else interval_analyzer.visit(program)
+        for warning in interval_analyzer.warnings:
+            print(warning)
+        if not intervals_ok:
+            print("\nAnálise de Intervalos falhou. Erros encontrados:")
+            for error in interval_analyzer.get_errors():
+                print(error)
+            wait_render(render_job)
+            return False
+        dead_code = interval_analyzer.dead
+        print(f"Análise de Intervalos concluída: {len(interval_analyzer.warnings)} possíveis divisões por zero, {len(dead_code)} desvios decididos na compilação.")
 
     # 5. Geração de Código Intermediário (TAC): Traduz a AST em Código de Três Endereços.
     print(f"\nIniciando Geração de Código Intermediário (TAC) para: {file_path}")
-    tac_generator = TACGenerator()
-    tac_generator.set_symbol_table(semantic_analyzer.symbol_table)
-    tac_generator.visit(parse_tree)
+    if fused and cached is None:
+        tac_generator = semantic_analyzer # TAC já emitido na passada da semântica
+    else:
+        tac_generator = TACGenerator(expressions, dead_code)
+        tac_generator.set_symbol_table(symbol_table)
+        if iterative:
+            tac_generator.walk(program)
+        else:
+            tac_generator.visit(program)
     
     tac_instructions = tac_generator.get_tac()
+    if hash_cons:
+        print(f"Subexpressões reaproveitadas no TAC: {tac_generator.reused} ({tac_generator.visits_avoided} visitas evitadas).")
     
     if output_tac:
         base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -72,7 +179,8 @@ def compile_poglin(file_path, output_ast=False, output_tac=False, output_llvm=Fa
     # 6. Geração de Código Final (LLVM IR): Converte o TAC em LLVM Intermediate Representation.
     if output_llvm:
         print(f"\nIniciando Geração de Código Final (LLVM IR) para: {file_path}")
-        llvm_generator = LLVMGenerator(tac_instructions, semantic_analyzer.symbol_table)
+        from src.final_code.llvm_generator import LLVMGenerator # llvmlite (e o alvo nativo) só quando há LLVM
+        llvm_generator = LLVMGenerator(tac_instructions, symbol_table)
         llvm_ir_code = llvm_generator.generate()
 
         base_name = os.path.splitext(os.path.basename(file_path))[0]
@@ -86,11 +194,75 @@ def compile_poglin(file_path, output_ast=False, output_tac=False, output_llvm=Fa
     else:
         print("\nSkipping LLVM IR generation.") 
 
+    wait_render(render_job)
     return True
 
+# Fases com visita recursiva num programa aninhado além do limite de recursão do Python
+NESTING_ERROR = "Erro: aninhamento profundo demais para as visitas recursivas (limite de recursão do Python); use --iterative."
+
+# "ERRO SEMÂNTICO [Linha 3, Coluna 7]: ..." -> fase, linha, coluna e mensagem
+DIAGNOSTIC = re.compile(r"(ERRO LÉXICO|ERRO SINTÁTICO|ERRO SEMÂNTICO|AVISO) \[Linha (\d+), Coluna (\d+)\]: (.*)")
+DIAGNOSTIC_KINDS = {
+    "ERRO LÉXICO": ("error", "lexical"),
+    "ERRO SINTÁTICO": ("error", "syntax"),
+    "ERRO SEMÂNTICO": ("error", "semantic"),
+    "AVISO": ("warning", "semantic"),
+}
+
+def diagnostic(message):
+    match = DIAGNOSTIC.match(message)
+    if match is None:
+        return {"severity": "error", "phase": None, "line": None, "column": None, "message": message}
+    severity, phase = DIAGNOSTIC_KINDS[match.group(1)]
+    return {"severity": severity, "phase": phase, "line": int(match.group(2)), "column": int(match.group(3)), "message": match.group(4)}
+
+def check_poglin(file_path, two_stage_parse=True, lexer_backend="antlr", parser_backend="antlr", use_mmap=False, streaming=False, lexer_jobs=None, use_atn_cache=True, flat_ast=False, iterative=False, collapse_tree=False, use_ast_cache=True, intervals=False):
+    # --check: para depois da análise semântica (e da de intervalos, se pedida) e imprime só os
+    # diagnósticos, em JSON no stdout. Os relatórios das fases são descartados e as mensagens
+    # que os listeners do lexer/parser escrevem no stderr viram os diagnósticos.
+    log = io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(log):
+        cache_key = ast_cache.source_key(file_path) if use_ast_cache else None
+        cached = ast_cache.load(cache_key) if cache_key is not None else None
+        if cached is not None:
+            program, symbol_table = cached
+            messages = []
+        else:
+            program = parse_program(file_path, two_stage_parse, lexer_backend, parser_backend, use_mmap, streaming, lexer_jobs, use_atn_cache, False, flat_ast, collapse_tree)
+            if program is None:
+                messages = [line for line in log.getvalue().splitlines() if line.strip()]
+            else:
+                semantic_analyzer = SemanticAnalyzer()
+                try:
+                    semantic_ok = semantic_analyzer.walk(program) if iterative else semantic_analyzer.visit(program)
+                    messages = semantic_analyzer.get_errors()
+                except RecursionError:
+                    semantic_ok = False
+                    messages = [NESTING_ERROR]
+                symbol_table = semantic_analyzer.symbol_table
+                if semantic_ok and cache_key is not None:
+                    ast_cache.save(cache_key, program, symbol_table)
+        if intervals and program is not None and not messages:
+            interval_analyzer = IntervalAnalyzer(symbol_table)
+            try:
+                interval_analyzer.walk(program) if iterative else interval_analyzer.visit(program)
+                messages = interval_analyzer.warnings + interval_analyzer.get_errors()
+            except RecursionError:
+                messages = [NESTING_ERROR]
+
+    diagnostics = [diagnostic(message) for message in messages]
+    ok = all(entry["severity"] != "error" for entry in diagnostics)
+    print(json.dumps({"file": file_path, "ok": ok, "diagnostics": diagnostics}, ensure_ascii=False))
+    return ok
+
+def wait_render(render_job):
+    if render_job is not None:
+        print("\nAguardando a renderização da AST...")
+        render_job.wait()
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Uso: python main.py <caminho_para_arquivo_poglin.pog> [--ast] [--tac] [--llvm]")
+        print("Uso: python main.py <caminho_para_arquivo_poglin.pog> [--ast] [--tac] [--llvm] [--ll] [--regex-lexer] [--rd-parser] [--mmap] [--stream] [--parallel[=N]] [--no-atn-cache] [--parser-profile] [--flat-ast] [--iterative] [--collapse-tree] [--ast-format=png|svg|dot] [--ast-engine=NOME] [--ast-depth=N] [--ast-block=N] [--no-ast-cache] [--hash-cons] [--intervals] [--fused] [--check]")
         print("Exemplo: python main.py tests/valid_program.pog --ast --tac --llvm")
         sys.exit(1)
     
@@ -99,6 +271,26 @@ if __name__ == '__main__':
     generate_ast_flag = False
     generate_tac_flag = False
     generate_llvm_flag = False
+    two_stage_parse_flag = True
+    lexer_backend = "antlr"
+    parser_backend = "antlr"
+    use_mmap_flag = False
+    streaming_flag = False
+    lexer_jobs = None
+    use_atn_cache_flag = True
+    parser_profile_flag = False
+    flat_ast_flag = False
+    iterative_flag = False
+    collapse_tree_flag = False
+    ast_format = "png"
+    ast_engine = "dot"
+    ast_max_depth = None
+    ast_max_block = None
+    use_ast_cache_flag = True
+    hash_cons_flag = False
+    intervals_flag = False
+    fused_flag = False
+    check_flag = False
     
     for arg in sys.argv[2:]:
         if arg == "--ast":
@@ -107,6 +299,47 @@ if __name__ == '__main__':
             generate_tac_flag = True
         elif arg == "--llvm":
             generate_llvm_flag = True
+        elif arg == "--ll":
+            two_stage_parse_flag = False # Força predição LL completa, sem o estágio SLL
+        elif arg == "--regex-lexer":
+            lexer_backend = "regex" # Scanner baseado em 're' no lugar do lexer ATN do ANTLR
+        elif arg == "--rd-parser":
+            parser_backend = "rd" # Parser descendente recursivo que gera a AST tipada direto
+        elif arg == "--mmap":
+            use_mmap_flag = True # Lê o fonte via mmap (MmapFileStream) em vez do FileStream
+        elif arg == "--stream":
+            streaming_flag = True # Janela deslizante de tokens (UnbufferedTokenStream) em vez do fill()
+        elif arg == "--no-atn-cache":
+            use_atn_cache_flag = False # Começa com os DFAs vazios, sem ler nem gravar o cache
+        elif arg == "--no-ast-cache":
+            use_ast_cache_flag = False # Refaz léxico, parse e semântica mesmo com o fonte inalterado
+        elif arg == "--parser-profile":
+            parser_profile_flag = True # Imprime invocações, lookahead e tempo de cada decisão do parser
+        elif arg == "--flat-ast":
+            flat_ast_flag = True # AST em arrays paralelos (FlatAST) em vez de um objeto por nó
+        elif arg == "--iterative":
+            iterative_flag = True # Fases semântica, TAC e AST sem recursão (pilha explícita)
+        elif arg == "--collapse-tree":
+            collapse_tree_flag = True # Remove as regras de repasse das expressões enquanto a árvore é montada
+        elif arg == "--hash-cons":
+            hash_cons_flag = True # Memo por forma de expressão na semântica e reaproveitamento de temporárias no TAC
+        elif arg == "--intervals":
+            intervals_flag = True # Interpretação abstrata com intervalos: divisões por zero e blocos mortos
+        elif arg == "--fused":
+            fused_flag = True # Semântica e geração de TAC numa única visita da AST
+        elif arg == "--check":
+            check_flag = True # Só os diagnósticos (JSON), sem TAC, LLVM nem visualização
+        elif arg.startswith("--ast-format="):
+            ast_format = arg.split("=", 1)[1] # png, svg ou dot (só o texto DOT, sem layout)
+        elif arg.startswith("--ast-engine="):
+            ast_engine = arg.split("=", 1)[1] # Layout do Graphviz: dot, sfdp, neato, ...
+        elif arg.startswith("--ast-depth="):
+            ast_max_depth = int(arg.split("=", 1)[1]) # Blocos mais fundos que N viram um nó-resumo
+        elif arg.startswith("--ast-block="):
+            ast_max_block = int(arg.split("=", 1)[1]) # Desenha até N comandos por bloco e resume o resto
+        elif arg == "--parallel" or arg.startswith("--parallel="):
+            # Análise léxica em N processos (padrão: um por núcleo)
+            lexer_jobs = int(arg.split("=", 1)[1]) if "=" in arg else (os.cpu_count() or 1)
         
     output_dir = "output"
     if (generate_ast_flag or generate_tac_flag or generate_llvm_flag) and not os.path.exists(output_dir):
@@ -116,4 +349,44 @@ if __name__ == '__main__':
         print(f"Erro: Arquivo '{input_file}' não encontrado.")
         sys.exit(1)
 
-    compile_poglin(input_file, generate_ast_flag, generate_tac_flag, generate_llvm_flag)
\ No newline at end of file
+    if use_mmap_flag and lexer_backend == "regex":
+        print("Erro: --mmap só vale para o lexer do ANTLR (não combine com --regex-lexer).")
+        sys.exit(1)
+
+    if lexer_jobs and (use_mmap_flag or streaming_flag):
+        print("Erro: --parallel não combina com --mmap nem com --stream.")
+        sys.exit(1)
+
+    if collapse_tree_flag and parser_backend == "rd":
+        print("Erro: --collapse-tree vale para a árvore de parse do ANTLR (não combine com --rd-parser).")
+        sys.exit(1)
+
+    if ast_format not in AST_FORMATS:
+        print(f"Erro: formato de AST '{ast_format}' inválido (use {', '.join(AST_FORMATS)}).")
+        sys.exit(1)
+
+    if hash_cons_flag and flat_ast_flag:
+        print("Erro: --hash-cons associa formas aos nós da AST tipada (não combine com --flat-ast).")
+        sys.exit(1)
+
+    if fused_flag and (hash_cons_flag or intervals_flag):
+        print("Erro: --fused emite o TAC durante a semântica, sem os memos do --hash-cons nem os blocos mortos do --intervals (não combine).")
+        sys.exit(1)
+
+    if flat_ast_flag and parser_backend != "rd":
+        print("Erro: --flat-ast é montada pelo parser descendente recursivo (use junto com --rd-parser).")
+        sys.exit(1)
+
+    if check_flag and (generate_ast_flag or generate_tac_flag or generate_llvm_flag or fused_flag or hash_cons_flag or parser_profile_flag):
+        print("Erro: --check só verifica o programa e imprime os diagnósticos (não combine com --ast, --tac, --llvm, --fused, --hash-cons nem --parser-profile).")
+        sys.exit(1)
+
+    if check_flag:
+        check_ok = check_poglin(input_file, two_stage_parse_flag, lexer_backend, parser_backend, use_mmap_flag, streaming_flag, lexer_jobs, use_atn_cache_flag, flat_ast_flag, iterative_flag, collapse_tree_flag, use_ast_cache_flag, intervals_flag)
+        sys.exit(0 if check_ok else 1)
+
+    try:
+        compile_poglin(input_file, generate_ast_flag, generate_tac_flag, generate_llvm_flag, two_stage_parse_flag, lexer_backend, parser_backend, use_mmap_flag, streaming_flag, lexer_jobs, use_atn_cache_flag, parser_profile_flag, flat_ast_flag, iterative_flag, collapse_tree_flag, ast_format, ast_engine, ast_max_depth, ast_max_block, use_ast_cache_flag, hash_cons_flag, intervals_flag, fused_flag)
+    except RecursionError:
+        print(NESTING_ERROR)
+        sys.exit(1)
\ No newline at end of file
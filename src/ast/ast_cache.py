@@ -0,0 +1,226 @@
+import gc
+import hashlib
+import marshal
+import os
+import sys
+from src.ast.nodes import (Program, VarDecl, Assign, Read, Print, If, While, Pog, BinaryExpr,
+                           UnaryExpr, IntLiteral, StringLiteral, Name)
+from src.semantic.symbol_table import SymbolTable
+
+# Cache em disco do programa já analisado: AST tipada que passou na análise semântica mais a
+# tabela de símbolos que TAC e LLVM consultam. Numa compilação com o mesmo fonte, léxico,
+# parse e semântica são pulados e o programa é remontado a partir do arquivo.
+#
+# Formato: MAGIC + marshal de (CACHE_FORMAT, chave, registros, símbolos, snapshot global). A AST
+# vai como uma lista de registros em pós-ordem (tuplas de tipo, posição e campos), sem
+# aninhamento: o marshal não tem limite de profundidade a respeitar e a leitura é uma pilha.
+#
+# A chave é o hash do fonte com a impressão digital do compilador (código de src/, versão do
+# formato e do Python, que define o formato do marshal). Cada entrada é um arquivo <chave>.ast;
+# o mtime marca o último uso e, passando de CACHE_MAX_BYTES, os menos usados são removidos.
+# Como no cache de ATN, qualquer falha de leitura/gravação é ignorada em silêncio.
+
+CACHE_FORMAT = 2
+MAGIC = b"POGAST\x00"
+CACHE_DIR = os.path.join(os.environ.get("POGLIN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "poglin")), "ast")
+CACHE_MAX_BYTES = int(os.environ.get("POGLIN_AST_CACHE_MB", "64")) * 1024 * 1024
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tipos dos registros
+PROGRAM, VAR_DECL, ASSIGN, READ, PRINT, IF, WHILE, POG, BINARY, UNARY, INT, STRING, NAME = range(13)
+
+_fingerprint = None
+
+def compiler_fingerprint():
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(f"{CACHE_FORMAT}|{sys.version}".encode())
+        for root, dirs, files in os.walk(SRC_DIR):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    with open(os.path.join(root, name), "rb") as f:
+                        digest.update(name.encode())
+                        digest.update(f.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+def source_key(file_path):
+    digest = hashlib.sha256(compiler_fingerprint().encode())
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def entry_path(key):
+    return os.path.join(CACHE_DIR, key + ".ast")
+
+def encode(program):
+    # Pré-ordem da direita para a esquerda com pilha explícita; invertida, vira a pós-ordem da
+    # esquerda para a direita. Aceita a AST tipada e as visões da FlatAST.
+    records = []
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        method = node.visit_method
+        if method == 'visitProgram':
+            statements = list(node.statements)
+            records.append((PROGRAM, node.line, node.column, len(statements)))
+            stack.extend(statements)
+        elif method == 'visitVarDecl':
+            records.append((VAR_DECL, node.line, node.column, node.name, node.var_type))
+            stack.append(node.value)
+        elif method == 'visitAssign':
+            records.append((ASSIGN, node.line, node.column, node.name))
+            stack.append(node.value)
+        elif method == 'visitRead':
+            records.append((READ, node.line, node.column, node.name))
+        elif method == 'visitPrint':
+            records.append((PRINT, node.line, node.column))
+            stack.append(node.value)
+        elif method == 'visitIf':
+            then_body = list(node.then_body)
+            else_body = None if node.else_body is None else list(node.else_body)
+            records.append((IF, node.line, node.column, len(then_body), -1 if else_body is None else len(else_body)))
+            stack.append(node.condition)
+            stack.extend(then_body)
+            stack.extend(else_body or ())
+        elif method == 'visitWhile':
+            body = list(node.body)
+            records.append((WHILE, node.line, node.column, len(body)))
+            stack.append(node.condition)
+            stack.extend(body)
+        elif method == 'visitPog':
+            records.append((POG, node.line, node.column))
+        elif method == 'visitBinaryExpr':
+            records.append((BINARY, tuple(node.ops), tuple(tuple(position) for position in node.positions)))
+            stack.extend(node.operands)
+        elif method == 'visitUnaryExpr':
+            records.append((UNARY, node.line, node.column, node.op))
+            stack.append(node.operand)
+        elif method == 'visitIntLiteral':
+            records.append((INT, node.line, node.column, node.value))
+        elif method == 'visitStringLiteral':
+            records.append((STRING, node.line, node.column, node.text))
+        else:
+            records.append((NAME, node.line, node.column, node.name))
+    records.reverse()
+    return records
+
+def decode(records):
+    values = []
+
+    def take(count):
+        if not count:
+            return []
+        children = values[-count:]
+        del values[-count:]
+        return children
+
+    for record in records:
+        kind = record[0]
+        if kind == PROGRAM:
+            node = Program(take(record[3]), record[1], record[2])
+        elif kind == VAR_DECL:
+            node = VarDecl(record[3], record[4], values.pop(), record[1], record[2])
+        elif kind == ASSIGN:
+            node = Assign(record[3], values.pop(), record[1], record[2])
+        elif kind == READ:
+            node = Read(record[3], record[1], record[2])
+        elif kind == PRINT:
+            node = Print(values.pop(), record[1], record[2])
+        elif kind == IF:
+            then_count, else_count = record[3], record[4]
+            children = take(1 + then_count + max(else_count, 0))
+            else_body = None if else_count < 0 else children[1 + then_count:]
+            node = If(children[0], children[1:1 + then_count], else_body, record[1], record[2])
+        elif kind == WHILE:
+            children = take(1 + record[3])
+            node = While(children[0], children[1:], record[1], record[2])
+        elif kind == POG:
+            node = Pog(record[1], record[2])
+        elif kind == BINARY:
+            ops, positions = record[1], record[2]
+            node = BinaryExpr(list(ops), list(positions), take(len(ops) + 1))
+        elif kind == UNARY:
+            node = UnaryExpr(record[3], values.pop(), record[1], record[2])
+        elif kind == INT:
+            node = IntLiteral(record[3], record[1], record[2])
+        elif kind == STRING:
+            node = StringLiteral(record[3], record[1], record[2])
+        else:
+            node = Name(record[3], record[1], record[2])
+        values.append(node)
+    return values.pop()
+
+def load(key):
+    # Devolve (programa, tabela de símbolos) ou None; um acerto atualiza o mtime da entrada (LRU)
+    path = entry_path(key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            return None
+        # Só são criados objetos que vivem até o fim da compilação: o coletor cíclico, que
+        # rodaria várias vezes durante a remontagem sem achar lixo, fica desligado
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            cache_format, stored_key, records, symbols, snapshot = marshal.loads(data[len(MAGIC):])
+            if cache_format != CACHE_FORMAT or stored_key != key:
+                return None
+            program = decode(records)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        os.utime(path)
+    except Exception:
+        return None
+    symbol_table = SymbolTable()
+    symbol_table.names, symbol_table.types, symbol_table.scopes, symbol_table.lines = symbols
+    if snapshot is not None:
+        symbol_table.global_snapshot = snapshot
+    return program, symbol_table
+
+def save(key, program, symbol_table):
+    # Escrita atômica (tmp + replace) seguida da remoção das entradas menos usadas
+    symbols = (symbol_table.names, symbol_table.types, symbol_table.scopes, symbol_table.lines)
+    payload = (CACHE_FORMAT, key, encode(program), symbols, getattr(symbol_table, "global_snapshot", None))
+    path = entry_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(marshal.dumps(payload))
+        os.replace(tmp_path, path)
+        evict()
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+def evict(max_bytes=CACHE_MAX_BYTES):
+    entries = []
+    total = 0
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith(".ast"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    entries.sort()
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
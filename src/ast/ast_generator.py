@@ -1,265 +1,296 @@
+import io
+import os
 import sys
-from antlr4 import ParseTreeVisitor
-from src.lexer.poglinVisitor import poglinVisitor
-from src.lexer.poglinParser import poglinParser
-from graphviz import Digraph
-
-class ASTGenerator(poglinVisitor):
-    def __init__(self, parser_instance=None):
-        self.dot = Digraph(comment='Abstract Syntax Tree', graph_attr={'rankdir': 'TB'})
+import threading
+import time
+from src.ast.dot_writer import DotWriter, render
+from src.ast.nodes import NodeVisitor
+
+# Rótulo do nó de cada operador binário da AST tipada
+BINARY_LABELS = {
+    '||': "OR_EXPR", '&&': "AND_EXPR",
+    '==': "EQ_EXPR", '!=': "NEQ_EXPR",
+    '<': "LT_EXPR", '<=': "LTE_EXPR", '>': "GT_EXPR", '>=': "GTE_EXPR",
+    '+': "ADD_EXPR", '-': "SUB_EXPR",
+    '*': "MUL_EXPR", '/': "DIV_EXPR",
+}
+
+# Formatos aceitos por generate_ast; "dot" só grava o texto DOT, sem rodar o layout
+AST_FORMATS = ('png', 'svg', 'dot')
+
+# Campos dos nós que guardam filhos (nós ou listas de nós), para contar os nós resumidos
+CHILD_FIELDS = ('statements', 'value', 'condition', 'then_body', 'else_body', 'body', 'operands', 'operand')
+
+def count_nodes(statements):
+    count, stack = 0, list(statements)
+    while stack:
+        node = stack.pop()
+        count += 1
+        for field in CHILD_FIELDS:
+            child = getattr(node, field, None)
+            if isinstance(child, list):
+                stack.extend(child)
+            elif hasattr(child, 'visit_method'): # IntLiteral/StringLiteral.value não é nó
+                stack.append(child)
+    return count
+
+class ASTGenerator(NodeVisitor):
+    # max_depth: blocos aninhados além desse nível viram um nó-resumo (o corpo do programa é
+    # o nível 1); max_block: um bloco desenha no máximo esse número de comandos e resume o
+    # resto. Sem limites, desenha a AST inteira.
+    def __init__(self, max_depth=None, max_block=None):
+        super().__init__()
+        self.dot = DotWriter(io.StringIO()) # Trocado pelo arquivo em generate_ast
         self.node_count = 0
-        self.parser = parser_instance # Necessario para obter nomes simbolicos dos tokens
-        self.node_map = {} # Mapeia contextos do ANTLR para nos da AST
-        
-    def new_node(self, label, context):
+        self.max_depth = max_depth
+        self.max_block = max_block
+        self.depth = 0
+
+    def new_node(self, label, **attrs):
         node_id = f'node{self.node_count}'
         self.node_count += 1
-        self.dot.node(node_id, label)
-        self.node_map[context] = node_id
+        self.dot.node(node_id, label, **attrs)
         return node_id
 
     def add_edge(self, parent_id, child_id, label=''):
         if child_id: # Adiciona verificacao para garantir que child_id nao e None
             self.dot.edge(parent_id, child_id, label=label)
 
-    # Métodos visit para as regras da gramática
-    def visitProgram(self, ctx: poglinParser.ProgramContext):
-        node_id = self.new_node("PROGRAM", ctx)
-        for statement_ctx in ctx.statement():
-            child_id = self.visit(statement_ctx)
-            self.add_edge(node_id, child_id) # add_edge ja tem a verificacao
+    def split_block(self, statements):
+        # Separa os comandos do bloco em desenhados e cortados pelos limites de profundidade e
+        # de bloco
+        if self.max_depth is None and self.max_block is None:
+            return statements, ()
+        statements = list(statements) # O corpo do programa na FlatAST é um gerador
+        if self.max_depth is not None and self.depth > self.max_depth:
+            return (), statements
+        if self.max_block is not None and len(statements) > self.max_block:
+            return statements[:self.max_block], statements[self.max_block:]
+        return statements, ()
+
+    def summary_node(self, block_id, hidden, shown):
+        # Nó-resumo no lugar dos comandos cortados, com o total de nós da AST que eles têm
+        prefix = "... +" if shown else "... "
+        label = f"{prefix}{len(hidden)} comando(s) ({count_nodes(hidden)} nós)"
+        self.add_edge(block_id, self.new_node(label, shape='note', style='dashed'))
+
+    # Métodos visit para os nós da AST tipada (src/ast/nodes.py)
+    def visitProgram(self, node):
+        node_id = self.new_node("PROGRAM")
+        self.visit_block(node_id, node.statements) # add_edge ja tem a verificacao
+        return node_id
+
+    def visit_block(self, block_id, statements):
+        self.depth += 1
+        shown, hidden = self.split_block(statements)
+        for statement in shown:
+            self.add_edge(block_id, self.visit(statement))
+        if hidden:
+            self.summary_node(block_id, hidden, shown)
+        self.depth -= 1
+
+    def visitVarDecl(self, node):
+        node_id = self.new_node("VAR_DECLARATION")
+        self.add_edge(node_id, self.new_node(f"ID: {node.name}"), "name")
+        self.add_edge(node_id, self.new_node(f"TYPE: {node.var_type}"), "type")
+        self.add_edge(node_id, self.visit(node.value), "value")
+        return node_id
+
+    def visitRead(self, node):
+        node_id = self.new_node("READLINE_ASSIGNMENT")
+        self.add_edge(node_id, self.new_node(f"ID: {node.name}"), "target")
+        return node_id
+
+    def visitAssign(self, node):
+        node_id = self.new_node("ASSIGNMENT")
+        self.add_edge(node_id, self.new_node(f"ID: {node.name}"), "target")
+        self.add_edge(node_id, self.visit(node.value), "value")
+        return node_id
+
+    def visitPrint(self, node):
+        node_id = self.new_node("PRINTLN_CALL")
+        self.add_edge(node_id, self.visit(node.value), "argument")
+        return node_id
+
+    def visitIf(self, node):
+        node_id = self.new_node("IF_STATEMENT")
+        self.add_edge(node_id, self.visit(node.condition), "condition")
+        then_block_id = self.new_node("THEN_BLOCK")
+        self.add_edge(node_id, then_block_id)
+        self.visit_block(then_block_id, node.then_body)
+        if node.else_body is not None:
+            else_block_id = self.new_node("ELSE_BLOCK")
+            self.add_edge(node_id, else_block_id)
+            self.visit_block(else_block_id, node.else_body)
+        return node_id
+
+    def visitWhile(self, node):
+        node_id = self.new_node("WHILE_LOOP")
+        self.add_edge(node_id, self.visit(node.condition), "condition")
+        loop_block_id = self.new_node("LOOP_BLOCK")
+        self.add_edge(node_id, loop_block_id)
+        self.visit_block(loop_block_id, node.body)
+        return node_id
+
+    def visitPog(self, node):
+        return self.new_node("POG_STATEMENT")
+
+    def visitBinaryExpr(self, node):
+        # Desenha o nó n-ário como operações binárias aninhadas à esquerda
+        left_id = self.visit(node.operands[0])
+        for op, operand in zip(node.ops, node.operands[1:]):
+            node_id = self.new_node(BINARY_LABELS[op])
+            self.add_edge(node_id, left_id, "left")
+            self.add_edge(node_id, self.visit(operand), "right")
+            left_id = node_id
+        return left_id
+
+    def visitUnaryExpr(self, node):
+        node_id = self.new_node("NOT_EXPR")
+        self.add_edge(node_id, self.visit(node.operand), "operand")
+        return node_id
+
+    def visitIntLiteral(self, node):
+        return self.new_node(f"INT_LITERAL: {node.value}")
+
+    def visitStringLiteral(self, node):
+        return self.new_node(f"STRING_LITERAL: {node.text}")
+
+    def visitName(self, node):
+        return self.new_node(f"ID_REF: {node.name}")
+
+    # Versões sem recursão (NodeVisitor.walk): criam os nós do Graphviz na mesma ordem
+    def walk_block(self, block_id, statements):
+        self.depth += 1
+        shown, hidden = self.split_block(statements)
+        for statement in shown:
+            self.add_edge(block_id, (yield statement))
+        if hidden:
+            self.summary_node(block_id, hidden, shown)
+        self.depth -= 1
+
+    def walkProgram(self, node):
+        node_id = self.new_node("PROGRAM")
+        yield from self.walk_block(node_id, node.statements)
+        return node_id
+
+    def walkVarDecl(self, node):
+        node_id = self.new_node("VAR_DECLARATION")
+        self.add_edge(node_id, self.new_node(f"ID: {node.name}"), "name")
+        self.add_edge(node_id, self.new_node(f"TYPE: {node.var_type}"), "type")
+        self.add_edge(node_id, (yield node.value), "value")
+        return node_id
+
+    def walkAssign(self, node):
+        node_id = self.new_node("ASSIGNMENT")
+        self.add_edge(node_id, self.new_node(f"ID: {node.name}"), "target")
+        self.add_edge(node_id, (yield node.value), "value")
+        return node_id
+
+    def walkPrint(self, node):
+        node_id = self.new_node("PRINTLN_CALL")
+        self.add_edge(node_id, (yield node.value), "argument")
+        return node_id
+
+    def walkIf(self, node):
+        node_id = self.new_node("IF_STATEMENT")
+        self.add_edge(node_id, (yield node.condition), "condition")
+        then_block_id = self.new_node("THEN_BLOCK")
+        self.add_edge(node_id, then_block_id)
+        yield from self.walk_block(then_block_id, node.then_body)
+        if node.else_body is not None:
+            else_block_id = self.new_node("ELSE_BLOCK")
+            self.add_edge(node_id, else_block_id)
+            yield from self.walk_block(else_block_id, node.else_body)
+        return node_id
+
+    def walkWhile(self, node):
+        node_id = self.new_node("WHILE_LOOP")
+        self.add_edge(node_id, (yield node.condition), "condition")
+        loop_block_id = self.new_node("LOOP_BLOCK")
+        self.add_edge(node_id, loop_block_id)
+        yield from self.walk_block(loop_block_id, node.body)
+        return node_id
+
+    def walkBinaryExpr(self, node):
+        left_id = yield node.operands[0]
+        for op, operand in zip(node.ops, node.operands[1:]):
+            node_id = self.new_node(BINARY_LABELS[op])
+            self.add_edge(node_id, left_id, "left")
+            self.add_edge(node_id, (yield operand), "right")
+            left_id = node_id
+        return left_id
+
+    def walkUnaryExpr(self, node):
+        node_id = self.new_node("NOT_EXPR")
+        self.add_edge(node_id, (yield node.operand), "operand")
         return node_id
 
-    def visitStatement(self, ctx: poglinParser.StatementContext):
-        # Cada alternativa da regra 'statement' é verificada
-        if ctx.VAR():
-            # VAR ID COLON type ASSIGN expression SEMI
-            node_id = self.new_node("VAR_DECLARATION", ctx)
-            id_node = self.new_node(f"ID: {ctx.ID().getText()}", ctx.ID())
-            self.add_edge(node_id, id_node, "name")
-            
-            type_node = self.visit(ctx.type_())
-            self.add_edge(node_id, type_node, "type")
-
-            expr_node = self.visit(ctx.expression()) # ctx.expression() existe aqui
-            self.add_edge(node_id, expr_node, "value")
-            return node_id
-        
-        elif ctx.ASSIGN() and ctx.READLINE():
-            # ID ASSIGN READLINE LPAREN RPAREN SEMI
-            node_id = self.new_node("READLINE_ASSIGNMENT", ctx) # Nome mais claro
-            id_node = self.new_node(f"ID: {ctx.ID().getText()}", ctx.ID())
-            self.add_edge(node_id, id_node, "target")
-            return node_id
-
-        elif ctx.ASSIGN(): # Isso significa ID ASSIGN expression SEMI (reatribuição)
-            node_id = self.new_node("ASSIGNMENT", ctx)
-            id_node = self.new_node(f"ID: {ctx.ID().getText()}", ctx.ID())
-            self.add_edge(node_id, id_node, "target")
-            
-            expr_node = self.visit(ctx.expression()) # ctx.expression() existe aqui
-            self.add_edge(node_id, expr_node, "value")
-            return node_id
-
-        elif ctx.PRINTLN():
-            # PRINTLN LPAREN expression RPAREN SEMI
-            node_id = self.new_node("PRINTLN_CALL", ctx)
-            expr_node = self.visit(ctx.expression()) # ctx.expression() existe aqui
-            self.add_edge(node_id, expr_node, "argument")
-            return node_id
-            
-        elif ctx.IF():
-            node_id = self.new_node("IF_STATEMENT", ctx)
-            
-            # Condição
-            cond_node = self.visit(ctx.expression())
-            self.add_edge(node_id, cond_node, "condition")
-            
-            # Bloco THEN:
-            # Vamos iterar pelos filhos do contexto para encontrar os statements do THEN.
-            # Assumimos que o primeiro '{' e '}' delimitam o THEN block.
-            then_block_id = self.new_node("THEN_BLOCK", ctx.LBRACE(0))
-            self.add_edge(node_id, then_block_id)
-            
-            in_current_block = False
-            brace_count = 0
-            # Percorre todos os filhos do contexto 'if'
-            for child in ctx.children:
-                if child == ctx.LBRACE(0): # Início do bloco THEN
-                    in_current_block = True
-                    brace_count += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_count == 1: # Fim do bloco THEN
-                    in_current_block = False
-                    brace_count -=1
-                    continue # Sai do loop para este bloco
-                
-                if in_current_block and isinstance(child, poglinParser.StatementContext):
-                    child_ast_node_id = self.visit(child)
-                    if child_ast_node_id: self.add_edge(then_block_id, child_ast_node_id)
-            
-            # Bloco ELSE (se existir)
-            if ctx.ELSE():
-                else_block_id = self.new_node("ELSE_BLOCK", ctx.LBRACE(1))
-                self.add_edge(node_id, else_block_id)
-
-                in_current_block = False
-                brace_count = 0
-                for child in ctx.children:
-                    if child == ctx.LBRACE(1): # Início do bloco ELSE
-                        in_current_block = True
-                        brace_count += 1
-                        continue
-                    if child == ctx.RBRACE(1) and brace_count == 1: # Fim do bloco ELSE
-                        in_current_block = False
-                        brace_count -= 1
-                        continue
-                    
-                    if in_current_block and isinstance(child, poglinParser.StatementContext):
-                        child_ast_node_id = self.visit(child)
-                        if child_ast_node_id: self.add_edge(else_block_id, child_ast_node_id)
-            return node_id
-
-        elif ctx.WHILE():
-            node_id = self.new_node("WHILE_LOOP", ctx)
-            self.add_edge(node_id, self.visit(ctx.expression()), "condition")
-            
-            # Bloco do WHILE
-            loop_block_id = self.new_node("LOOP_BLOCK", ctx.LBRACE(0))
-            self.add_edge(node_id, loop_block_id)
-
-            in_current_block = False
-            brace_count = 0
-            for child in ctx.children:
-                if child == ctx.LBRACE(0):
-                    in_current_block = True
-                    brace_count += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_count == 1:
-                    in_current_block = False
-                    brace_count -= 1
-                    continue
-                
-                if in_current_block and isinstance(child, poglinParser.StatementContext):
-                    child_ast_node_id = self.visit(child)
-                    if child_ast_node_id: self.add_edge(loop_block_id, child_ast_node_id)
-            return node_id
-        
-        elif ctx.POG():
-            return self.new_node("POG_STATEMENT", ctx)
-        
-        # Caso base: se nenhuma das alternativas acima foi casada, pode haver um erro ou uma regra nova
-        # Geralmente, esse ponto não deve ser atingido se todas as alternativas são cobertas.
-        # Mas para segurança, se o visitChildren for chamado, ele tentará visitar filhos.
-        # return self.visitChildren(ctx) # Removido para garantir que sempre retorne um ID de nó específico
-
-    # Types
-    def visitType(self, ctx: poglinParser.TypeContext):
-        return self.new_node(f"TYPE: {ctx.getText()}", ctx)
-
-    # Expressions (mantidos como estavam, pois eles já eram chamados corretamente)
-    def visitLogicalOrExpression(self, ctx: poglinParser.LogicalOrExpressionContext):
-        if len(ctx.logicalAndExpression()) > 1: # Se tiver operador OR
-            node_id = self.new_node("OR_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.logicalAndExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.logicalAndExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.logicalAndExpression(0)) # Se nao tiver OR, visita o filho
-
-    def visitLogicalAndExpression(self, ctx: poglinParser.LogicalAndExpressionContext):
-        if len(ctx.equalityExpression()) > 1: # Se tiver operador AND
-            node_id = self.new_node("AND_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.equalityExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.equalityExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.equalityExpression(0))
-
-    def visitEqualityExpression(self, ctx: poglinParser.EqualityExpressionContext):
-        if ctx.EQUALS():
-            node_id = self.new_node("EQ_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.relationalExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.relationalExpression(1)), "right")
-            return node_id
-        elif ctx.NEQUALS():
-            node_id = self.new_node("NEQ_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.relationalExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.relationalExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.relationalExpression(0))
-
-    def visitRelationalExpression(self, ctx: poglinParser.RelationalExpressionContext):
-        if ctx.LT():
-            node_id = self.new_node("LT_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(1)), "right")
-            return node_id
-        elif ctx.LTE():
-            node_id = self.new_node("LTE_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(1)), "right")
-            return node_id
-        elif ctx.GT():
-            node_id = self.new_node("GT_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(1)), "right")
-            return node_id
-        elif ctx.GTE():
-            node_id = self.new_node("GTE_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.additiveExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.additiveExpression(0))
-
-    def visitAdditiveExpression(self, ctx: poglinParser.AdditiveExpressionContext):
-        if ctx.PLUS():
-            node_id = self.new_node("ADD_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.multiplicativeExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.multiplicativeExpression(1)), "right")
-            return node_id
-        elif ctx.MINUS():
-            node_id = self.new_node("SUB_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.multiplicativeExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.multiplicativeExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.multiplicativeExpression(0))
-
-    def visitMultiplicativeExpression(self, ctx: poglinParser.MultiplicativeExpressionContext):
-        if ctx.MULT():
-            node_id = self.new_node("MUL_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.unaryExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.unaryExpression(1)), "right")
-            return node_id
-        elif ctx.DIV():
-            node_id = self.new_node("DIV_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.unaryExpression(0)), "left")
-            self.add_edge(node_id, self.visit(ctx.unaryExpression(1)), "right")
-            return node_id
-        return self.visit(ctx.unaryExpression(0))
-
-    def visitUnaryExpression(self, ctx: poglinParser.UnaryExpressionContext):
-        if ctx.NOT():
-            node_id = self.new_node("NOT_EXPR", ctx)
-            self.add_edge(node_id, self.visit(ctx.unaryExpression()), "operand")
-            return node_id
-        return self.visit(ctx.primary()) # Unary pode ser NOT ou Primary. Se nao for NOT, eh Primary.
-
-    def visitPrimary(self, ctx: poglinParser.PrimaryContext):
-        if ctx.INT():
-            return self.new_node(f"INT_LITERAL: {ctx.INT().getText()}", ctx)
-        elif ctx.STRING():
-            return self.new_node(f"STRING_LITERAL: {ctx.STRING().getText()}", ctx)
-        elif ctx.ID():
-            return self.new_node(f"ID_REF: {ctx.ID().getText()}", ctx)
-        elif ctx.expression(): # Para LPAREN expression RPAREN
-            return self.visit(ctx.expression())
-        return None # Caso nao caia em nenhum, retorna None (para evitar erro)
-
-    def generate_ast(self, parse_tree, output_filename="ast"):
-        # Começa a visita a partir da raiz da árvore de parse
-        self.visit(parse_tree)
+    def generate_ast(self, program, output_filename="ast", iterative=False, fmt='png', engine='dot', background=False):
+        # O DOT é escrito em <output_filename>.dot enquanto a AST é percorrida; depois o layout
+        # gera <output_filename>.<fmt>, a menos que a AST desenhada não tenha mudado. Com
+        # background, o layout roda numa thread e quem chamou espera com job.wait().
+        dot_path = output_filename + ".dot"
+        with open(dot_path, 'w', encoding='utf-8') as out:
+            self.dot = DotWriter(out, graph_attr={'rankdir': 'TB'})
+            # Começa a visita a partir da raiz da AST
+            if iterative:
+                self.walk(program)
+            else:
+                self.visit(program)
+            self.dot.close()
+        if fmt == 'dot':
+            print(f"AST gerada com sucesso em {dot_path} ({self.node_count} nós)")
+            return None
+        job = RenderJob(dot_path, f"{output_filename}.{fmt}", fmt, engine, self.dot.hexdigest(), self.node_count)
+        if background:
+            job.start()
+            print(f"DOT da AST gravado ({self.node_count} nós); renderização em segundo plano")
+        else:
+            job.run()
+            job.report()
+        return job
+
+class RenderJob(threading.Thread):
+    # Layout do Graphviz fora do caminho crítico: o 'dot' é um subprocesso, então a thread só
+    # espera por ele e as fases seguintes continuam rodando. Mensagens saem só em report(),
+    # para não se misturarem com a saída das outras fases.
+    def __init__(self, dot_path, output_path, fmt, engine, digest, node_count):
+        super().__init__(name="ast-render")
+        self.dot_path = dot_path
+        self.output_path = output_path
+        self.fmt = fmt
+        self.engine = engine
+        self.digest = digest
+        self.node_count = node_count
+        self.rendered = None
+        self.error = None
+        self.seconds = 0.0
+
+    def run(self):
+        start = time.perf_counter()
         try:
-            self.dot.render(output_filename, format='png', view=False, cleanup=True) # Adicionado cleanup=True
-            print(f"AST gerada com sucesso em {output_filename}.png")
+            self.rendered = render(self.dot_path, self.output_path, self.fmt, self.engine, self.digest)
+            os.remove(self.dot_path)
         except Exception as e:
-            print(f"Erro ao renderizar a AST com Graphviz: {e}", file=sys.stderr)
-            print("Certifique-se de que o Graphviz está instalado e no PATH do sistema.", file=sys.stderr)
\ No newline at end of file
+            self.error = e
+        self.seconds = time.perf_counter() - start
+
+    def wait(self):
+        # Devolve o tempo que o chamador ficou bloqueado esperando a renderização terminar
+        start = time.perf_counter()
+        self.join()
+        waited = time.perf_counter() - start
+        self.report()
+        print(f"Renderização da AST: {self.seconds:.2f}s em segundo plano, {waited:.2f}s de espera no fim")
+        return waited
+
+    def report(self):
+        if self.error is not None:
+            print(f"Erro ao renderizar a AST com Graphviz: {self.error}", file=sys.stderr)
+            print("Certifique-se de que o Graphviz está instalado e no PATH do sistema.", file=sys.stderr)
+            print(f"O texto DOT da AST ficou em {self.dot_path}", file=sys.stderr)
+        elif self.rendered:
+            print(f"AST gerada com sucesso em {self.output_path} ({self.node_count} nós, layout: {self.engine})")
+        else:
+            print(f"AST inalterada desde a última renderização; mantida em {self.output_path}")
@@ -0,0 +1,52 @@
+import hashlib
+import os
+
+# Escrita incremental de DOT: cada nó e aresta vai direto para o arquivo, sem acumular o grafo
+# em memória como o graphviz.Digraph. O texto escrito entra num hash SHA-256, que identifica o
+# conteúdo da AST desenhada (com os limites de profundidade/bloco aplicados).
+
+def quote(label):
+    return '"' + label.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+class DotWriter:
+    def __init__(self, out, comment='Abstract Syntax Tree', graph_attr=None):
+        self.out = out
+        self.digest = hashlib.sha256()
+        self.write(f"// {comment}\ndigraph {{\n")
+        for key, value in (graph_attr or {}).items():
+            self.write(f"\t{key}={quote(value)}\n")
+
+    def write(self, text):
+        self.out.write(text)
+        self.digest.update(text.encode('utf-8'))
+
+    def node(self, node_id, label, **attrs):
+        extra = "".join(f" {key}={quote(value)}" for key, value in attrs.items())
+        self.write(f"\t{node_id} [label={quote(label)}{extra}]\n")
+
+    def edge(self, tail_id, head_id, label=''):
+        if label:
+            self.write(f"\t{tail_id} -> {head_id} [label={quote(label)}]\n")
+        else:
+            self.write(f"\t{tail_id} -> {head_id}\n")
+
+    def close(self):
+        self.write("}\n")
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+def render(dot_path, output_path, fmt, engine, digest):
+    # Roda o layout só se a saída não existe ou se o hash gravado ao lado dela (junto com
+    # formato e engine) é outro. Devolve False quando a renderização foi pulada.
+    key = f"{engine} {fmt} {digest}\n"
+    hash_path = output_path + ".hash"
+    if os.path.exists(output_path) and os.path.exists(hash_path):
+        with open(hash_path, encoding='utf-8') as f:
+            if f.read() == key:
+                return False
+    import graphviz # Só quem renderiza precisa do pacote e do executável do Graphviz
+    graphviz.render(engine, fmt, dot_path, outfile=output_path)
+    with open(hash_path, 'w', encoding='utf-8') as f:
+        f.write(key)
+    return True
@@ -0,0 +1,313 @@
+from array import array
+from src.ast.nodes import BINARY_OPERATORS, VISITABLE
+
+# AST "achatada" em arrays paralelos (struct of arrays), para programas gerados com milhões
+# de comandos, onde um objeto Python por nó domina a memória. Cada nó é um índice e ocupa
+# 13 bytes:
+#   kinds[i]         (B) tipo do nó (constantes abaixo)
+#   first_child[i]   (i) primeiro filho, ou -1; nos nós folha guarda o índice na tabela de
+#                        constantes (nome, literal, tipo), como a união lhs/rhs de ASTs
+#                        achatadas em C: folha não tem filho
+#   next_sibling[i]  (i) próximo irmão, ou -1
+#   tokens[i]        (i) índice do token no stream, ou -1; linha/coluna ficam em
+#                        token_lines/token_columns (I), só dos tokens referenciados
+# Os nós são criados pelo parser descendente recursivo (FlatASTBuilder) em pós-ordem, então
+# os filhos vêm antes dos pais e uma varredura linear de 0 a len-1 já é bottom-up.
+#
+# FlatAST.root() devolve uma visão do programa com a mesma interface dos nós de
+# src/ast/nodes.py (accept, name, value, statements...), então SemanticAnalyzer, TACGenerator
+# e ASTGenerator a percorrem sem mudanças. As visões são criadas sob demanda durante a
+# visita e descartadas em seguida.
+
+PROGRAM = 0
+VAR_DECL = 1 # filhos: NAME (variável), TYPE, valor
+ASSIGN = 2 # filhos: NAME (alvo), valor
+READ = 3 # folha: constante = nome
+PRINT = 4 # filhos: valor
+IF = 5 # filhos: condição, BLOCK (then), BLOCK (else, opcional)
+WHILE = 6 # filhos: condição, BLOCK
+POG = 7
+BLOCK = 8 # filhos: comandos
+NOT = 9 # filhos: operando
+INT = 10 # folha: constante = valor
+STRING = 11 # folha: constante = lexema com aspas
+NAME = 12 # folha: constante = nome
+TYPE = 13 # folha: constante = 'Int' ou 'String'
+BINARY = 16 # BINARY + i: operador OPERATORS[i], filhos: esquerda, direita
+
+OPERATORS = tuple(BINARY_OPERATORS)
+OPERATOR_KINDS = {op: BINARY + i for i, op in enumerate(OPERATORS)}
+LEAF_KINDS = frozenset((READ, POG, INT, STRING, NAME, TYPE))
+
+class FlatAST:
+    __slots__ = ('kinds', 'first_child', 'next_sibling', 'tokens',
+                 'token_lines', 'token_columns', 'constants', 'root_index')
+
+    def __init__(self):
+        self.kinds = array('B')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.tokens = array('i')
+        self.token_lines = array('I')
+        self.token_columns = array('I')
+        self.constants = [] # Tabela de constantes sem repetição (nomes, literais, tipos)
+        self.root_index = -1
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def children(self, index):
+        # Índices dos filhos, seguindo a lista de irmãos
+        if self.kinds[index] in LEAF_KINDS:
+            return
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child != -1:
+            yield child
+            child = next_sibling[child]
+
+    def child(self, index, position):
+        for i, child in enumerate(self.children(index)):
+            if i == position:
+                return child
+        return -1
+
+    def constant(self, index):
+        return self.constants[self.first_child[index]]
+
+    def position(self, index):
+        token = self.tokens[index]
+        if token < 0:
+            return 0, 0
+        return self.token_lines[token], self.token_columns[token]
+
+    def walk(self, index=None):
+        # Pré-ordem com pilha explícita: (índice, profundidade)
+        stack = [(self.root_index if index is None else index, 0)]
+        while stack:
+            index, depth = stack.pop()
+            yield index, depth
+            stack.extend(reversed([(child, depth + 1) for child in self.children(index)]))
+
+    def view(self, index):
+        return VIEWS[min(self.kinds[index], BINARY)](self, index)
+
+    def root(self):
+        return self.view(self.root_index)
+
+    def node_bytes(self):
+        return sum(column.itemsize * len(column) for column in (self.kinds, self.first_child, self.next_sibling, self.tokens))
+
+    def token_bytes(self):
+        return sum(column.itemsize * len(column) for column in (self.token_lines, self.token_columns))
+
+class FlatASTBuilder:
+    # Mesma interface do ASTBuilder do parser descendente recursivo; devolve índices de nós
+    def __init__(self):
+        self.ast = FlatAST()
+        self.constant_index = {}
+
+    def _constant(self, value):
+        key = (type(value), value)
+        index = self.constant_index.get(key)
+        if index is None:
+            index = self.constant_index[key] = len(self.ast.constants)
+            self.ast.constants.append(value)
+        return index
+
+    def _token(self, token):
+        if token is None:
+            return -1
+        index = token.tokenIndex
+        lines, columns = self.ast.token_lines, self.ast.token_columns
+        if index >= len(lines):
+            zeros = array('I', bytes((index + 1 - len(lines)) * lines.itemsize))
+            lines.extend(zeros)
+            columns.extend(zeros)
+        lines[index] = token.line
+        columns[index] = token.column
+        return index
+
+    def _node(self, kind, token, children=(), constant=None):
+        ast = self.ast
+        index = len(ast.kinds)
+        ast.kinds.append(kind)
+        ast.next_sibling.append(-1)
+        ast.tokens.append(self._token(token))
+        if constant is not None:
+            ast.first_child.append(self._constant(constant))
+            return index
+        ast.first_child.append(children[0] if children else -1)
+        next_sibling = ast.next_sibling
+        for previous, child in zip(children, children[1:]):
+            next_sibling[previous] = child
+        return index
+
+    def program(self, start, statements):
+        self.ast.root_index = self._node(PROGRAM, start, statements)
+        return self.ast
+
+    def var_decl(self, name, var_type, value):
+        children = (self._node(NAME, name, constant=name.text), self._node(TYPE, var_type, constant=var_type.text), value)
+        return self._node(VAR_DECL, name, children)
+
+    def assign(self, name, value):
+        return self._node(ASSIGN, name, (self._node(NAME, name, constant=name.text), value))
+
+    def read(self, name):
+        return self._node(READ, name, constant=name.text)
+
+    def print(self, keyword, value):
+        return self._node(PRINT, keyword, (value,))
+
+    def if_(self, keyword, condition, then_body, else_body):
+        children = [condition, self._node(BLOCK, None, then_body)]
+        if else_body is not None:
+            children.append(self._node(BLOCK, None, else_body))
+        return self._node(IF, keyword, children)
+
+    def while_(self, keyword, condition, body):
+        return self._node(WHILE, keyword, (condition, self._node(BLOCK, None, body)))
+
+    def pog(self, keyword):
+        return self._node(POG, keyword)
+
+    def binary(self, ops, operands):
+        # Cadeia n-ária vira nós binários aninhados à esquerda (um por operador)
+        left = operands[0]
+        for op, right in zip(ops, operands[1:]):
+            left = self._node(OPERATOR_KINDS[op.text], op, (left, right))
+        return left
+
+    def unary(self, op, operand):
+        return self._node(NOT, op, (operand,))
+
+    def int_literal(self, token):
+        return self._node(INT, token, constant=int(token.text))
+
+    def string_literal(self, token):
+        return self._node(STRING, token, constant=token.text)
+
+    def name(self, token):
+        return self._node(NAME, token, constant=token.text)
+
+# Visões com a interface dos nós de src/ast/nodes.py
+class FlatView:
+    __slots__ = ('tree', 'index')
+    visit_method = None
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        VISITABLE.append(cls)
+
+    def accept(self, visitor):
+        return getattr(visitor, self.visit_method)(self)
+
+    @property
+    def line(self):
+        return self.tree.position(self.index)[0]
+
+    @property
+    def column(self):
+        return self.tree.position(self.index)[1]
+
+    def _child(self, position):
+        return self.tree.view(self.tree.child(self.index, position))
+
+    def _block(self, position):
+        block = self.tree.child(self.index, position)
+        if block == -1:
+            return None
+        return [self.tree.view(child) for child in self.tree.children(block)]
+
+    def _child_constant(self, position):
+        return self.tree.constant(self.tree.child(self.index, position))
+
+class FlatProgram(FlatView):
+    __slots__ = ()
+    visit_method = 'visitProgram'
+
+    @property
+    def statements(self):
+        tree = self.tree
+        return (tree.view(child) for child in tree.children(self.index))
+
+class FlatVarDecl(FlatView):
+    __slots__ = ()
+    visit_method = 'visitVarDecl'
+    name = property(lambda self: self._child_constant(0))
+    var_type = property(lambda self: self._child_constant(1))
+    value = property(lambda self: self._child(2))
+
+class FlatAssign(FlatView):
+    __slots__ = ()
+    visit_method = 'visitAssign'
+    name = property(lambda self: self._child_constant(0))
+    value = property(lambda self: self._child(1))
+
+class FlatRead(FlatView):
+    __slots__ = ()
+    visit_method = 'visitRead'
+    name = property(lambda self: self.tree.constant(self.index))
+
+class FlatPrint(FlatView):
+    __slots__ = ()
+    visit_method = 'visitPrint'
+    value = property(lambda self: self._child(0))
+
+class FlatIf(FlatView):
+    __slots__ = ()
+    visit_method = 'visitIf'
+    condition = property(lambda self: self._child(0))
+    then_body = property(lambda self: self._block(1))
+    else_body = property(lambda self: self._block(2))
+
+class FlatWhile(FlatView):
+    __slots__ = ()
+    visit_method = 'visitWhile'
+    condition = property(lambda self: self._child(0))
+    body = property(lambda self: self._block(1))
+
+class FlatPog(FlatView):
+    __slots__ = ()
+    visit_method = 'visitPog'
+
+class FlatBinaryExpr(FlatView):
+    # Sempre um operador só: a cadeia n-ária foi aninhada à esquerda no builder
+    __slots__ = ()
+    visit_method = 'visitBinaryExpr'
+    ops = property(lambda self: [OPERATORS[self.tree.kinds[self.index] - BINARY]])
+    positions = property(lambda self: [self.tree.position(self.index)])
+    operands = property(lambda self: [self._child(0), self._child(1)])
+
+class FlatUnaryExpr(FlatView):
+    __slots__ = ()
+    visit_method = 'visitUnaryExpr'
+    op = '!'
+    operand = property(lambda self: self._child(0))
+
+class FlatIntLiteral(FlatView):
+    __slots__ = ()
+    visit_method = 'visitIntLiteral'
+    value = property(lambda self: self.tree.constant(self.index))
+
+class FlatStringLiteral(FlatView):
+    __slots__ = ()
+    visit_method = 'visitStringLiteral'
+    text = property(lambda self: self.tree.constant(self.index))
+    value = property(lambda self: self.text[1:-1])
+
+class FlatName(FlatView):
+    __slots__ = ()
+    visit_method = 'visitName'
+    name = property(lambda self: self.tree.constant(self.index))
+
+VIEWS = {
+    PROGRAM: FlatProgram, VAR_DECL: FlatVarDecl, ASSIGN: FlatAssign, READ: FlatRead,
+    PRINT: FlatPrint, IF: FlatIf, WHILE: FlatWhile, POG: FlatPog, NOT: FlatUnaryExpr,
+    INT: FlatIntLiteral, STRING: FlatStringLiteral, NAME: FlatName, BINARY: FlatBinaryExpr,
+}
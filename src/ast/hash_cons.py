@@ -0,0 +1,115 @@
+import sys
+from src.ast.nodes import BinaryExpr, UnaryExpr, IntLiteral, Name
+
+# Hash-consing das expressões da AST tipada: cada subárvore recebe o id da sua forma
+# estrutural (operador + ids das formas dos filhos, ou o lexema de uma folha), e formas iguais
+# recebem o mesmo id. A tabela guarda cada forma uma única vez, com as variáveis que ela lê e o
+# número de nós que uma visita da subárvore percorre. As fases usam o id como chave de memo:
+# SemanticAnalyzer guarda o tipo já inferido e TACGenerator a temporária que já tem o valor.
+#
+# Os nós não são trocados pela instância canônica porque carregam a posição no fonte, que as
+# mensagens de erro usam; cada nó aponta para a forma em shape_of. Por isso a tabela não
+# economiza memória da AST: ela é memória a mais (table_bytes), paga pelos memos.
+#
+# Uma BinaryExpr n-ária 'a + b + c' é internada como os prefixos aninhados à esquerda
+# ((a + b) + c), então 'a + b' sozinho e o prefixo de 'a + b + c' têm a mesma forma.
+
+INT, STRING, NAME = 'int', 'str', 'name'
+NO_NAMES = frozenset()
+
+# Campos dos comandos que guardam uma expressão e os que guardam blocos
+EXPRESSION_FIELDS = ('value', 'condition')
+BLOCK_FIELDS = ('statements', 'then_body', 'else_body', 'body')
+
+class ExpressionTable:
+    def __init__(self):
+        self.ids = {}       # forma -> id
+        self.shapes = []    # id -> forma
+        self.names = []     # id -> variáveis lidas pela subárvore
+        self.sizes = []     # id -> nós visitados numa visita da subárvore
+        self.shape_of = {}  # nó de expressão -> id da forma, na ordem em que foram internados
+        self.prefixes = {}  # BinaryExpr -> id da forma de cada prefixo (um por operador)
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def intern_shape(self, shape, names, size):
+        shape_id = self.ids.get(shape)
+        if shape_id is None:
+            shape_id = self.ids[shape] = len(self.shapes)
+            self.shapes.append(shape)
+            self.names.append(names)
+            self.sizes.append(size)
+        return shape_id
+
+    def intern(self, expression):
+        # Pós-ordem com pilha explícita: os filhos são internados antes do pai
+        shape_of = self.shape_of
+        intern_shape = self.intern_shape
+        sizes = self.sizes
+        names_of = self.names
+        stack = [(expression, False)]
+        while stack:
+            node, children_done = stack.pop()
+            cls = type(node)
+            if cls is BinaryExpr:
+                if not children_done:
+                    stack.append((node, True))
+                    stack.extend((operand, False) for operand in node.operands)
+                    continue
+                left = shape_of[node.operands[0]]
+                prefixes = []
+                size = 1 + sizes[left]
+                names = names_of[left]
+                for op, operand in zip(node.ops, node.operands[1:]):
+                    right = shape_of[operand]
+                    size += sizes[right]
+                    if not names_of[right] <= names:
+                        names = names | names_of[right]
+                    left = intern_shape((op, left, right), names, size)
+                    prefixes.append(left)
+                self.prefixes[node] = prefixes
+                shape_of[node] = left
+            elif cls is UnaryExpr:
+                if not children_done:
+                    stack.append((node, True))
+                    stack.append((node.operand, False))
+                    continue
+                operand = shape_of[node.operand]
+                shape_of[node] = intern_shape((node.op, operand), names_of[operand], 1 + sizes[operand])
+            elif cls is Name:
+                shape_of[node] = intern_shape((NAME, node.name), frozenset((node.name,)), 1)
+            elif cls is IntLiteral:
+                shape_of[node] = intern_shape((INT, node.value), NO_NAMES, 1)
+            else:
+                shape_of[node] = intern_shape((STRING, node.text), NO_NAMES, 1)
+        return shape_of[expression]
+
+    def intern_program(self, program):
+        # Interna a expressão de cada comando (declaração, atribuição, println, condições)
+        stack = [program]
+        while stack:
+            statement = stack.pop()
+            for field in EXPRESSION_FIELDS:
+                expression = getattr(statement, field, None)
+                if expression is not None:
+                    self.intern(expression)
+            for field in BLOCK_FIELDS:
+                block = getattr(statement, field, None)
+                if block is not None:
+                    stack.extend(block)
+        return self
+
+    def repetition_report(self):
+        # (nós de expressão, nós repetidos): um nó é repetido quando outro nó internado antes
+        # já tinha a mesma forma
+        nodes = len(self.shape_of)
+        return nodes, nodes - len(set(self.shape_of.values()))
+
+    def table_bytes(self):
+        # Memória da própria tabela (dict forma -> id, formas, listas paralelas e os dicts que
+        # ligam os nós às formas)
+        size = sys.getsizeof(self.ids) + sys.getsizeof(self.shapes) + sys.getsizeof(self.names) + sys.getsizeof(self.sizes)
+        size += sys.getsizeof(self.shape_of) + sys.getsizeof(self.prefixes)
+        size += sum(sys.getsizeof(prefixes) for prefixes in self.prefixes.values())
+        return size + sum(sys.getsizeof(shape) for shape in self.shapes)
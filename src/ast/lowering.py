@@ -0,0 +1,134 @@
+from antlr4.tree.Tree import TerminalNode
+from src.lexer.poglinParser import poglinParser
+from src.lexer.poglinVisitor import poglinVisitor
+from src.ast.nodes import (Program, VarDecl, Assign, Read, Print, If, While, Pog,
+                           BinaryExpr, UnaryExpr, IntLiteral, StringLiteral, Name)
+
+T = poglinParser
+
+class ParseTreeLowering(poglinVisitor):
+    # Converte a árvore de parse do ANTLR na AST tipada de src/ast/nodes.py, numa única
+    # passada. Depois disso as fases (semântica, TAC, visualização) só enxergam a AST e a
+    # árvore de parse e os tokens podem ser liberados.
+    # Como nos NodeVisitor, visit() despacha por uma tabela classe do contexto -> método montada
+    # no construtor, em vez do accept() dos contextos gerados (hasattr + getattr por visita).
+    # Blocos e expressões aninhados são convertidos com pilhas explícitas, sem recursão.
+    def __init__(self):
+        self.dispatch = {
+            poglinParser.ProgramContext: self.visitProgram,
+            poglinParser.StatementContext: self.visitStatement,
+            poglinParser.BlockContext: self.visitBlock,
+        }
+        for context in (poglinParser.ExpressionContext, poglinParser.LogicalOrExpressionContext,
+                        poglinParser.LogicalAndExpressionContext, poglinParser.EqualityExpressionContext,
+                        poglinParser.RelationalExpressionContext, poglinParser.AdditiveExpressionContext,
+                        poglinParser.MultiplicativeExpressionContext, poglinParser.UnaryExpressionContext,
+                        poglinParser.PrimaryContext):
+            self.dispatch[context] = self.lower_expression
+
+    def visit(self, tree):
+        return self.dispatch[type(tree)](tree)
+
+    def visitProgram(self, ctx: poglinParser.ProgramContext):
+        start = ctx.START().symbol
+        return Program(self.lower_statements(ctx.statement()), start.line, start.column)
+
+    def lower_statements(self, statement_contexts):
+        # Os corpos de if/while nascem como listas vazias e entram em pending com os
+        # contextos dos seus comandos; são preenchidos depois, no lugar
+        statements = []
+        pending = [(statements, statement_contexts)]
+        while pending:
+            target, contexts = pending.pop()
+            for statement in contexts:
+                target.append(self.visitStatement(statement, pending))
+        return statements
+
+    def visitBlock(self, ctx: poglinParser.BlockContext):
+        return self.lower_statements(ctx.statement())
+
+    def visitStatement(self, ctx: poglinParser.StatementContext, pending=None):
+        # pending: (lista, contextos) dos blocos ainda por converter (ver lower_statements)
+        if pending is None:
+            return self.lower_statements([ctx])[0]
+        keyword = ctx.getChild(0).symbol
+        kind = keyword.type
+        if kind == T.VAR:
+            name = ctx.ID().symbol
+            return VarDecl(name.text, ctx.type_().getText(), self.lower_expression(ctx.expression()), name.line, name.column)
+        if kind == T.ID:
+            if ctx.READLINE() is not None:
+                return Read(keyword.text, keyword.line, keyword.column)
+            return Assign(keyword.text, self.lower_expression(ctx.expression()), keyword.line, keyword.column)
+        if kind == T.PRINTLN:
+            return Print(self.lower_expression(ctx.expression()), keyword.line, keyword.column)
+        if kind == T.IF:
+            then_body = []
+            pending.append((then_body, ctx.thenBlock.statement()))
+            else_body = None
+            if ctx.elseBlock is not None:
+                else_body = []
+                pending.append((else_body, ctx.elseBlock.statement()))
+            return If(self.lower_expression(ctx.expression()), then_body, else_body, keyword.line, keyword.column)
+        if kind == T.WHILE:
+            body = []
+            pending.append((body, ctx.body.statement()))
+            return While(self.lower_expression(ctx.expression()), body, keyword.line, keyword.column)
+        return Pog(keyword.line, keyword.column)
+
+    def lower_expression(self, ctx):
+        # Pilha explícita em vez de recursão: cada entrada de pending é um contexto ainda por
+        # converter e o lugar do resultado, uma posição dos operandos de um BinaryExpr ou, com
+        # índice None, o operando de um UnaryExpr; os nós nascem com esses lugares vazios
+        root = [None]
+        pending = [(root, 0, ctx)]
+        while pending:
+            target, index, ctx = pending.pop()
+            # Regras de repasse (expression -> logicalOr -> ... -> unary -> primary sem
+            # operador) são descidas aqui num laço, sem uma visita por nível
+            while True:
+                children = ctx.children
+                if len(children) != 1:
+                    break
+                child = children[0]
+                if isinstance(child, TerminalNode): # primary: INT | STRING | ID
+                    break
+                ctx = child
+
+            first = children[0]
+            if len(children) == 1:
+                node = self.lower_atom(first.symbol)
+            elif isinstance(first, TerminalNode):
+                op = first.symbol
+                if op.type != T.NOT: # LPAREN expression RPAREN: o resultado vai para o mesmo lugar
+                    pending.append((target, index, children[1]))
+                    continue
+                node = UnaryExpr(op.text, None, op.line, op.column)
+                pending.append((node, None, children[1]))
+            else:
+                # operando (op operando)*: um nível de precedência vira um BinaryExpr n-ário
+                ops, positions = [], []
+                for position in range(1, len(children), 2):
+                    op = children[position].symbol
+                    ops.append(op.text)
+                    positions.append((op.line, op.column))
+                operands = [None] * (len(ops) + 1)
+                node = BinaryExpr(ops, positions, operands)
+                for position, operand in enumerate(children[::2]):
+                    pending.append((operands, position, operand))
+
+            if index is None:
+                target.operand = node
+            else:
+                target[index] = node
+        return root[0]
+
+    def lower_atom(self, token):
+        if token.type == T.INT:
+            return IntLiteral(int(token.text), token.line, token.column)
+        if token.type == T.STRING:
+            return StringLiteral(token.text, token.line, token.column)
+        return Name(token.text, token.line, token.column)
+
+def lower(parse_tree):
+    return ParseTreeLowering().visit(parse_tree)
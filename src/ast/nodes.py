@@ -0,0 +1,202 @@
+# Nós da AST tipada do Poglin. Cada nó guarda só o que as fases usam (nomes, literais,
+# operadores e posição no fonte) e implementa accept(visitor) como os contextos do ANTLR.
+# O parser descendente recursivo gera esta AST direto; a árvore de parse do ANTLR é
+# convertida nela por src/ast/lowering.py. As fases (semântica, TAC, visualização) só
+# visitam a AST.
+
+# Classes visitáveis (nós tipados e visões da FlatAST), registradas na definição para que
+# cada NodeVisitor monte sua tabela de despacho no construtor
+VISITABLE = []
+
+class Node:
+    __slots__ = ('line', 'column')
+
+    def __init__(self, line, column):
+        self.line = line
+        self.column = column
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visit_method = 'visit' + cls.__name__ # VarDecl -> visitor.visitVarDecl
+        VISITABLE.append(cls)
+
+    def accept(self, visitor):
+        return getattr(visitor, self.visit_method)(self)
+
+class NodeVisitor:
+    # Despacho por tabela: no construtor, cada classe de nó é ligada ao método visitXxx (e ao
+    # gerador walkXxx, se houver) desta instância. visit() é um acesso a dict e uma chamada,
+    # sem o accept() do nó e o getattr por nome a cada visita.
+    def __init__(self):
+        self.dispatch = {}
+        self.walkers = {}
+        for cls in VISITABLE:
+            if hasattr(self, cls.visit_method):
+                self._register(cls)
+
+    def _register(self, cls):
+        # Também chamado para classes definidas depois do construtor; sem visitXxx, levanta
+        # AttributeError como o accept()
+        method = self.dispatch[cls] = getattr(self, cls.visit_method)
+        walker = getattr(self, 'walk' + cls.visit_method[5:], None)
+        if walker is not None:
+            self.walkers[cls] = walker
+        return method
+
+    def visit(self, node):
+        try:
+            method = self.dispatch[type(node)]
+        except KeyError:
+            method = self._register(type(node))
+        return method(node)
+
+    def walk(self, node):
+        # Mesma visita sem recursão, com pilha explícita: para nós com filhos a fase define
+        # um gerador walkXxx que faz 'resultado = yield filho' onde visitXxx chamaria
+        # self.visit(filho); nós sem walkXxx (folhas) usam o próprio visitXxx. Aguenta
+        # aninhamentos (if/else, parênteses) muito além do limite de recursão do Python.
+        dispatch = self.dispatch
+        walkers = self.walkers
+        stack = []
+        result = None
+        while True:
+            cls = type(node)
+            if cls not in dispatch:
+                self._register(cls)
+            walker = walkers.get(cls)
+            if walker is None:
+                result = dispatch[cls](node)
+            else:
+                stack.append(walker(node))
+                result = None
+            while stack:
+                try:
+                    node = stack[-1].send(result)
+                    break
+                except StopIteration as finished:
+                    stack.pop()
+                    result = finished.value
+            else:
+                return result
+
+# Comandos
+class Program(Node):
+    __slots__ = ('statements',)
+
+    def __init__(self, statements, line=0, column=0):
+        super().__init__(line, column)
+        self.statements = statements
+
+class VarDecl(Node):
+    # var name : var_type = value;   (posição do ID)
+    __slots__ = ('name', 'var_type', 'value')
+
+    def __init__(self, name, var_type, value, line, column):
+        super().__init__(line, column)
+        self.name = name
+        self.var_type = var_type
+        self.value = value
+
+class Assign(Node):
+    # name = value;   (posição do ID)
+    __slots__ = ('name', 'value')
+
+    def __init__(self, name, value, line, column):
+        super().__init__(line, column)
+        self.name = name
+        self.value = value
+
+class Read(Node):
+    # name = readLine();   (posição do ID)
+    __slots__ = ('name',)
+
+    def __init__(self, name, line, column):
+        super().__init__(line, column)
+        self.name = name
+
+class Print(Node):
+    # println(value);
+    __slots__ = ('value',)
+
+    def __init__(self, value, line, column):
+        super().__init__(line, column)
+        self.value = value
+
+class If(Node):
+    # else_body é None quando não há 'else' (diferente de um 'else { }' vazio)
+    __slots__ = ('condition', 'then_body', 'else_body')
+
+    def __init__(self, condition, then_body, else_body, line, column):
+        super().__init__(line, column)
+        self.condition = condition
+        self.then_body = then_body
+        self.else_body = else_body
+
+class While(Node):
+    __slots__ = ('condition', 'body')
+
+    def __init__(self, condition, body, line, column):
+        super().__init__(line, column)
+        self.condition = condition
+        self.body = body
+
+class Pog(Node):
+    __slots__ = ()
+
+# Expressões
+class BinaryExpr(Node):
+    # Nó n-ário para uma sequência de operadores do mesmo nível de precedência, associativa
+    # à esquerda: operands[0] ops[0] operands[1] ops[1] operands[2] ...
+    # positions[i] é (linha, coluna) de ops[i]; a posição do nó é a do primeiro operador.
+    __slots__ = ('ops', 'positions', 'operands')
+
+    def __init__(self, ops, positions, operands):
+        super().__init__(*positions[0])
+        self.ops = ops
+        self.positions = positions
+        self.operands = operands
+
+class UnaryExpr(Node):
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, op, operand, line, column):
+        super().__init__(line, column)
+        self.op = op
+        self.operand = operand
+
+class IntLiteral(Node):
+    __slots__ = ('value',)
+
+    def __init__(self, value, line, column):
+        super().__init__(line, column)
+        self.value = value
+
+class StringLiteral(Node):
+    # text mantém as aspas, como o lexema do token STRING
+    __slots__ = ('text',)
+
+    def __init__(self, text, line, column):
+        super().__init__(line, column)
+        self.text = text
+
+    @property
+    def value(self):
+        return self.text[1:-1]
+
+class Name(Node):
+    __slots__ = ('name',)
+
+    def __init__(self, name, line, column):
+        super().__init__(line, column)
+        self.name = name
+
+# Operadores binários por nível de precedência (1 = menor), na ordem da gramática:
+# logicalOr, logicalAnd, equality, relational, additive, multiplicative
+BINARY_OPERATORS = {
+    '||': 1,
+    '&&': 2,
+    '==': 3, '!=': 3,
+    '<': 4, '<=': 4, '>': 4, '>=': 4,
+    '+': 5, '-': 5,
+    '*': 6, '/': 6,
+}
@@ -73,14 +73,23 @@ class LLVMGenerator:
         else:
             raise ValueError(f"Tipo Poglin desconhecido: {poglin_type}")
 
-    def _ensure_variable_allocated(self, name):
+    def _symbol_type(self, name, symbol_id=None):
+        # Tipo Poglin da variável: pelo id do operando no array de símbolos ou, sem id, pelo
+        # símbolo visível com esse nome
+        if not self.symbol_table:
+            return None
+        if symbol_id is None:
+            symbol_id = self.symbol_table.lookup(name)
+            if symbol_id is None:
+                return None
+        return self.symbol_table.types[symbol_id]
+
+    def _ensure_variable_allocated(self, name, symbol_id=None):
         if name not in self.variables:
             guessed_type = self.i32  # default Int
-            if self.symbol_table:
-                for scope in self.symbol_table.scopes:
-                    if name in scope:
-                        guessed_type = self._get_llvm_type(scope[name])
-                        break
+            var_type = self._symbol_type(name, symbol_id)
+            if var_type is not None:
+                guessed_type = self._get_llvm_type(var_type)
             alloca = self.builder.alloca(guessed_type, name=f"var_{name}")
             self.variables[name] = alloca
         return self.variables[name]
@@ -114,7 +123,7 @@ class LLVMGenerator:
 
             return self.builder.gep(global_string, [ir.Constant(self.i32, 0), ir.Constant(self.i32, 0)])
         else:
-            var_alloca = self._ensure_variable_allocated(operand.value)
+            var_alloca = self._ensure_variable_allocated(operand.value, operand.symbol_id)
             return self.builder.load(var_alloca, name=f"{operand.value}_val")
 
     def generate(self):
@@ -153,16 +162,15 @@ class LLVMGenerator:
             for name, var_type in self.symbol_table.global_snapshot.items():
                 self._ensure_variable_allocated(name)
         else:
-            for scope in self.symbol_table.scopes:
-                for name, var_type in scope.items():
-                    self._ensure_variable_allocated(name)
+            for name in self.symbol_table.all():
+                self._ensure_variable_allocated(name)
 
     def _generate_llvm_for_tac_instruction(self, instr: TACInstruction):
         op = instr.opcode
 
         if op == "ASSIGN":
             value = self._get_llvm_value(instr.src1)
-            alloca = self._ensure_variable_allocated(instr.dest.value)
+            alloca = self._ensure_variable_allocated(instr.dest.value, instr.dest.symbol_id)
             self.builder.store(value, alloca)
 
         elif op == "ADD":
@@ -179,13 +187,7 @@ class LLVMGenerator:
             if isinstance(src.value, int):
                 is_int = True
             else:
-                var_type = None
-                if self.symbol_table:
-                    for scope in self.symbol_table.scopes:
-                        if src.value in scope:
-                            var_type = scope[src.value]
-                            break
-                is_int = (var_type == "Int")
+                is_int = (self._symbol_type(src.value, src.symbol_id) == "Int")
 
             fmt_global = self.int_fmt_nl if is_int else self.str_fmt_nl
             fmt_ptr = self.builder.gep(fmt_global, [ir.Constant(self.i32, 0), ir.Constant(self.i32, 0)])
@@ -0,0 +1,264 @@
+from src.semantic.semantic_analyzer import SemanticAnalyzer, INT, STRING, TYPE_TAGS
+from src.intermediario.tac_generator import TACGenerator, BINARY_OPCODES
+from src.intermediario.tac_classes import TACOperand
+
+# Semântica e TAC numa passada só (--fused): cada nó é visitado uma vez, faz as verificações
+# do SemanticAnalyzer e emite as mesmas instruções, na mesma ordem, do TACGenerator. Cada nome
+# é resolvido uma vez (o id do símbolo dá o tipo e vai no operando). A visita de uma expressão
+# devolve o operando TAC e deixa o tipo em expr_type. Com qualquer erro semântico o TAC
+# emitido é descartado.
+#
+# Emissão, temporárias e rótulos vêm de um TACGenerator próprio (sem hash-consing).
+
+class FusedGenerator(SemanticAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.tac = TACGenerator()
+        self.emit = self.tac.emit
+        self.new_temp = self.tac.new_temp
+        self.new_label = self.tac.new_label
+        self.expr_type = None
+
+    def get_tac(self):
+        return self.tac.get_tac()
+
+    def finish(self):
+        self.symbol_table.global_snapshot = self.symbol_table.current_scope()
+        if self.errors:
+            self.tac.instructions = []
+        return len(self.errors) == 0
+
+    def declared(self, node):
+        # Operando da variável declarada; None se a declaração falhou (já reportado)
+        if self.declare_variable(node.name, node.var_type, node.line, node.column) is None:
+            return None
+        return TACOperand(node.name, symbol_id=self.symbol_table.lookup(node.name))
+
+    def assignment_target(self, node):
+        # (operando, tag do tipo) da variável que recebe a atribuição; None se não declarada
+        symbol_id = self.symbol_table.lookup(node.name)
+        if symbol_id is None:
+            self.resolve_assignment_target(node.name, node.line, node.column)
+            return None
+        return TACOperand(node.name, symbol_id=symbol_id), TYPE_TAGS[self.symbol_table.types[symbol_id]]
+
+    # Visita da AST tipada (src/ast/nodes.py)
+    def visitProgram(self, node):
+        self.symbol_table.enter_scope()
+        self.emit("LABEL", self.new_label())
+        self.visit_block(node.statements)
+        self.emit("EXIT")
+        return self.finish()
+
+    def visitVarDecl(self, node):
+        dest = self.declared(node)
+        if dest is None:
+            return None
+        value = self.visit(node.value)
+        self.check_initialization(node.name, TYPE_TAGS[self.symbol_table.types[dest.symbol_id]], self.expr_type, node.value, node.line, node.column)
+        self.emit("ASSIGN", dest, value)
+        return None
+
+    def visitRead(self, node):
+        self.check_read(node.name, node.line, node.column)
+        self.emit("READ", TACOperand(node.name, symbol_id=self.symbol_table.lookup(node.name)))
+        return None
+
+    def visitAssign(self, node):
+        target = self.assignment_target(node)
+        if target is None:
+            return None
+        dest, var_type = target
+        value = self.visit(node.value)
+        self.check_assignment(node.name, var_type, self.expr_type, node.value, node.line, node.column)
+        self.emit("ASSIGN", dest, value)
+        return None
+
+    def visitPrint(self, node):
+        self.emit("PRINT", self.visit(node.value))
+        return None
+
+    def visitIf(self, node):
+        cond_operand = self.visit(node.condition)
+        self.check_condition('if', self.expr_type, node.condition)
+
+        then_label = self.new_label()
+        else_label = self.new_label()
+        end_if_label = self.new_label()
+
+        self.emit("IF_TRUE", cond_operand, then_label)
+        self.emit("GOTO", else_label)
+
+        self.emit("LABEL", then_label)
+        self.symbol_table.enter_scope()
+        self.visit_block(node.then_body)
+        self.exit_scope()
+        self.emit("GOTO", end_if_label)
+
+        self.emit("LABEL", else_label)
+        if node.else_body is not None:
+            self.symbol_table.enter_scope()
+            self.visit_block(node.else_body)
+            self.exit_scope()
+
+        self.emit("LABEL", end_if_label)
+        return None
+
+    def visitWhile(self, node):
+        loop_start_label = self.new_label()
+        loop_body_label = self.new_label()
+        loop_end_label = self.new_label()
+
+        self.emit("LABEL", loop_start_label)
+        cond_operand = self.visit(node.condition)
+        self.check_condition('while', self.expr_type, node.condition)
+        self.emit("IF_TRUE", cond_operand, loop_body_label)
+        self.emit("GOTO", loop_end_label)
+
+        self.emit("LABEL", loop_body_label)
+        self.symbol_table.enter_scope()
+        self.visit_block(node.body)
+        self.exit_scope()
+        self.emit("GOTO", loop_start_label)
+
+        self.emit("LABEL", loop_end_label)
+        return None
+
+    def visitPog(self, node):
+        self.emit("POG_OP")
+        return None
+
+    def visitBinaryExpr(self, node):
+        left_operand = self.visit(node.operands[0])
+        left_type = self.expr_type
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            right_operand = self.visit(operand)
+            left_type = self.check_binary(op, left_type, self.expr_type, operand, line, column)
+            temp = self.new_temp()
+            self.emit(BINARY_OPCODES[op], temp, left_operand, right_operand)
+            left_operand = temp
+        self.expr_type = left_type
+        return left_operand
+
+    def visitUnaryExpr(self, node):
+        operand = self.visit(node.operand)
+        self.expr_type = self.check_not(node.op, self.expr_type, node.line, node.column)
+        temp = self.new_temp()
+        self.emit("NOT", temp, operand)
+        return temp
+
+    def visitIntLiteral(self, node):
+        self.expr_type = INT
+        return TACOperand(node.value)
+
+    def visitStringLiteral(self, node):
+        self.expr_type = STRING
+        return TACOperand(node.text)
+
+    def visitName(self, node):
+        symbol_id = self.symbol_table.lookup(node.name)
+        if symbol_id is None:
+            self.expr_type = self.resolve_name(node.name, node.line, node.column)
+        else:
+            self.expr_type = TYPE_TAGS[self.symbol_table.types[symbol_id]]
+        return TACOperand(node.name, symbol_id=symbol_id)
+
+    # Versões sem recursão (NodeVisitor.walk): mesmas verificações e mesma sequência de TAC
+    def walkProgram(self, node):
+        self.symbol_table.enter_scope()
+        self.emit("LABEL", self.new_label())
+        for statement in node.statements:
+            yield statement
+        self.emit("EXIT")
+        return self.finish()
+
+    def walkVarDecl(self, node):
+        dest = self.declared(node)
+        if dest is None:
+            return None
+        value = yield node.value
+        self.check_initialization(node.name, TYPE_TAGS[self.symbol_table.types[dest.symbol_id]], self.expr_type, node.value, node.line, node.column)
+        self.emit("ASSIGN", dest, value)
+        return None
+
+    def walkAssign(self, node):
+        target = self.assignment_target(node)
+        if target is None:
+            return None
+        dest, var_type = target
+        value = yield node.value
+        self.check_assignment(node.name, var_type, self.expr_type, node.value, node.line, node.column)
+        self.emit("ASSIGN", dest, value)
+        return None
+
+    def walkPrint(self, node):
+        self.emit("PRINT", (yield node.value))
+        return None
+
+    def walkIf(self, node):
+        cond_operand = yield node.condition
+        self.check_condition('if', self.expr_type, node.condition)
+
+        then_label = self.new_label()
+        else_label = self.new_label()
+        end_if_label = self.new_label()
+
+        self.emit("IF_TRUE", cond_operand, then_label)
+        self.emit("GOTO", else_label)
+
+        self.emit("LABEL", then_label)
+        self.symbol_table.enter_scope()
+        for statement in node.then_body:
+            yield statement
+        self.exit_scope()
+        self.emit("GOTO", end_if_label)
+
+        self.emit("LABEL", else_label)
+        if node.else_body is not None:
+            self.symbol_table.enter_scope()
+            for statement in node.else_body:
+                yield statement
+            self.exit_scope()
+
+        self.emit("LABEL", end_if_label)
+        return None
+
+    def walkWhile(self, node):
+        loop_start_label = self.new_label()
+        loop_body_label = self.new_label()
+        loop_end_label = self.new_label()
+
+        self.emit("LABEL", loop_start_label)
+        cond_operand = yield node.condition
+        self.check_condition('while', self.expr_type, node.condition)
+        self.emit("IF_TRUE", cond_operand, loop_body_label)
+        self.emit("GOTO", loop_end_label)
+
+        self.emit("LABEL", loop_body_label)
+        self.symbol_table.enter_scope()
+        for statement in node.body:
+            yield statement
+        self.exit_scope()
+        self.emit("GOTO", loop_start_label)
+
+        self.emit("LABEL", loop_end_label)
+        return None
+
+    def walkBinaryExpr(self, node):
+        left_operand = yield node.operands[0]
+        left_type = self.expr_type
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            right_operand = yield operand
+            left_type = self.check_binary(op, left_type, self.expr_type, operand, line, column)
+            temp = self.new_temp()
+            self.emit(BINARY_OPCODES[op], temp, left_operand, right_operand)
+            left_operand = temp
+        self.expr_type = left_type
+        return left_operand
+
+    def walkUnaryExpr(self, node):
+        operand = yield node.operand
+        self.expr_type = self.check_not(node.op, self.expr_type, node.line, node.column)
+        temp = self.new_temp()
+        self.emit("NOT", temp, operand)
+        return temp
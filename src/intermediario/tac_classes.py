@@ -1,8 +1,9 @@
 class TACOperand:
-    def __init__(self, value, is_temp=False, is_label=False):
+    def __init__(self, value, is_temp=False, is_label=False, symbol_id=None):
         self.value = value
         self.is_temp = is_temp
         self.is_label = is_label
+        self.symbol_id = symbol_id # Variáveis: id na tabela de símbolos (SymbolTable.names/types)
 
     def __str__(self):
         if self.is_temp:
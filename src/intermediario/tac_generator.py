@@ -1,17 +1,86 @@
-from src.lexer.poglinParser import poglinParser
-from src.lexer.poglinVisitor import poglinVisitor
 from src.intermediario.tac_classes import TACOperand, TACInstruction
+from src.ast.nodes import NodeVisitor
 
-class TACGenerator(poglinVisitor):
-    def __init__(self):
+# Opcode TAC de cada operador binário da AST tipada
+BINARY_OPCODES = {
+    '||': "OR", '&&': "AND",
+    '==': "EQ", '!=': "NEQ",
+    '<': "LT", '<=': "LTE", '>': "GT", '>=': "GTE",
+    '+': "ADD", '-': "SUB",
+    '*': "MUL", '/': "DIV",
+}
+
+# Instruções que encerram um bloco básico (ou começam outro, no caso de LABEL)
+BLOCK_BOUNDARIES = frozenset(("LABEL", "IF_TRUE", "GOTO", "EXIT"))
+
+class TACGenerator(NodeVisitor):
+    # expressions: ExpressionTable (src/ast/hash_cons.py) já internada. Com ela, uma expressão
+    # (ou prefixo de uma cadeia n-ária) cuja forma já foi calculada numa temporária do mesmo
+    # bloco básico reaproveita essa temporária, desde que nenhuma variável lida por ela tenha
+    # recebido atribuição ou readLine() no meio.
+    #
+    # dead: blocos mortos achados por IntervalAnalyzer (src/semantic/interval_analysis.py,
+    # --intervals). Um if com um ramo morto emite só o outro ramo, sem condição nem saltos, e um
+    # while com o corpo morto não emite nada.
+    def __init__(self, expressions=None, dead=None):
+        super().__init__()
         self.instructions = []
         self.temp_counter = 0
         self.label_counter = 0
         self.symbol_table = None # Será injetada do SemanticAnalyzer para info de tipos
+        self.expressions = expressions
+        self.available = {}          # id da forma -> temporária com o valor, no bloco atual
+        self.available_by_name = {}  # variável -> ids de forma em available que a leem
+        self.reused = 0
+        self.visits_avoided = 0
+        self.dead = dead or {}
 
     def set_symbol_table(self, symbol_table):
         self.symbol_table = symbol_table
 
+    # Resolução de nomes: refaz as declarações e escopos da análise semântica sobre a mesma
+    # tabela (SymbolTable.rewind), então cada operando de variável leva o id do símbolo que a
+    # semântica resolveu
+    def enter_program(self):
+        if self.symbol_table is not None:
+            self.symbol_table.rewind()
+            self.symbol_table.enter_scope()
+
+    def enter_scope(self):
+        if self.symbol_table is not None:
+            self.symbol_table.enter_scope()
+
+    def exit_scope(self):
+        if self.symbol_table is not None:
+            self.symbol_table.exit_scope()
+
+    def exit_inlined_scope(self):
+        # Um ramo emitido sem rótulos continua o bloco básico de fora: as temporárias
+        # disponíveis podem ter lido variáveis do escopo que termina
+        self.exit_scope()
+        self.available.clear()
+        self.available_by_name.clear()
+
+    def skip_dead(self, position):
+        # O replay dos símbolos continua depois do bloco morto, que não é percorrido
+        if self.symbol_table is not None:
+            self.symbol_table.seek(position)
+
+    def dead_block(self, node):
+        return self.dead.get((node.line, node.column)) if self.dead else None
+
+    def declared(self, node):
+        symbol_id = None if self.symbol_table is None else self.symbol_table.declare(node.name, node.var_type)
+        # O inicializador já lê o novo símbolo: temporárias que leram o nome sombreado deixam
+        # de valer antes de ele ser visitado, não só no ASSIGN
+        if self.available:
+            for shape_id in self.available_by_name.pop(node.name, ()):
+                self.available.pop(shape_id, None)
+        return TACOperand(node.name, symbol_id=symbol_id)
+
+    def variable(self, name):
+        return TACOperand(name, symbol_id=None if self.symbol_table is None else self.symbol_table.lookup(name))
+
     def new_temp(self):
         temp = f"_t{self.temp_counter}"
         self.temp_counter += 1
@@ -25,234 +94,308 @@ class TACGenerator(poglinVisitor):
     def emit(self, opcode, dest=None, src1=None, src2=None):
         instr = TACInstruction(opcode, dest, src1, src2)
         self.instructions.append(instr)
+        if self.available:
+            if opcode in BLOCK_BOUNDARIES:
+                self.available.clear()
+                self.available_by_name.clear()
+            elif opcode == "ASSIGN" or opcode == "READ":
+                for shape_id in self.available_by_name.pop(dest.value, ()):
+                    self.available.pop(shape_id, None)
         return instr
 
+    def reuse(self, shape_id):
+        temp = self.available.get(shape_id)
+        if temp is not None:
+            self.reused += 1
+            self.visits_avoided += self.expressions.sizes[shape_id]
+        return temp
+
+    def make_available(self, shape_id, temp):
+        self.available[shape_id] = temp
+        for name in self.expressions.names[shape_id]:
+            self.available_by_name.setdefault(name, []).append(shape_id)
+
+    def reusable_prefix(self, node):
+        # Maior prefixo da cadeia n-ária já calculado no bloco: (operadores já feitos, temporária)
+        if self.available:
+            prefixes = self.expressions.prefixes[node]
+            for index in range(len(prefixes) - 1, -1, -1):
+                temp = self.reuse(prefixes[index])
+                if temp is not None:
+                    return index + 1, temp
+        return 0, None
+
     def get_tac(self):
         return self.instructions
 
-    # Regras principais (visitam filhos e emitem TAC conforme a estrutura)
-    def visitProgram(self, ctx: poglinParser.ProgramContext):
+    # Regras principais sobre a AST tipada (src/ast/nodes.py): visitam filhos e emitem TAC
+    def visitProgram(self, node):
+        self.enter_program()
         program_start_label = self.new_label() # Etiqueta de inicio do programa
         self.emit("LABEL", program_start_label)
-        self.visitChildren(ctx)
+        self.visit_block(node.statements)
         self.emit("EXIT") # Instrução para finalizar o programa
         return None
 
-    def visitStatement(self, ctx: poglinParser.StatementContext):
-        if ctx.VAR(): # var ID : type = expression;
-            var_name = ctx.ID().getText()
-            expr_operand = self.visit(ctx.expression()) # Resultado da expressão de inicialização
-            self.emit("ASSIGN", TACOperand(var_name), expr_operand)
-            return None
+    def visit_block(self, statements):
+        for statement in statements:
+            self.visit(statement)
 
-        elif ctx.READLINE(): # ID = readLine();
-            var_name = ctx.ID().getText()
-            self.emit("READ", TACOperand(var_name))
-            return None
+    def visitVarDecl(self, node): # var ID : type = expression;
+        self.emit("ASSIGN", self.declared(node), self.visit(node.value))
+        return None
 
-        elif ctx.ID() and ctx.ASSIGN() and ctx.expression(): # ID = expression; (reatribuição)
-            var_name = ctx.ID().getText()
-            expr_operand = self.visit(ctx.expression()) # Resultado da expressão do lado direito
-            self.emit("ASSIGN", TACOperand(var_name), expr_operand)
-            return None
+    def visitRead(self, node): # ID = readLine();
+        self.emit("READ", self.variable(node.name))
+        return None
 
-        elif ctx.PRINTLN(): # println(expression);
-            expr_operand = self.visit(ctx.expression()) # Resultado da expressão a ser impressa
-            self.emit("PRINT", expr_operand)
-            return None
-            
-        elif ctx.IF(): # if (expression) { statements } else { statements }
-            cond_operand = self.visit(ctx.expression()) # Resultado da condição (booleano, 0/1)
-            
-            then_label = self.new_label()
-            else_label = self.new_label()
-            end_if_label = self.new_label()
-
-            self.emit("IF_TRUE", cond_operand, then_label) # Se verdadeira, salta para THEN
-            self.emit("GOTO", else_label) # Se falsa, salta para ELSE (ou fim se nao tiver ELSE)
-            
-            # Bloco THEN
-            self.emit("LABEL", then_label)
-            # A lógica de iteração sobre filhos para blocos é a mesma usada no SemanticAnalyzer e ASTGenerator
-            in_then_block = False
-            brace_balance = 0
-            for child in ctx.children:
-                if child == ctx.LBRACE(0): # Início do bloco THEN
-                    in_then_block = True
-                    brace_balance += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_balance == 1: # Fim do bloco THEN
-                    in_then_block = False
-                    brace_balance -= 1
-                    break
-                if in_then_block and isinstance(child, poglinParser.StatementContext):
-                    self.visit(child)
-            
-            self.emit("GOTO", end_if_label) # Após o bloco THEN, salta para o fim do IF
-
-            # Bloco ELSE (se presente)
-            self.emit("LABEL", else_label) # Etiqueta para o inicio do bloco ELSE
-            if ctx.ELSE():
-                in_else_block = False
-                brace_balance = 0
-                for child in ctx.children:
-                    if child == ctx.LBRACE(1): # Início do bloco ELSE
-                        in_else_block = True
-                        brace_balance += 1
-                        continue
-                    if child == ctx.RBRACE(1) and brace_balance == 1: # Fim do bloco ELSE
-                        in_else_block = False
-                        brace_balance -= 1
-                        break
-                    if in_else_block and isinstance(child, poglinParser.StatementContext):
-                        self.visit(child)
-            
-            self.emit("LABEL", end_if_label) # Etiqueta de fim para toda a estrutura IF
-            return None
+    def visitAssign(self, node): # ID = expression; (reatribuição)
+        self.emit("ASSIGN", self.variable(node.name), self.visit(node.value))
+        return None
 
-        elif ctx.WHILE(): # while (expression) { statements }
-            loop_start_label = self.new_label()
-            loop_body_label = self.new_label()
-            loop_end_label = self.new_label()
-
-            self.emit("LABEL", loop_start_label) # Início do loop, verifica a condição aqui
-            
-            cond_operand = self.visit(ctx.expression()) # Resultado da condição do while
-            
-            self.emit("IF_TRUE", cond_operand, loop_body_label) # Se TRUE, entra no corpo do loop
-            self.emit("GOTO", loop_end_label) # Se FALSE, sai do loop
-
-            self.emit("LABEL", loop_body_label) # Etiqueta para o corpo do loop
-            # Lógica para visitar statements dentro do corpo do WHILE
-            in_loop_body = False
-            brace_balance = 0
-            for child in ctx.children:
-                if child == ctx.LBRACE(0):
-                    in_loop_body = True
-                    brace_balance += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_balance == 1:
-                    in_loop_body = False
-                    brace_balance -= 1
-                    break
-                if in_loop_body and isinstance(child, poglinParser.StatementContext):
-                    self.visit(child)
-            
-            self.emit("GOTO", loop_start_label) # Após o corpo, volta para reavaliar a condição
-
-            self.emit("LABEL", loop_end_label) # Etiqueta de fim para o loop
-            return None
-        
-        elif ctx.POG(): # pog;
-            self.emit("POG_OP") # Operação simples para 'pog'
+    def visitPrint(self, node): # println(expression);
+        self.emit("PRINT", self.visit(node.value))
+        return None
+
+    def visitIf(self, node):
+        dead = self.dead_block(node)
+        if dead is not None:
+            return self.visit_live_branch(node, *dead)
+        cond_operand = self.visit(node.condition)
+
+        then_label = self.new_label()
+        else_label = self.new_label()
+        end_if_label = self.new_label()
+
+        self.emit("IF_TRUE", cond_operand, then_label) # Se verdadeira, salta para THEN
+        self.emit("GOTO", else_label) # Se falsa, salta para ELSE (ou fim se nao tiver ELSE)
+
+        self.emit("LABEL", then_label)
+        self.enter_scope()
+        self.visit_block(node.then_body)
+        self.exit_scope()
+        self.emit("GOTO", end_if_label) # Após o bloco THEN, salta para o fim do IF
+
+        self.emit("LABEL", else_label)
+        if node.else_body is not None:
+            self.enter_scope()
+            self.visit_block(node.else_body)
+            self.exit_scope()
+
+        self.emit("LABEL", end_if_label) # Etiqueta de fim para toda a estrutura IF
+        return None
+
+    def visit_live_branch(self, node, dead, position):
+        if dead == 'then':
+            self.skip_dead(position)
+            if node.else_body is not None:
+                self.enter_scope()
+                self.visit_block(node.else_body)
+                self.exit_inlined_scope()
+        else:
+            self.enter_scope()
+            self.visit_block(node.then_body)
+            self.exit_inlined_scope()
+            self.skip_dead(position)
+        return None
+
+    def visitWhile(self, node):
+        dead = self.dead_block(node)
+        if dead is not None:
+            self.skip_dead(dead[1])
             return None
+        loop_start_label = self.new_label()
+        loop_body_label = self.new_label()
+        loop_end_label = self.new_label()
 
-        return self.visitChildren(ctx) # Default para outros statements, se houver
+        self.emit("LABEL", loop_start_label) # Início do loop, verifica a condição aqui
+        cond_operand = self.visit(node.condition)
+        self.emit("IF_TRUE", cond_operand, loop_body_label)
+        self.emit("GOTO", loop_end_label)
 
-    # Métodos para visitar expressões: retornam o TACOperand que contém o resultado
-    def visitLogicalOrExpression(self, ctx: poglinParser.LogicalOrExpressionContext):
-        left_operand = self.visit(ctx.logicalAndExpression(0))
-        if ctx.OR():
-            right_operand = self.visit(ctx.logicalAndExpression(1))
-            temp = self.new_temp()
-            self.emit("OR", temp, left_operand, right_operand)
-            return temp
-        return left_operand
+        self.emit("LABEL", loop_body_label)
+        self.enter_scope()
+        self.visit_block(node.body)
+        self.exit_scope()
+        self.emit("GOTO", loop_start_label) # Após o corpo, volta para reavaliar a condição
 
-    def visitLogicalAndExpression(self, ctx: poglinParser.LogicalAndExpressionContext):
-        left_operand = self.visit(ctx.equalityExpression(0))
-        if ctx.AND():
-            right_operand = self.visit(ctx.equalityExpression(1))
-            temp = self.new_temp()
-            self.emit("AND", temp, left_operand, right_operand)
-            return temp
-        return left_operand
+        self.emit("LABEL", loop_end_label)
+        return None
 
-    def visitEqualityExpression(self, ctx: poglinParser.EqualityExpressionContext):
-        left_operand = self.visit(ctx.relationalExpression(0))
-        if ctx.EQUALS():
-            right_operand = self.visit(ctx.relationalExpression(1))
-            temp = self.new_temp()
-            self.emit("EQ", temp, left_operand, right_operand)
-            return temp
-        elif ctx.NEQUALS():
-            right_operand = self.visit(ctx.relationalExpression(1))
+    def visitPog(self, node): # pog;
+        self.emit("POG_OP") # Operação simples para 'pog'
+        return None
+
+    # Expressões: retornam o TACOperand que contém o resultado
+    def visitBinaryExpr(self, node):
+        if self.expressions is not None:
+            return self.visit_shared_binary(node)
+        # Uma temporária por operador, associando à esquerda
+        left_operand = self.visit(node.operands[0])
+        for op, operand in zip(node.ops, node.operands[1:]):
+            right_operand = self.visit(operand)
             temp = self.new_temp()
-            self.emit("NEQ", temp, left_operand, right_operand)
-            return temp
+            self.emit(BINARY_OPCODES[op], temp, left_operand, right_operand)
+            left_operand = temp
         return left_operand
 
-    def visitRelationalExpression(self, ctx: poglinParser.RelationalExpressionContext):
-        left_operand = self.visit(ctx.additiveExpression(0))
-        if ctx.LT():
-            right_operand = self.visit(ctx.additiveExpression(1))
-            temp = self.new_temp()
-            self.emit("LT", temp, left_operand, right_operand)
-            return temp
-        elif ctx.LTE():
-            right_operand = self.visit(ctx.additiveExpression(1))
+    def visit_shared_binary(self, node):
+        done, left_operand = self.reusable_prefix(node)
+        if left_operand is None:
+            left_operand = self.visit(node.operands[0])
+        prefixes = self.expressions.prefixes[node]
+        for index in range(done, len(node.ops)):
+            right_operand = self.visit(node.operands[index + 1])
             temp = self.new_temp()
-            self.emit("LTE", temp, left_operand, right_operand)
-            return temp
-        elif ctx.GT():
-            right_operand = self.visit(ctx.additiveExpression(1))
-            temp = self.new_temp()
-            self.emit("GT", temp, left_operand, right_operand)
-            return temp
-        elif ctx.GTE():
-            right_operand = self.visit(ctx.additiveExpression(1))
-            temp = self.new_temp()
-            self.emit("GTE", temp, left_operand, right_operand)
-            return temp
+            self.emit(BINARY_OPCODES[node.ops[index]], temp, left_operand, right_operand)
+            self.make_available(prefixes[index], temp)
+            left_operand = temp
         return left_operand
 
-    def visitAdditiveExpression(self, ctx: poglinParser.AdditiveExpressionContext):
-        left_operand = self.visit(ctx.multiplicativeExpression(0))
-        if ctx.PLUS():
-            right_operand = self.visit(ctx.multiplicativeExpression(1))
-            temp = self.new_temp()
-            self.emit("ADD", temp, left_operand, right_operand)
-            return temp
-        elif ctx.MINUS():
-            right_operand = self.visit(ctx.multiplicativeExpression(1))
+    def visitUnaryExpr(self, node):
+        if self.expressions is not None:
+            temp = self.reuse(self.expressions.shape_of[node]) if self.available else None
+            if temp is not None:
+                return temp
+        operand = self.visit(node.operand)
+        temp = self.new_temp()
+        self.emit("NOT", temp, operand)
+        if self.expressions is not None:
+            self.make_available(self.expressions.shape_of[node], temp)
+        return temp
+
+    def visitIntLiteral(self, node):
+        return TACOperand(node.value)
+
+    def visitStringLiteral(self, node):
+        return TACOperand(node.text) # Mantém as aspas para o TAC
+
+    def visitName(self, node):
+        return self.variable(node.name)
+
+    # Versões sem recursão (NodeVisitor.walk): emitem a mesma sequência de TAC
+    def walkProgram(self, node):
+        self.enter_program()
+        self.emit("LABEL", self.new_label())
+        for statement in node.statements:
+            yield statement
+        self.emit("EXIT")
+        return None
+
+    def walkVarDecl(self, node):
+        self.emit("ASSIGN", self.declared(node), (yield node.value))
+        return None
+
+    def walkAssign(self, node):
+        self.emit("ASSIGN", self.variable(node.name), (yield node.value))
+        return None
+
+    def walkPrint(self, node):
+        self.emit("PRINT", (yield node.value))
+        return None
+
+    def walkIf(self, node):
+        dead = self.dead_block(node)
+        if dead is not None:
+            return (yield from self.walk_live_branch(node, *dead))
+        cond_operand = yield node.condition
+
+        then_label = self.new_label()
+        else_label = self.new_label()
+        end_if_label = self.new_label()
+
+        self.emit("IF_TRUE", cond_operand, then_label)
+        self.emit("GOTO", else_label)
+
+        self.emit("LABEL", then_label)
+        self.enter_scope()
+        for statement in node.then_body:
+            yield statement
+        self.exit_scope()
+        self.emit("GOTO", end_if_label)
+
+        self.emit("LABEL", else_label)
+        if node.else_body is not None:
+            self.enter_scope()
+            for statement in node.else_body:
+                yield statement
+            self.exit_scope()
+
+        self.emit("LABEL", end_if_label)
+        return None
+
+    def walk_live_branch(self, node, dead, position):
+        if dead == 'then':
+            self.skip_dead(position)
+            if node.else_body is not None:
+                self.enter_scope()
+                for statement in node.else_body:
+                    yield statement
+                self.exit_inlined_scope()
+        else:
+            self.enter_scope()
+            for statement in node.then_body:
+                yield statement
+            self.exit_inlined_scope()
+            self.skip_dead(position)
+        return None
+
+    def walkWhile(self, node):
+        dead = self.dead_block(node)
+        if dead is not None:
+            self.skip_dead(dead[1])
+            return None
+        loop_start_label = self.new_label()
+        loop_body_label = self.new_label()
+        loop_end_label = self.new_label()
+
+        self.emit("LABEL", loop_start_label)
+        cond_operand = yield node.condition
+        self.emit("IF_TRUE", cond_operand, loop_body_label)
+        self.emit("GOTO", loop_end_label)
+
+        self.emit("LABEL", loop_body_label)
+        self.enter_scope()
+        for statement in node.body:
+            yield statement
+        self.exit_scope()
+        self.emit("GOTO", loop_start_label)
+
+        self.emit("LABEL", loop_end_label)
+        return None
+
+    def walkBinaryExpr(self, node):
+        if self.expressions is not None:
+            return (yield from self.walk_shared_binary(node))
+        left_operand = yield node.operands[0]
+        for op, operand in zip(node.ops, node.operands[1:]):
+            right_operand = yield operand
             temp = self.new_temp()
-            self.emit("SUB", temp, left_operand, right_operand)
-            return temp
+            self.emit(BINARY_OPCODES[op], temp, left_operand, right_operand)
+            left_operand = temp
         return left_operand
 
-    def visitMultiplicativeExpression(self, ctx: poglinParser.MultiplicativeExpressionContext):
-        left_operand = self.visit(ctx.unaryExpression(0))
-        if ctx.MULT():
-            right_operand = self.visit(ctx.unaryExpression(1))
+    def walk_shared_binary(self, node):
+        done, left_operand = self.reusable_prefix(node)
+        if left_operand is None:
+            left_operand = yield node.operands[0]
+        prefixes = self.expressions.prefixes[node]
+        for index in range(done, len(node.ops)):
+            right_operand = yield node.operands[index + 1]
             temp = self.new_temp()
-            self.emit("MUL", temp, left_operand, right_operand)
-            return temp
-        elif ctx.DIV():
-            right_operand = self.visit(ctx.unaryExpression(1))
-            temp = self.new_temp()
-            self.emit("DIV", temp, left_operand, right_operand)
-            return temp
+            self.emit(BINARY_OPCODES[node.ops[index]], temp, left_operand, right_operand)
+            self.make_available(prefixes[index], temp)
+            left_operand = temp
         return left_operand
 
-    def visitUnaryExpression(self, ctx: poglinParser.UnaryExpressionContext):
-        if ctx.NOT():
-            operand = self.visit(ctx.unaryExpression())
-            temp = self.new_temp()
-            self.emit("NOT", temp, operand)
-            return temp
-        return self.visit(ctx.primary())
-
-    def visitPrimary(self, ctx: poglinParser.PrimaryContext):
-        if ctx.INT():
-            return TACOperand(int(ctx.INT().getText()))
-        elif ctx.STRING():
-            return TACOperand(ctx.STRING().getText()) # Mantém as aspas para o TAC
-        elif ctx.ID():
-            return TACOperand(ctx.ID().getText())
-        elif ctx.expression(): # LPAREN expression RPAREN
-            return self.visit(ctx.expression())
-        return None # Caso não seja nenhum tipo primário reconhecido
-
-    def visitType(self, ctx: poglinParser.TypeContext):
-        # Tipos são usados na análise semântica, não geram TAC diretament
-        return None
\ No newline at end of file
+    def walkUnaryExpr(self, node):
+        if self.expressions is not None:
+            temp = self.reuse(self.expressions.shape_of[node]) if self.available else None
+            if temp is not None:
+                return temp
+        operand = yield node.operand
+        temp = self.new_temp()
+        self.emit("NOT", temp, operand)
+        if self.expressions is not None:
+            self.make_available(self.expressions.shape_of[node], temp)
+        return temp
@@ -0,0 +1,109 @@
+import codecs
+import mmap
+import os
+import sys
+from array import array
+from antlr4.InputStream import InputStream
+from antlr4.Token import Token
+
+class TextStream(InputStream):
+    # Stream de caracteres sobre uma str, sem a lista de code points que o InputStream
+    # monta em _loadString. Usado pelo lexer de regex, que casa direto sobre strdata.
+    def __init__(self, data: str, fileName: str = None):
+        super().__init__(data)
+        self.fileName = fileName
+        if fileName is not None:
+            self.name = fileName
+
+    @classmethod
+    def from_file(cls, fileName: str, encoding: str = 'utf-8', errors: str = 'strict'):
+        with open(fileName, 'rb') as file:
+            return cls(codecs.decode(file.read(), encoding, errors), fileName)
+
+    def _loadString(self):
+        self._index = 0
+        self.data = None
+        self._size = len(self.strdata)
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0 # indefinido
+        if offset < 0:
+            offset += 1 # LA(-1) usa offset=0
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        return ord(self.strdata[pos])
+
+    def getSourceName(self):
+        return self.name
+
+class MmapFileStream(InputStream):
+    # Stream de caracteres sobre o arquivo mapeado em memória (mmap), sem a str decodificada
+    # nem a lista de code points do FileStream. Fonte só ASCII: LA lê direto os bytes do
+    # mapeamento (1 byte por caractere, fora do heap). Fora disso o texto é decodificado em
+    # blocos para um array 'H' (2 bytes/caractere), promovido a 'I' se aparecer algum code
+    # point fora do BMP.
+    CHUNK_SIZE = 1 << 22 # 4 MiB por bloco na verificação/decodificação
+
+    def __init__(self, fileName: str, encoding: str = 'utf-8', errors: str = 'strict'):
+        self.name = fileName
+        self.fileName = fileName
+        self.strdata = None
+        self._index = 0
+        self._mmap = None
+        self._codec = 'ascii'
+        with open(fileName, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                self.data = b''
+            else:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self.data = self._mmap
+        if not self._is_ascii():
+            self.data = self._decode_wide(encoding, errors)
+            self.close()
+        self._size = len(self.data)
+
+    def _is_ascii(self):
+        data, step = self.data, self.CHUNK_SIZE
+        return all(data[i:i + step].isascii() for i in range(0, len(data), step))
+
+    def _decode_wide(self, encoding, errors):
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        data, step = self.data, self.CHUNK_SIZE
+        units = array('H')
+        for i in range(0, len(data), step):
+            chunk = decoder.decode(data[i:i + step], i + step >= len(data))
+            if units.typecode == 'H' and chunk and max(chunk) > '\uffff':
+                units = array('I', units) # code point fora do BMP: 4 bytes por caractere
+            if units.typecode == 'H':
+                units.frombytes(chunk.encode(_UTF16))
+            else:
+                units.frombytes(chunk.encode(_UTF32))
+        self._codec = _UTF16 if units.typecode == 'H' else _UTF32
+        return units
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def getText(self, start: int, stop: int):
+        if stop >= self._size:
+            stop = self._size - 1
+        if start >= self._size:
+            return ""
+        chunk = self.data[start:stop + 1]
+        if self._codec == 'ascii':
+            return chunk.decode('ascii')
+        return chunk.tobytes().decode(self._codec)
+
+    def getSourceName(self):
+        return self.name
+
+    def __str__(self):
+        return self.getText(0, self._size - 1)
+
+# Codecs que correspondem ao layout nativo dos arrays 'H' e 'I' (sem BOM)
+_UTF16 = 'utf-16-le' if sys.byteorder == 'little' else 'utf-16-be'
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
@@ -0,0 +1,115 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from antlr4.Token import Token, CommonToken
+from antlr4.error.ErrorListener import ErrorListener
+from src.lexer.poglinLexer import poglinLexer
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+
+# Análise léxica em paralelo: na gramática do Poglin nenhum token atravessa uma quebra de
+# linha (STRING exclui \r\n e COMMENT para no fim da linha), a não ser um '\\' seguido de
+# '\n' dentro de uma string. Então o fonte é cortado logo depois de um '\n' não escapado,
+# cada pedaço é analisado num processo separado e os tokens são juntados corrigindo o
+# deslocamento (start/stop) e a linha. A coluna não muda: todo pedaço começa numa linha.
+
+MIN_CHUNK_SIZE = 1 << 16 # Pedaços menores não compensam o custo de enviar para outro processo
+CHUNKS_PER_JOB = 4 # Mais pedaços que processos equilibra pedaços com tokens de custo diferente
+
+def split_source(text, n_chunks):
+    # Retorna [(offset, primeira_linha, texto)] cobrindo todo o fonte
+    size = len(text)
+    target = max(MIN_CHUNK_SIZE, -(-size // max(1, n_chunks)))
+    chunks = []
+    start, line = 0, 1
+    while start < size:
+        cut = start + target
+        while cut < size:
+            newline = text.find('\n', cut)
+            if newline == -1:
+                cut = size
+            elif text[newline - 1] == '\\':
+                cut = newline + 1 # Quebra de linha escapada: pode estar dentro de uma STRING
+                continue
+            else:
+                cut = newline + 1
+            break
+        cut = min(cut, size)
+        chunks.append((start, line, text[start:cut]))
+        line += text.count('\n', start, cut)
+        start = cut
+    return chunks
+
+class _ChunkErrorListener(ErrorListener):
+    # Guarda o primeiro erro do pedaço e interrompe a análise, como o CustomErrorListener;
+    # quem reporta é o processo principal, na ordem do arquivo.
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.error = (line, column, msg)
+        raise Exception("Erro Léxico Encontrado.")
+
+def _lex_chunk(args):
+    backend, text = args
+    stream = TextStream(text)
+    lexer = PoglinRegexLexer(stream) if backend == "regex" else poglinLexer(stream)
+    listener = _ChunkErrorListener()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(listener)
+    types, starts, stops = array('B'), array('q'), array('q')
+    lines, columns = array('l'), array('l')
+    error = None
+    try:
+        token = lexer.nextToken()
+        while token.type != Token.EOF:
+            types.append(token.type)
+            starts.append(token.start)
+            stops.append(token.stop)
+            lines.append(token.line)
+            columns.append(token.column)
+            token = lexer.nextToken()
+    except Exception:
+        error = listener.error
+    return types, starts, stops, lines, columns, error
+
+def lex_parallel(input_stream, lexer, backend="antlr", jobs=None):
+    # Retorna a lista de tokens do arquivo inteiro, terminada em EOF, com source apontando para o
+    # lexer e o stream do processo principal. O primeiro erro (na ordem do arquivo) é
+    # repassado aos listeners do lexer, que imprimem e interrompem a compilação.
+    jobs = jobs or os.cpu_count() or 1
+    chunks = split_source(input_stream.strdata, jobs * CHUNKS_PER_JOB)
+    work = [(backend, text) for _, _, text in chunks]
+    if len(chunks) <= 1 or jobs == 1:
+        results = map(_lex_chunk, work)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_lex_chunk, work))
+
+    source = (lexer, input_stream)
+    channel = Token.DEFAULT_CHANNEL
+    new_token = CommonToken.__new__
+    tokens = []
+    for (offset, first_line, _), (types, starts, stops, lines, columns, error) in zip(chunks, results):
+        line_shift = first_line - 1
+        for i in range(len(types)):
+            token = new_token(CommonToken)
+            token.source = source
+            token.type = types[i]
+            token.channel = channel
+            token.start = starts[i] + offset
+            token.stop = stops[i] + offset
+            token.tokenIndex = -1
+            token.line = lines[i] + line_shift
+            token.column = columns[i]
+            token._text = None
+            tokens.append(token)
+        if error is not None:
+            line, column, msg = error
+            lexer.getErrorListenerDispatch().syntaxError(lexer, None, line + line_shift, column, msg, None)
+
+    # EOF na mesma posição que o lexer sequencial emitiria (fim do arquivo)
+    text = input_stream.strdata
+    size = len(text)
+    eof = CommonToken(source, Token.EOF, channel, size, size - 1)
+    eof.line = text.count('\n') + 1
+    eof.column = size - (text.rfind('\n') + 1)
+    tokens.append(eof)
+    return tokens
@@ -10,62 +10,57 @@ else:
 
 def serializedATN():
     return [
-        4,1,36,167,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
-        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,1,0,1,0,1,0,5,0,28,
-        8,0,10,0,12,0,31,9,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,67,8,1,10,1,12,1,70,9,1,1,1,1,1,
-        1,1,1,1,5,1,76,8,1,10,1,12,1,79,9,1,1,1,3,1,82,8,1,1,1,1,1,1,1,1,
-        1,1,1,1,1,5,1,90,8,1,10,1,12,1,93,9,1,1,1,1,1,1,1,1,1,3,1,99,8,1,
-        1,2,1,2,1,3,1,3,1,3,5,3,106,8,3,10,3,12,3,109,9,3,1,4,1,4,1,4,5,
-        4,114,8,4,10,4,12,4,117,9,4,1,5,1,5,1,5,5,5,122,8,5,10,5,12,5,125,
-        9,5,1,6,1,6,1,6,5,6,130,8,6,10,6,12,6,133,9,6,1,7,1,7,1,7,5,7,138,
-        8,7,10,7,12,7,141,9,7,1,8,1,8,1,8,5,8,146,8,8,10,8,12,8,149,9,8,
-        1,9,1,9,1,9,3,9,154,8,9,1,10,1,10,1,10,1,10,1,10,1,10,1,10,3,10,
-        163,8,10,1,11,1,11,1,11,0,0,12,0,2,4,6,8,10,12,14,16,18,20,22,0,
-        5,1,0,16,17,1,0,18,21,1,0,12,13,1,0,14,15,1,0,10,11,175,0,24,1,0,
-        0,0,2,98,1,0,0,0,4,100,1,0,0,0,6,102,1,0,0,0,8,110,1,0,0,0,10,118,
-        1,0,0,0,12,126,1,0,0,0,14,134,1,0,0,0,16,142,1,0,0,0,18,153,1,0,
-        0,0,20,162,1,0,0,0,22,164,1,0,0,0,24,25,5,1,0,0,25,29,5,25,0,0,26,
-        28,3,2,1,0,27,26,1,0,0,0,28,31,1,0,0,0,29,27,1,0,0,0,29,30,1,0,0,
-        0,30,32,1,0,0,0,31,29,1,0,0,0,32,33,5,26,0,0,33,34,5,2,0,0,34,1,
-        1,0,0,0,35,36,5,3,0,0,36,37,5,32,0,0,37,38,5,30,0,0,38,39,3,22,11,
-        0,39,40,5,31,0,0,40,41,3,4,2,0,41,42,5,29,0,0,42,99,1,0,0,0,43,44,
-        5,32,0,0,44,45,5,31,0,0,45,46,3,4,2,0,46,47,5,29,0,0,47,99,1,0,0,
-        0,48,49,5,7,0,0,49,50,5,27,0,0,50,51,3,4,2,0,51,52,5,28,0,0,52,53,
-        5,29,0,0,53,99,1,0,0,0,54,55,5,32,0,0,55,56,5,31,0,0,56,57,5,8,0,
-        0,57,58,5,27,0,0,58,59,5,28,0,0,59,99,5,29,0,0,60,61,5,4,0,0,61,
-        62,5,27,0,0,62,63,3,4,2,0,63,64,5,28,0,0,64,68,5,25,0,0,65,67,3,
-        2,1,0,66,65,1,0,0,0,67,70,1,0,0,0,68,66,1,0,0,0,68,69,1,0,0,0,69,
-        71,1,0,0,0,70,68,1,0,0,0,71,81,5,26,0,0,72,73,5,5,0,0,73,77,5,25,
-        0,0,74,76,3,2,1,0,75,74,1,0,0,0,76,79,1,0,0,0,77,75,1,0,0,0,77,78,
-        1,0,0,0,78,80,1,0,0,0,79,77,1,0,0,0,80,82,5,26,0,0,81,72,1,0,0,0,
-        81,82,1,0,0,0,82,99,1,0,0,0,83,84,5,6,0,0,84,85,5,27,0,0,85,86,3,
-        4,2,0,86,87,5,28,0,0,87,91,5,25,0,0,88,90,3,2,1,0,89,88,1,0,0,0,
-        90,93,1,0,0,0,91,89,1,0,0,0,91,92,1,0,0,0,92,94,1,0,0,0,93,91,1,
-        0,0,0,94,95,5,26,0,0,95,99,1,0,0,0,96,97,5,9,0,0,97,99,5,29,0,0,
-        98,35,1,0,0,0,98,43,1,0,0,0,98,48,1,0,0,0,98,54,1,0,0,0,98,60,1,
-        0,0,0,98,83,1,0,0,0,98,96,1,0,0,0,99,3,1,0,0,0,100,101,3,6,3,0,101,
-        5,1,0,0,0,102,107,3,8,4,0,103,104,5,23,0,0,104,106,3,8,4,0,105,103,
-        1,0,0,0,106,109,1,0,0,0,107,105,1,0,0,0,107,108,1,0,0,0,108,7,1,
-        0,0,0,109,107,1,0,0,0,110,115,3,10,5,0,111,112,5,22,0,0,112,114,
-        3,10,5,0,113,111,1,0,0,0,114,117,1,0,0,0,115,113,1,0,0,0,115,116,
-        1,0,0,0,116,9,1,0,0,0,117,115,1,0,0,0,118,123,3,12,6,0,119,120,7,
-        0,0,0,120,122,3,12,6,0,121,119,1,0,0,0,122,125,1,0,0,0,123,121,1,
-        0,0,0,123,124,1,0,0,0,124,11,1,0,0,0,125,123,1,0,0,0,126,131,3,14,
-        7,0,127,128,7,1,0,0,128,130,3,14,7,0,129,127,1,0,0,0,130,133,1,0,
-        0,0,131,129,1,0,0,0,131,132,1,0,0,0,132,13,1,0,0,0,133,131,1,0,0,
-        0,134,139,3,16,8,0,135,136,7,2,0,0,136,138,3,16,8,0,137,135,1,0,
-        0,0,138,141,1,0,0,0,139,137,1,0,0,0,139,140,1,0,0,0,140,15,1,0,0,
-        0,141,139,1,0,0,0,142,147,3,18,9,0,143,144,7,3,0,0,144,146,3,18,
-        9,0,145,143,1,0,0,0,146,149,1,0,0,0,147,145,1,0,0,0,147,148,1,0,
-        0,0,148,17,1,0,0,0,149,147,1,0,0,0,150,151,5,24,0,0,151,154,3,18,
-        9,0,152,154,3,20,10,0,153,150,1,0,0,0,153,152,1,0,0,0,154,19,1,0,
-        0,0,155,163,5,33,0,0,156,163,5,34,0,0,157,163,5,32,0,0,158,159,5,
-        27,0,0,159,160,3,4,2,0,160,161,5,28,0,0,161,163,1,0,0,0,162,155,
-        1,0,0,0,162,156,1,0,0,0,162,157,1,0,0,0,162,158,1,0,0,0,163,21,1,
-        0,0,0,164,165,7,4,0,0,165,23,1,0,0,0,14,29,68,77,81,91,98,107,115,
-        123,131,139,147,153,162
+        4,1,36,155,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,1,0,1,0,
+        1,0,5,0,30,8,0,10,0,12,0,33,9,0,1,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,52,8,1,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,68,8,1,1,1,1,1,1,1,1,1,
+        1,1,1,1,1,1,1,1,3,1,78,8,1,1,2,1,2,5,2,82,8,2,10,2,12,2,85,9,2,1,
+        2,1,2,1,3,1,3,1,4,1,4,1,4,5,4,94,8,4,10,4,12,4,97,9,4,1,5,1,5,1,
+        5,5,5,102,8,5,10,5,12,5,105,9,5,1,6,1,6,1,6,5,6,110,8,6,10,6,12,
+        6,113,9,6,1,7,1,7,1,7,5,7,118,8,7,10,7,12,7,121,9,7,1,8,1,8,1,8,
+        5,8,126,8,8,10,8,12,8,129,9,8,1,9,1,9,1,9,5,9,134,8,9,10,9,12,9,
+        137,9,9,1,10,1,10,1,10,3,10,142,8,10,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,11,3,11,151,8,11,1,12,1,12,1,12,0,0,13,0,2,4,6,8,10,12,14,16,
+        18,20,22,24,0,5,1,0,16,17,1,0,18,21,1,0,12,13,1,0,14,15,1,0,10,11,
+        160,0,26,1,0,0,0,2,77,1,0,0,0,4,79,1,0,0,0,6,88,1,0,0,0,8,90,1,0,
+        0,0,10,98,1,0,0,0,12,106,1,0,0,0,14,114,1,0,0,0,16,122,1,0,0,0,18,
+        130,1,0,0,0,20,141,1,0,0,0,22,150,1,0,0,0,24,152,1,0,0,0,26,27,5,
+        1,0,0,27,31,5,25,0,0,28,30,3,2,1,0,29,28,1,0,0,0,30,33,1,0,0,0,31,
+        29,1,0,0,0,31,32,1,0,0,0,32,34,1,0,0,0,33,31,1,0,0,0,34,35,5,26,
+        0,0,35,36,5,2,0,0,36,1,1,0,0,0,37,38,5,3,0,0,38,39,5,32,0,0,39,40,
+        5,30,0,0,40,41,3,24,12,0,41,42,5,31,0,0,42,43,3,6,3,0,43,44,5,29,
+        0,0,44,78,1,0,0,0,45,46,5,32,0,0,46,51,5,31,0,0,47,52,3,6,3,0,48,
+        49,5,8,0,0,49,50,5,27,0,0,50,52,5,28,0,0,51,47,1,0,0,0,51,48,1,0,
+        0,0,52,53,1,0,0,0,53,78,5,29,0,0,54,55,5,7,0,0,55,56,5,27,0,0,56,
+        57,3,6,3,0,57,58,5,28,0,0,58,59,5,29,0,0,59,78,1,0,0,0,60,61,5,4,
+        0,0,61,62,5,27,0,0,62,63,3,6,3,0,63,64,5,28,0,0,64,67,3,4,2,0,65,
+        66,5,5,0,0,66,68,3,4,2,0,67,65,1,0,0,0,67,68,1,0,0,0,68,78,1,0,0,
+        0,69,70,5,6,0,0,70,71,5,27,0,0,71,72,3,6,3,0,72,73,5,28,0,0,73,74,
+        3,4,2,0,74,78,1,0,0,0,75,76,5,9,0,0,76,78,5,29,0,0,77,37,1,0,0,0,
+        77,45,1,0,0,0,77,54,1,0,0,0,77,60,1,0,0,0,77,69,1,0,0,0,77,75,1,
+        0,0,0,78,3,1,0,0,0,79,83,5,25,0,0,80,82,3,2,1,0,81,80,1,0,0,0,82,
+        85,1,0,0,0,83,81,1,0,0,0,83,84,1,0,0,0,84,86,1,0,0,0,85,83,1,0,0,
+        0,86,87,5,26,0,0,87,5,1,0,0,0,88,89,3,8,4,0,89,7,1,0,0,0,90,95,3,
+        10,5,0,91,92,5,23,0,0,92,94,3,10,5,0,93,91,1,0,0,0,94,97,1,0,0,0,
+        95,93,1,0,0,0,95,96,1,0,0,0,96,9,1,0,0,0,97,95,1,0,0,0,98,103,3,
+        12,6,0,99,100,5,22,0,0,100,102,3,12,6,0,101,99,1,0,0,0,102,105,1,
+        0,0,0,103,101,1,0,0,0,103,104,1,0,0,0,104,11,1,0,0,0,105,103,1,0,
+        0,0,106,111,3,14,7,0,107,108,7,0,0,0,108,110,3,14,7,0,109,107,1,
+        0,0,0,110,113,1,0,0,0,111,109,1,0,0,0,111,112,1,0,0,0,112,13,1,0,
+        0,0,113,111,1,0,0,0,114,119,3,16,8,0,115,116,7,1,0,0,116,118,3,16,
+        8,0,117,115,1,0,0,0,118,121,1,0,0,0,119,117,1,0,0,0,119,120,1,0,
+        0,0,120,15,1,0,0,0,121,119,1,0,0,0,122,127,3,18,9,0,123,124,7,2,
+        0,0,124,126,3,18,9,0,125,123,1,0,0,0,126,129,1,0,0,0,127,125,1,0,
+        0,0,127,128,1,0,0,0,128,17,1,0,0,0,129,127,1,0,0,0,130,135,3,20,
+        10,0,131,132,7,3,0,0,132,134,3,20,10,0,133,131,1,0,0,0,134,137,1,
+        0,0,0,135,133,1,0,0,0,135,136,1,0,0,0,136,19,1,0,0,0,137,135,1,0,
+        0,0,138,139,5,24,0,0,139,142,3,20,10,0,140,142,3,22,11,0,141,138,
+        1,0,0,0,141,140,1,0,0,0,142,21,1,0,0,0,143,151,5,33,0,0,144,151,
+        5,34,0,0,145,151,5,32,0,0,146,147,5,27,0,0,147,148,3,6,3,0,148,149,
+        5,28,0,0,149,151,1,0,0,0,150,143,1,0,0,0,150,144,1,0,0,0,150,145,
+        1,0,0,0,150,146,1,0,0,0,151,23,1,0,0,0,152,153,7,4,0,0,153,25,1,
+        0,0,0,13,31,51,67,77,83,95,103,111,119,127,135,141,150
     ]
 
 class poglinParser ( Parser ):
@@ -93,18 +88,19 @@ class poglinParser ( Parser ):
 
     RULE_program = 0
     RULE_statement = 1
-    RULE_expression = 2
-    RULE_logicalOrExpression = 3
-    RULE_logicalAndExpression = 4
-    RULE_equalityExpression = 5
-    RULE_relationalExpression = 6
-    RULE_additiveExpression = 7
-    RULE_multiplicativeExpression = 8
-    RULE_unaryExpression = 9
-    RULE_primary = 10
-    RULE_type = 11
-
-    ruleNames =  [ "program", "statement", "expression", "logicalOrExpression", 
+    RULE_block = 2
+    RULE_expression = 3
+    RULE_logicalOrExpression = 4
+    RULE_logicalAndExpression = 5
+    RULE_equalityExpression = 6
+    RULE_relationalExpression = 7
+    RULE_additiveExpression = 8
+    RULE_multiplicativeExpression = 9
+    RULE_unaryExpression = 10
+    RULE_primary = 11
+    RULE_type = 12
+
+    ruleNames =  [ "program", "statement", "block", "expression", "logicalOrExpression", 
                    "logicalAndExpression", "equalityExpression", "relationalExpression", 
                    "additiveExpression", "multiplicativeExpression", "unaryExpression", 
                    "primary", "type" ]
@@ -201,23 +197,23 @@ class poglinParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 24
+            self.state = 26
             self.match(poglinParser.START)
-            self.state = 25
+            self.state = 27
             self.match(poglinParser.LBRACE)
-            self.state = 29
+            self.state = 31
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4294968024) != 0):
-                self.state = 26
+                self.state = 28
                 self.statement()
-                self.state = 31
+                self.state = 33
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 32
+            self.state = 34
             self.match(poglinParser.RBRACE)
-            self.state = 33
+            self.state = 35
             self.match(poglinParser.END)
         except RecognitionException as re:
             localctx.exception = re
@@ -234,6 +230,9 @@ class poglinParser ( Parser ):
         def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
             super().__init__(parent, invokingState)
             self.parser = parser
+            self.thenBlock = None # BlockContext
+            self.elseBlock = None # BlockContext
+            self.body = None # BlockContext
 
         def VAR(self):
             return self.getToken(poglinParser.VAR, 0)
@@ -258,8 +257,8 @@ class poglinParser ( Parser ):
         def SEMI(self):
             return self.getToken(poglinParser.SEMI, 0)
 
-        def PRINTLN(self):
-            return self.getToken(poglinParser.PRINTLN, 0)
+        def READLINE(self):
+            return self.getToken(poglinParser.READLINE, 0)
 
         def LPAREN(self):
             return self.getToken(poglinParser.LPAREN, 0)
@@ -267,29 +266,17 @@ class poglinParser ( Parser ):
         def RPAREN(self):
             return self.getToken(poglinParser.RPAREN, 0)
 
-        def READLINE(self):
-            return self.getToken(poglinParser.READLINE, 0)
+        def PRINTLN(self):
+            return self.getToken(poglinParser.PRINTLN, 0)
 
         def IF(self):
             return self.getToken(poglinParser.IF, 0)
 
-        def LBRACE(self, i:int=None):
-            if i is None:
-                return self.getTokens(poglinParser.LBRACE)
-            else:
-                return self.getToken(poglinParser.LBRACE, i)
-
-        def RBRACE(self, i:int=None):
+        def block(self, i:int=None):
             if i is None:
-                return self.getTokens(poglinParser.RBRACE)
+                return self.getTypedRuleContexts(poglinParser.BlockContext)
             else:
-                return self.getToken(poglinParser.RBRACE, i)
-
-        def statement(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(poglinParser.StatementContext)
-            else:
-                return self.getTypedRuleContext(poglinParser.StatementContext,i)
+                return self.getTypedRuleContext(poglinParser.BlockContext,i)
 
 
         def ELSE(self):
@@ -319,71 +306,68 @@ class poglinParser ( Parser ):
         self.enterRule(localctx, 2, self.RULE_statement)
         self._la = 0 # Token type
         try:
-            self.state = 98
+            self.state = 77
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
-            if la_ == 1:
+            token = self._input.LA(1)
+            if token in [3]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 35
+                self.state = 37
                 self.match(poglinParser.VAR)
-                self.state = 36
+                self.state = 38
                 self.match(poglinParser.ID)
-                self.state = 37
+                self.state = 39
                 self.match(poglinParser.COLON)
-                self.state = 38
+                self.state = 40
                 self.type_()
-                self.state = 39
+                self.state = 41
                 self.match(poglinParser.ASSIGN)
-                self.state = 40
+                self.state = 42
                 self.expression()
-                self.state = 41
+                self.state = 43
                 self.match(poglinParser.SEMI)
                 pass
-
-            elif la_ == 2:
+            elif token in [32]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 43
-                self.match(poglinParser.ID)
-                self.state = 44
-                self.match(poglinParser.ASSIGN)
                 self.state = 45
-                self.expression()
+                self.match(poglinParser.ID)
                 self.state = 46
-                self.match(poglinParser.SEMI)
-                pass
-
-            elif la_ == 3:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 48
-                self.match(poglinParser.PRINTLN)
-                self.state = 49
-                self.match(poglinParser.LPAREN)
-                self.state = 50
-                self.expression()
+                self.match(poglinParser.ASSIGN)
                 self.state = 51
-                self.match(poglinParser.RPAREN)
-                self.state = 52
+                self._errHandler.sync(self)
+                token = self._input.LA(1)
+                if token in [24, 27, 32, 33, 34]:
+                    self.state = 47
+                    self.expression()
+                    pass
+                elif token in [8]:
+                    self.state = 48
+                    self.match(poglinParser.READLINE)
+                    self.state = 49
+                    self.match(poglinParser.LPAREN)
+                    self.state = 50
+                    self.match(poglinParser.RPAREN)
+                    pass
+                else:
+                    raise NoViableAltException(self)
+
+                self.state = 53
                 self.match(poglinParser.SEMI)
                 pass
-
-            elif la_ == 4:
-                self.enterOuterAlt(localctx, 4)
+            elif token in [7]:
+                self.enterOuterAlt(localctx, 3)
                 self.state = 54
-                self.match(poglinParser.ID)
+                self.match(poglinParser.PRINTLN)
                 self.state = 55
-                self.match(poglinParser.ASSIGN)
+                self.match(poglinParser.LPAREN)
                 self.state = 56
-                self.match(poglinParser.READLINE)
+                self.expression()
                 self.state = 57
-                self.match(poglinParser.LPAREN)
-                self.state = 58
                 self.match(poglinParser.RPAREN)
-                self.state = 59
+                self.state = 58
                 self.match(poglinParser.SEMI)
                 pass
-
-            elif la_ == 5:
-                self.enterOuterAlt(localctx, 5)
+            elif token in [4]:
+                self.enterOuterAlt(localctx, 4)
                 self.state = 60
                 self.match(poglinParser.IF)
                 self.state = 61
@@ -393,78 +377,103 @@ class poglinParser ( Parser ):
                 self.state = 63
                 self.match(poglinParser.RPAREN)
                 self.state = 64
-                self.match(poglinParser.LBRACE)
-                self.state = 68
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4294968024) != 0):
-                    self.state = 65
-                    self.statement()
-                    self.state = 70
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-
-                self.state = 71
-                self.match(poglinParser.RBRACE)
-                self.state = 81
+                localctx.thenBlock = self.block()
+                self.state = 67
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==5:
-                    self.state = 72
+                    self.state = 65
                     self.match(poglinParser.ELSE)
-                    self.state = 73
-                    self.match(poglinParser.LBRACE)
-                    self.state = 77
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-                    while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4294968024) != 0):
-                        self.state = 74
-                        self.statement()
-                        self.state = 79
-                        self._errHandler.sync(self)
-                        _la = self._input.LA(1)
-
-                    self.state = 80
-                    self.match(poglinParser.RBRACE)
+                    self.state = 66
+                    localctx.elseBlock = self.block()
 
 
                 pass
-
-            elif la_ == 6:
-                self.enterOuterAlt(localctx, 6)
-                self.state = 83
+            elif token in [6]:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 69
                 self.match(poglinParser.WHILE)
-                self.state = 84
+                self.state = 70
                 self.match(poglinParser.LPAREN)
-                self.state = 85
+                self.state = 71
                 self.expression()
-                self.state = 86
+                self.state = 72
                 self.match(poglinParser.RPAREN)
-                self.state = 87
-                self.match(poglinParser.LBRACE)
-                self.state = 91
-                self._errHandler.sync(self)
-                _la = self._input.LA(1)
-                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4294968024) != 0):
-                    self.state = 88
-                    self.statement()
-                    self.state = 93
-                    self._errHandler.sync(self)
-                    _la = self._input.LA(1)
-
-                self.state = 94
-                self.match(poglinParser.RBRACE)
+                self.state = 73
+                localctx.body = self.block()
                 pass
-
-            elif la_ == 7:
-                self.enterOuterAlt(localctx, 7)
-                self.state = 96
+            elif token in [9]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 75
                 self.match(poglinParser.POG)
-                self.state = 97
+                self.state = 76
                 self.match(poglinParser.SEMI)
                 pass
+            else:
+                raise NoViableAltException(self)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
 
 
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def LBRACE(self):
+            return self.getToken(poglinParser.LBRACE, 0)
+
+        def RBRACE(self):
+            return self.getToken(poglinParser.RBRACE, 0)
+
+        def statement(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(poglinParser.StatementContext)
+            else:
+                return self.getTypedRuleContext(poglinParser.StatementContext,i)
+
+
+        def getRuleIndex(self):
+            return poglinParser.RULE_block
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = poglinParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 79
+            self.match(poglinParser.LBRACE)
+            self.state = 83
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4294968024) != 0):
+                self.state = 80
+                self.statement()
+                self.state = 85
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+            self.state = 86
+            self.match(poglinParser.RBRACE)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -500,10 +509,10 @@ class poglinParser ( Parser ):
     def expression(self):
 
         localctx = poglinParser.ExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 4, self.RULE_expression)
+        self.enterRule(localctx, 6, self.RULE_expression)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 100
+            self.state = 88
             self.logicalOrExpression()
         except RecognitionException as re:
             localctx.exception = re
@@ -549,21 +558,21 @@ class poglinParser ( Parser ):
     def logicalOrExpression(self):
 
         localctx = poglinParser.LogicalOrExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 6, self.RULE_logicalOrExpression)
+        self.enterRule(localctx, 8, self.RULE_logicalOrExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 102
+            self.state = 90
             self.logicalAndExpression()
-            self.state = 107
+            self.state = 95
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==23:
-                self.state = 103
+                self.state = 91
                 self.match(poglinParser.OR)
-                self.state = 104
+                self.state = 92
                 self.logicalAndExpression()
-                self.state = 109
+                self.state = 97
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -611,21 +620,21 @@ class poglinParser ( Parser ):
     def logicalAndExpression(self):
 
         localctx = poglinParser.LogicalAndExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 8, self.RULE_logicalAndExpression)
+        self.enterRule(localctx, 10, self.RULE_logicalAndExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 110
+            self.state = 98
             self.equalityExpression()
-            self.state = 115
+            self.state = 103
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22:
-                self.state = 111
+                self.state = 99
                 self.match(poglinParser.AND)
-                self.state = 112
+                self.state = 100
                 self.equalityExpression()
-                self.state = 117
+                self.state = 105
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -679,26 +688,26 @@ class poglinParser ( Parser ):
     def equalityExpression(self):
 
         localctx = poglinParser.EqualityExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 10, self.RULE_equalityExpression)
+        self.enterRule(localctx, 12, self.RULE_equalityExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 118
+            self.state = 106
             self.relationalExpression()
-            self.state = 123
+            self.state = 111
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==16 or _la==17:
-                self.state = 119
+                self.state = 107
                 _la = self._input.LA(1)
                 if not(_la==16 or _la==17):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 120
+                self.state = 108
                 self.relationalExpression()
-                self.state = 125
+                self.state = 113
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -764,26 +773,26 @@ class poglinParser ( Parser ):
     def relationalExpression(self):
 
         localctx = poglinParser.RelationalExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_relationalExpression)
+        self.enterRule(localctx, 14, self.RULE_relationalExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 126
+            self.state = 114
             self.additiveExpression()
-            self.state = 131
+            self.state = 119
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & 3932160) != 0):
-                self.state = 127
+                self.state = 115
                 _la = self._input.LA(1)
                 if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 3932160) != 0)):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 128
+                self.state = 116
                 self.additiveExpression()
-                self.state = 133
+                self.state = 121
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -837,26 +846,26 @@ class poglinParser ( Parser ):
     def additiveExpression(self):
 
         localctx = poglinParser.AdditiveExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_additiveExpression)
+        self.enterRule(localctx, 16, self.RULE_additiveExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 134
+            self.state = 122
             self.multiplicativeExpression()
-            self.state = 139
+            self.state = 127
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==12 or _la==13:
-                self.state = 135
+                self.state = 123
                 _la = self._input.LA(1)
                 if not(_la==12 or _la==13):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 136
+                self.state = 124
                 self.multiplicativeExpression()
-                self.state = 141
+                self.state = 129
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -910,26 +919,26 @@ class poglinParser ( Parser ):
     def multiplicativeExpression(self):
 
         localctx = poglinParser.MultiplicativeExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_multiplicativeExpression)
+        self.enterRule(localctx, 18, self.RULE_multiplicativeExpression)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 142
+            self.state = 130
             self.unaryExpression()
-            self.state = 147
+            self.state = 135
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==14 or _la==15:
-                self.state = 143
+                self.state = 131
                 _la = self._input.LA(1)
                 if not(_la==14 or _la==15):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 144
+                self.state = 132
                 self.unaryExpression()
-                self.state = 149
+                self.state = 137
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -975,21 +984,21 @@ class poglinParser ( Parser ):
     def unaryExpression(self):
 
         localctx = poglinParser.UnaryExpressionContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_unaryExpression)
+        self.enterRule(localctx, 20, self.RULE_unaryExpression)
         try:
-            self.state = 153
+            self.state = 141
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [24]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 150
+                self.state = 138
                 self.match(poglinParser.NOT)
-                self.state = 151
+                self.state = 139
                 self.unaryExpression()
                 pass
             elif token in [27, 32, 33, 34]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 152
+                self.state = 140
                 self.primary()
                 pass
             else:
@@ -1045,33 +1054,33 @@ class poglinParser ( Parser ):
     def primary(self):
 
         localctx = poglinParser.PrimaryContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_primary)
+        self.enterRule(localctx, 22, self.RULE_primary)
         try:
-            self.state = 162
+            self.state = 150
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [33]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 155
+                self.state = 143
                 self.match(poglinParser.INT)
                 pass
             elif token in [34]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 156
+                self.state = 144
                 self.match(poglinParser.STRING)
                 pass
             elif token in [32]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 157
+                self.state = 145
                 self.match(poglinParser.ID)
                 pass
             elif token in [27]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 158
+                self.state = 146
                 self.match(poglinParser.LPAREN)
-                self.state = 159
+                self.state = 147
                 self.expression()
-                self.state = 160
+                self.state = 148
                 self.match(poglinParser.RPAREN)
                 pass
             else:
@@ -1114,11 +1123,11 @@ class poglinParser ( Parser ):
     def type_(self):
 
         localctx = poglinParser.TypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_type)
+        self.enterRule(localctx, 24, self.RULE_type)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 164
+            self.state = 152
             _la = self._input.LA(1)
             if not(_la==10 or _la==11):
                 self._errHandler.recoverInline(self)
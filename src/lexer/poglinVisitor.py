@@ -19,6 +19,11 @@ class poglinVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by poglinParser#block.
+    def visitBlock(self, ctx:poglinParser.BlockContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by poglinParser#expression.
     def visitExpression(self, ctx:poglinParser.ExpressionContext):
         return self.visitChildren(ctx)
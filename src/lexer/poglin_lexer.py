@@ -1,47 +1,115 @@
 # src/lexer/poglin_lexer.py
 import sys
+from array import array
+from collections.abc import Sequence
 from antlr4 import FileStream, CommonTokenStream
+from antlr4.ListTokenSource import ListTokenSource
 from src.lexer.poglinLexer import poglinLexer 
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream, MmapFileStream
+from src.lexer.token_streams import UnbufferedTokenStream
+from src.lexer.parallel_lexer import lex_parallel
 from antlr4.error.ErrorListener import ErrorListener
 
 class CustomErrorListener(ErrorListener):
+    has_errors = False
+
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        symbol_text = offendingSymbol.text if offendingSymbol else ''
-        error_message = f"ERRO LÉXICO [Linha {line}, Coluna {column}]: Símbolo '{symbol_text}' inválido."
-        print(error_message, file=sys.stderr)
+        print(self.message(offendingSymbol, line, column, msg), file=sys.stderr)
+        self.has_errors = True # No modo streaming o erro sobe durante o parse; o analisador consulta isso depois
         raise Exception("Erro Léxico Encontrado.")
 
+    @staticmethod
+    def message(offendingSymbol, line, column, msg):
+        symbol_text = offendingSymbol.text if offendingSymbol else ''
+        return f"ERRO LÉXICO [Linha {line}, Coluna {column}]: Símbolo '{symbol_text}' inválido."
+
+class TokenDataView(Sequence):
+    # Visão somente leitura sobre as colunas de metadados dos tokens. Cada acesso monta o
+    # registro {'type', 'lexeme', 'line', 'column'} na hora; o lexema sai do stream de
+    # caracteres pelo intervalo [start, stop].
+    __slots__ = ('types', 'starts', 'stops', 'lines', 'columns', 'input_stream')
+
+    def __init__(self, types, starts, stops, lines, columns, input_stream):
+        self.types = types
+        self.starts = starts
+        self.stops = stops
+        self.lines = lines
+        self.columns = columns
+        self.input_stream = input_stream
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            'type': poglinLexer.symbolicNames[self.types[index]],
+            'lexeme': self.input_stream.getText(self.starts[index], self.stops[index]),
+            'line': self.lines[index],
+            'column': self.columns[index]
+        }
+
 class PoglinLexerAnalyzer:
-    def __init__(self, file_path):
+    BACKENDS = ("antlr", "regex")
+
+    def __init__(self, file_path, backend="antlr", use_mmap=False, streaming=False, jobs=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Backend léxico desconhecido: {backend}")
+        if use_mmap and backend == "regex":
+            raise ValueError("O lexer de regex casa sobre a str decodificada e não aceita o stream mmap")
+        if jobs and (use_mmap or streaming):
+            raise ValueError("O modo paralelo divide a str decodificada e monta a lista completa de tokens")
         self.file_path = file_path
-        self.tokens_data = [] 
+        self.backend = backend # 'antlr' (poglinLexer gerado) ou 'regex' (PoglinRegexLexer)
+        self.use_mmap = use_mmap # MmapFileStream no lugar do FileStream (fontes muito grandes)
+        self.streaming = streaming # UnbufferedTokenStream: tokens lidos sob demanda pelo parser
+        self.jobs = jobs # Processos da análise léxica paralela (None: sequencial)
+        self.tokens_data = None # TokenDataView, montada só no primeiro get_token_data_list()
+        self.input_stream = None
         self.lexer = None
         self.token_stream = None
+        self.error_listener = CustomErrorListener()
         self.has_errors = False
 
     def analyze(self):
         try:
-            input_stream = FileStream(self.file_path, encoding='utf-8')
+            if self.backend == "regex" or self.jobs:
+                input_stream = TextStream.from_file(self.file_path, encoding='utf-8')
+            elif self.use_mmap:
+                input_stream = MmapFileStream(self.file_path, encoding='utf-8')
+            else:
+                input_stream = FileStream(self.file_path, encoding='utf-8')
         except FileNotFoundError:
             print(f"Erro: Arquivo '{self.file_path}' não encontrado.", file=sys.stderr)
             return False
 
-        self.lexer = poglinLexer(input_stream)
+        self.input_stream = input_stream
+        if self.backend == "regex":
+            self.lexer = PoglinRegexLexer(input_stream)
+        else:
+            self.lexer = poglinLexer(input_stream)
         self.lexer.removeErrorListeners()
-        self.lexer.addErrorListener(CustomErrorListener())
+        self.lexer.addErrorListener(self.error_listener)
 
         try:
+            if self.streaming:
+                # Sem fill(): o lexer roda junto com o parser e os erros léxicos aparecem
+                # durante a análise sintática (ver has_lexical_errors)
+                self.token_stream = UnbufferedTokenStream(self.lexer)
+                return True
+            if self.jobs:
+                # Pedaços do fonte analisados em processos separados; os tokens juntados
+                # alimentam o mesmo CommonTokenStream do modo sequencial
+                tokens = lex_parallel(input_stream, self.lexer, self.backend, self.jobs)
+                source = ListTokenSource(tokens, input_stream.getSourceName())
+                source._factory = self.lexer._factory
+                self.token_stream = CommonTokenStream(source)
+                self.token_stream.fill()
+                return not self.has_errors
             self.token_stream = CommonTokenStream(self.lexer)
             self.token_stream.fill() # Processa a entrada e preenche o stream de tokens
-
-            for token in self.token_stream.tokens:
-                if token.type != -1: # Ignora o token EOF (-1)
-                    self.tokens_data.append({
-                        'type': poglinLexer.symbolicNames[token.type],
-                        'lexeme': token.text,
-                        'line': token.line,
-                        'column': token.column
-                    })
         except Exception as e:
             self.has_errors = True
             # A mensagem de erro já foi impressa pelo CustomErrorListener
@@ -49,13 +117,40 @@ class PoglinLexerAnalyzer:
 
         return not self.has_errors
 
+    def has_lexical_errors(self):
+        self.has_errors = self.has_errors or self.error_listener.has_errors
+        return self.has_errors
+
     def get_token_data_list(self):
+        # Metadados por token em colunas do módulo array (tipo, início/fim do lexema,
+        # linha, coluna), preenchidas na primeira chamada: a compilação não os usa.
+        # No modo streaming os tokens já saíram da janela e não há lista para montar.
+        if self.tokens_data is None and self.token_stream is not None and not self.streaming:
+            tokens = [token for token in self.token_stream.tokens if token.type != -1] # Ignora o token EOF (-1)
+            self.tokens_data = TokenDataView(
+                array('B', [token.type for token in tokens]),
+                array('q', [token.start for token in tokens]),
+                array('q', [token.stop for token in tokens]),
+                array('l', [token.line for token in tokens]),
+                array('l', [token.column for token in tokens]),
+                self.input_stream
+            )
         return self.tokens_data
 
     def get_antlr_token_stream(self):
-        # Retorna o CommonTokenStream que o analisador sintático usará
+        # Retorna o CommonTokenStream (ou o UnbufferedTokenStream) que o analisador sintático usará
         return self.token_stream
 
     def get_antlr_lexer(self):
         # Retorna a instância do PoglinLexer (o lexer gerado pelo ANTLR)
-        return self.lexer
\ No newline at end of file
+        return self.lexer
+
+    def release(self):
+        # Solta fonte, lexer e tokens depois que a AST foi montada (cada token referencia
+        # o lexer e o stream de caracteres, então só some tudo junto)
+        if isinstance(self.input_stream, MmapFileStream):
+            self.input_stream.close()
+        self.tokens_data = None
+        self.token_stream = None
+        self.lexer = None
+        self.input_stream = None
\ No newline at end of file
@@ -0,0 +1,174 @@
+import re
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.Lexer import TokenSource
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import Token, CommonToken
+from antlr4.error.Errors import LexerNoViableAltException
+from src.lexer.poglinLexer import poglinLexer
+
+# Palavras-chave e operadores vêm dos literalNames do lexer gerado, então as duas
+# implementações não se desencontram quando a gramática muda.
+KEYWORDS = {}
+OPERATORS = {}
+for _type, _literal in enumerate(poglinLexer.literalNames):
+    if not _literal.startswith("'"):
+        continue
+    _text = _literal[1:-1]
+    if _text[0].isalpha():
+        KEYWORDS[_text] = _type
+    else:
+        OPERATORS[_text] = _type
+
+# Cada casamento consome o espaço em branco (WS, skip) antes do token. A ordem dos grupos
+# importa: o 're' escolhe a primeira alternativa que casa, não a mais longa. COMMENT vem
+# antes de '/' e os operadores de dois caracteres antes dos de um, reproduzindo o "maior
+# casamento" do ANTLR. Todos os grupos são opcionais para que só espaço (fim de arquivo
+# ou caractere inválido) ainda case, com lastindex None.
+_GROUP_COMMENT = 1
+_GROUP_ID = 2
+_GROUP_INT = 3
+_GROUP_STRING = 4
+_GROUP_OP = 5
+
+TOKEN_PATTERN = re.compile(
+    r'[ \t\r\n]*(?:'                      # WS (skip)
+    r'(//[^\r\n]*)'                       # COMMENT (skip)
+    r'|([a-zA-Z_][a-zA-Z_0-9]*)'          # ID ou palavra-chave
+    r'|([0-9]+)'                          # INT
+    r'|("(?:[^"\\\r\n]|\\.)*")'           # STRING
+    r'|(' + '|'.join(re.escape(op) for op in sorted(OPERATORS, key=len, reverse=True)) + r')'
+    r')?',
+    re.DOTALL)
+# Prefixos de token que o ATN do ANTLR consome antes de falhar: string não terminada
+# e o primeiro caractere de '&&'/'||'. O erro cobre o prefixo mais o caractere seguinte.
+_DEAD_END_PREFIX = re.compile(r'"(?:[^"\\\r\n]|\\.)*\\?|&|\|', re.DOTALL)
+
+class PoglinRegexLexer(Recognizer, TokenSource):
+    # Scanner escrito à mão sobre o 're' (motor em C), com a mesma interface que o
+    # CommonTokenStream e o parser usam do poglinLexer gerado.
+    symbolicNames = poglinLexer.symbolicNames
+    literalNames = poglinLexer.literalNames
+    ruleNames = poglinLexer.ruleNames
+    grammarFileName = poglinLexer.grammarFileName
+
+    def __init__(self, input_stream):
+        super().__init__()
+        self._input = input_stream
+        self._factory = CommonTokenFactory.DEFAULT
+        self._tokenFactorySourcePair = (self, input_stream)
+        self.line = 1
+        self.column = 0
+        self._tokens = self._scan()
+
+    @property
+    def inputStream(self):
+        return self._input
+
+    def getInputStream(self):
+        return self._input
+
+    def getSourceName(self):
+        return self._input.getSourceName()
+
+    def nextToken(self):
+        return next(self._tokens)
+
+    def getAllTokens(self):
+        tokens = []
+        t = self.nextToken()
+        while t.type != Token.EOF:
+            tokens.append(t)
+            t = self.nextToken()
+        return tokens
+
+    def _scan(self):
+        text = self._input.strdata
+        size = len(text)
+        match = TOKEN_PATTERN.match
+        source = self._tokenFactorySourcePair
+        keywords = KEYWORDS
+        operators = OPERATORS
+        id_type = poglinLexer.ID
+        int_type = poglinLexer.INT
+        string_type = poglinLexer.STRING
+        new_token = CommonToken.__new__
+        channel = Token.DEFAULT_CHANNEL
+
+        line = 1
+        line_start = 0 # Índice do primeiro caractere da linha atual
+        pos = 0
+        while pos < size:
+            m = match(text, pos)
+            group = m.lastindex
+            start = m.start(group) if group else m.end()
+
+            # Quebras de linha no espaço em branco antes do token
+            last_newline = text.rfind('\n', pos, start)
+            if last_newline != -1:
+                line += text.count('\n', pos, start)
+                line_start = last_newline + 1
+
+            if group is None:
+                if start == size:
+                    break
+                self.line, self.column = line, start - line_start
+                # Recuperação igual à do ANTLR: descarta o prefixo consumido e o
+                # caractere em que o casamento falhou
+                pos = self._report_error(text, start)
+                last_newline = text.rfind('\n', start, pos)
+                if last_newline != -1:
+                    line += text.count('\n', start, pos)
+                    line_start = last_newline + 1
+                continue
+
+            end = m.end()
+            if group == _GROUP_ID:
+                token_type = keywords.get(m.group(group), id_type)
+            elif group == _GROUP_OP:
+                token_type = operators[m.group(group)]
+            elif group == _GROUP_INT:
+                token_type = int_type
+            elif group == _GROUP_COMMENT: # Nunca contém quebra de linha
+                pos = end
+                continue
+            else:
+                token_type = string_type
+
+            # Equivalente a CommonToken(source, token_type, channel, start, end - 1), sem
+            # a dupla inicialização de Token.__init__/CommonToken.__init__
+            token = new_token(CommonToken)
+            token.source = source
+            token.type = token_type
+            token.channel = channel
+            token.start = start
+            token.stop = end - 1
+            token.tokenIndex = -1
+            token.line = line
+            token.column = start - line_start
+            token._text = None
+            yield token
+
+            if group == _GROUP_STRING: # Pode conter quebra de linha escapada ('\\' .)
+                last_newline = text.rfind('\n', start, end)
+                if last_newline != -1:
+                    line += text.count('\n', start, end)
+                    line_start = last_newline + 1
+            pos = end
+
+        self.line, self.column = line, size - line_start
+        eof = CommonToken(source, Token.EOF, channel, size, size - 1)
+        while True:
+            yield eof
+
+    def _report_error(self, text, pos):
+        # Mesmo texto que o Lexer do ANTLR monta: do início do token até o caractere em
+        # que o casamento falhou. Retorna a posição em que a varredura deve continuar.
+        m = _DEAD_END_PREFIX.match(text, pos)
+        dead_end = m.end() if m else pos
+        e = LexerNoViableAltException(self, self._input, pos, None)
+        msg = "token recognition error at: '" + self.getErrorDisplay(text[pos:dead_end + 1]) + "'"
+        self.getErrorListenerDispatch().syntaxError(self, None, self.line, self.column, msg, e)
+        return min(dead_end + 1, len(text))
+
+    def getErrorDisplay(self, s: str):
+        return s.replace('\n', '\\n').replace('\t', '\\t').replace('\r', '\\r')
@@ -0,0 +1,128 @@
+from antlr4.Token import Token
+from antlr4.BufferedTokenStream import TokenStream
+
+class UnbufferedTokenStream(TokenStream):
+    # Stream de tokens com janela deslizante, no estilo do UnbufferedTokenStream do runtime
+    # Java: os tokens são pedidos ao lexer conforme o parser olha adiante (LT/LA) e os já
+    # consumidos saem da janela assim que não há marcadores ativos. A predição do parser
+    # usa mark()/seek()/release() para voltar ao início da decisão, então o buffer só
+    # cresce enquanto alguma decisão está olhando adiante. Não dá para voltar a uma
+    # posição fora da janela (seek(0) depois do parse, por exemplo).
+    def __init__(self, tokenSource):
+        self.tokenSource = tokenSource
+        self.tokens = [] # Janela: tokens[p] é LT(1)
+        self.p = 0
+        self.numMarkers = 0
+        self.lastToken = None # LT(-1)
+        self.lastTokenBufferStart = None # LT(-1) quando p volta para o início da janela
+        self.currentTokenIndex = 0 # Índice absoluto de LT(1)
+        self.fill(1)
+
+    @property
+    def index(self):
+        return self.currentTokenIndex
+
+    @property
+    def size(self):
+        raise Exception("UnbufferedTokenStream não conhece o tamanho do stream")
+
+    def getTokenSource(self):
+        return self.tokenSource
+
+    def getSourceName(self):
+        return self.tokenSource.getSourceName()
+
+    def LT(self, i: int):
+        if i == -1:
+            return self.lastToken
+        self.sync(i)
+        index = self.p + i - 1
+        if index < 0:
+            raise IndexError(f"LT({i}) fora da janela de tokens")
+        if index >= len(self.tokens):
+            return self.tokens[-1] # EOF
+        return self.tokens[index]
+
+    def LA(self, i: int):
+        return self.LT(i).type
+
+    def get(self, i: int):
+        start = self.currentTokenIndex - self.p
+        if i < start or i >= start + len(self.tokens):
+            raise IndexError(f"token {i} fora da janela {start}..{start + len(self.tokens) - 1}")
+        return self.tokens[i - start]
+
+    def consume(self):
+        if self.LA(1) == Token.EOF:
+            raise Exception("cannot consume EOF")
+        self.lastToken = self.tokens[self.p]
+        if self.p == len(self.tokens) - 1 and self.numMarkers == 0:
+            # Fim da janela sem marcadores: descarta tudo e recomeça do zero
+            self.tokens = []
+            self.p = -1
+            self.lastTokenBufferStart = self.lastToken
+        self.p += 1
+        self.currentTokenIndex += 1
+        self.sync(1)
+
+    def sync(self, want: int):
+        need = (self.p + want - 1) - len(self.tokens) + 1
+        if need > 0:
+            self.fill(need)
+
+    def fill(self, n: int):
+        tokens = self.tokens
+        for i in range(n):
+            if tokens and tokens[-1].type == Token.EOF:
+                return i
+            token = self.tokenSource.nextToken()
+            token.tokenIndex = self.currentTokenIndex - self.p + len(tokens)
+            tokens.append(token)
+        return n
+
+    def mark(self):
+        if self.numMarkers == 0:
+            self.lastTokenBufferStart = self.lastToken
+        self.numMarkers += 1
+        return -self.numMarkers
+
+    def release(self, marker: int):
+        if marker != -self.numMarkers:
+            raise Exception("release() fora de ordem")
+        self.numMarkers -= 1
+        if self.numMarkers == 0 and self.p > 0:
+            # Último marcador liberado: os tokens antes de LT(1) saem da janela
+            del self.tokens[:self.p]
+            self.p = 0
+            self.lastTokenBufferStart = self.lastToken
+
+    def seek(self, index: int):
+        if index == self.currentTokenIndex:
+            return
+        if index > self.currentTokenIndex:
+            self.sync(index - self.currentTokenIndex)
+        start = self.currentTokenIndex - self.p
+        index = min(index, start + len(self.tokens) - 1)
+        i = index - start
+        if i < 0:
+            raise IndexError(f"seek({index}) antes do início da janela ({start})")
+        self.p = i
+        self.currentTokenIndex = index
+        self.lastToken = self.lastTokenBufferStart if i == 0 else self.tokens[i - 1]
+
+    def getText(self, start=None, stop=None):
+        # Só enxerga tokens ainda na janela (usado nas mensagens de "no viable alternative")
+        if isinstance(start, Token):
+            start = start.tokenIndex
+        if isinstance(stop, Token):
+            stop = stop.tokenIndex
+        window_start = self.currentTokenIndex - self.p
+        start = window_start if start is None else max(start, window_start)
+        stop = window_start + len(self.tokens) - 1 if stop is None else min(stop, window_start + len(self.tokens) - 1)
+        parts = []
+        for i in range(start, stop + 1):
+            token = self.tokens[i - window_start]
+            if token.type == Token.EOF:
+                break
+            parts.append(token.text)
+        return "".join(parts)
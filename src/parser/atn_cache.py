@@ -0,0 +1,105 @@
+import hashlib
+import os
+import pickle
+import sys
+import antlr4
+from antlr4.PredictionContext import PredictionContext
+from antlr4.RuleContext import RuleContext
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerAction import LexerSkipAction, LexerMoreAction, LexerPopModeAction
+from antlr4.atn.SemanticContext import SemanticContext
+from src.lexer.poglinLexer import poglinLexer, serializedATN as lexer_serialized_atn
+from src.lexer.poglinParser import poglinParser, serializedATN as parser_serialized_atn
+
+# Cache em disco do estado de predição do ANTLR: os ATNs desserializados do lexer e do parser
+# junto com os DFAs que o ParserATNSimulator/LexerATNSimulator preenchem durante a análise.
+# Num processo novo os DFAs começam vazios e as primeiras decisões caem na simulação completa
+# do ATN; carregando o cache, a compilação já começa com os DFAs das execuções anteriores.
+# ATN e DFAs são gravados no mesmo pickle porque os estados do DFA apontam para estados do ATN.
+#
+# A chave combina o hash dos ATNs serializados (muda ao regenerar a gramática), a versão do
+# formato, a versão do Python e a instalação do runtime antlr4. Qualquer divergência ou falha
+# de leitura/gravação é ignorada em silêncio: o compilador segue com o estado do import.
+
+CACHE_FORMAT = 1
+CACHE_DIR = os.environ.get("POGLIN_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "poglin"))
+CACHE_FILE = "atn_dfa.pickle"
+
+RECOGNIZERS = (("lexer", poglinLexer), ("parser", poglinParser))
+
+# O runtime compara estes objetos por identidade (is PredictionContext.EMPTY, estado ERROR do
+# DFA...), então eles vão no pickle só como referência e voltam como os objetos do processo.
+SINGLETONS = {
+    "PredictionContext.EMPTY": PredictionContext.EMPTY,
+    "RuleContext.EMPTY": RuleContext.EMPTY,
+    "SemanticContext.NONE": SemanticContext.NONE,
+    "ATNSimulator.ERROR": ATNSimulator.ERROR,
+    "LexerATNSimulator.ERROR": LexerATNSimulator.ERROR,
+    "LexerSkipAction.INSTANCE": LexerSkipAction.INSTANCE,
+    "LexerMoreAction.INSTANCE": LexerMoreAction.INSTANCE,
+    "LexerPopModeAction.INSTANCE": LexerPopModeAction.INSTANCE,
+}
+_SINGLETON_NAMES = {id(obj): name for name, obj in SINGLETONS.items()}
+
+class _Pickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        return _SINGLETON_NAMES.get(id(obj))
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, name):
+        return SINGLETONS[name]
+
+def cache_key():
+    digest = hashlib.sha256()
+    for serialized in (lexer_serialized_atn(), parser_serialized_atn()):
+        digest.update(repr(serialized).encode())
+    runtime = os.path.dirname(antlr4.__file__)
+    digest.update(f"{CACHE_FORMAT}|{sys.version}|{runtime}|{os.path.getmtime(runtime)}".encode())
+    return digest.hexdigest()
+
+def cache_path():
+    return os.path.join(CACHE_DIR, CACHE_FILE)
+
+def dfa_state_count():
+    return sum(len(dfa._states) for _, recognizer in RECOGNIZERS for dfa in recognizer.decisionsToDFA)
+
+_loaded_states = None # Estados de DFA logo após a carga (ou o import), para saber se vale regravar
+
+def load():
+    # Troca os atributos de classe atn/decisionsToDFA do poglinLexer/poglinParser pelos do
+    # cache. Precisa rodar antes de instanciar lexer e parser, que os leem no __init__.
+    global _loaded_states
+    try:
+        with open(cache_path(), "rb") as f:
+            data = _Unpickler(f).load()
+        if data.get("key") != cache_key():
+            data = None
+    except Exception:
+        data = None
+    if data is not None:
+        for name, recognizer in RECOGNIZERS:
+            recognizer.atn, recognizer.decisionsToDFA = data[name]
+    _loaded_states = dfa_state_count()
+    return data is not None
+
+def save():
+    # Grava só quando os DFAs ganharam estados desde a carga; escrita atômica (tmp + replace)
+    if _loaded_states is not None and dfa_state_count() == _loaded_states:
+        return False
+    data = {"key": cache_key()}
+    for name, recognizer in RECOGNIZERS:
+        data[name] = (recognizer.atn, recognizer.decisionsToDFA)
+    tmp_path = f"{cache_path()}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            _Pickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+        os.replace(tmp_path, cache_path())
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
@@ -0,0 +1,331 @@
+from bisect import bisect_left, bisect_right
+from antlr4 import CommonTokenStream
+from antlr4.error.ErrorListener import ErrorListener
+from src.lexer.poglinLexer import poglinLexer as T
+from src.lexer.poglin_regex_lexer import PoglinRegexLexer
+from src.lexer.char_streams import TextStream
+from src.lexer.poglin_lexer import CustomErrorListener as LexicalErrors
+from src.parser.poglin_parser import CustomErrorListener as SyntaxErrors
+from src.parser.rd_parser import RecursiveDescentParser
+from src.ast.nodes import BinaryExpr, UnaryExpr, IntLiteral, StringLiteral, Name
+
+# Análise léxica e sintática incremental de um documento aberto no editor (lexer regex +
+# parser descendente recursivo). O documento é dividido em unidades, uma por comando do
+# bloco do programa, mais o rodapé ('}' 'end'); cada unidade vai do fim do comando anterior
+# (ou do '{') até o fim do seu último token, então o espaço e os comentários antes de um
+# comando pertencem a ele. Uma edição (intervalo + texto novo) refaz o léxico e o parse só das
+# unidades que ela toca e devolve os comandos novos para a AST, no lugar dos antigos.
+#
+# A região refeita termina no primeiro token de uma unidade seguinte (a sentinela), e vale
+# quando o lexer, começando do zero na região, produz um token exatamente na posição da
+# sentinela: daí em diante os tokens são os mesmos de antes. Ela se estende enquanto a
+# sentinela está na mesma linha do fim da edição (as colunas dela mudariam), e até o rodapé
+# quando o resultado depende do resto do arquivo: '}' no nível do programa, comando que não
+# termina antes da sentinela ou sentinela desalinhada (um '//' novo engoliu o token). Editar
+# o cabeçalho ('start {') ou o rodapé refaz a análise do arquivo inteiro.
+#
+# Os erros são os mesmos (e na mesma posição) da compilação do arquivo inteiro com
+# --regex-lexer --rd-parser: as unidades fora da região já analisavam sem erro, então o
+# primeiro erro do arquivo está na região. Uma região com erro fica pendente (os comandos dela
+# saem da AST) e é incluída na próxima edição. Um '{' ainda sem o '}' muda o parse de todo o
+# resto do arquivo, então enquanto o bloco não fecha cada edição refaz a análise até o fim.
+#
+# Posições: as listas por unidade guardam a posição do primeiro token e a linha. Depois da
+# unidade editada, todas andam o mesmo deslocamento; como num gap buffer, ele fica pendente a
+# partir do índice 'gap' e só é aplicado quando a próxima edição cai em outro lugar, então
+# digitar num mesmo trecho não percorre o resto do arquivo. As linhas dos nós da AST são
+# corrigidas só em program(), e só se alguma edição mudou o número de linhas.
+
+class Diagnostics(ErrorListener):
+    # Guarda os erros em vez de imprimir. O lexer continua depois de um erro; o parser
+    # descendente recursivo precisa que o listener interrompa a análise (stop=True).
+    def __init__(self, stop=False):
+        self.errors = []
+        self.stop = stop
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((offendingSymbol, line, column, msg)) # Argumentos de CustomErrorListener.message
+        if self.stop:
+            raise Exception("Erro Sintático Encontrado.")
+
+def shift_lines(statement, delta):
+    # Soma delta à linha de todos os nós de um comando
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        node.line += delta
+        cls = type(node)
+        if cls is BinaryExpr:
+            node.positions = [(line + delta, column) for line, column in node.positions]
+            stack.extend(node.operands)
+        elif cls is UnaryExpr:
+            stack.append(node.operand)
+        elif cls is not IntLiteral and cls is not StringLiteral and cls is not Name:
+            for field in ('value', 'condition'):
+                child = getattr(node, field, None)
+                if child is not None:
+                    stack.append(child)
+            for field in ('then_body', 'else_body', 'body'):
+                block = getattr(node, field, None)
+                if block is not None:
+                    stack.extend(block)
+
+class IncrementalDocument:
+    def __init__(self, text):
+        self.text = text
+        self.errors = []
+        self._rebuild()
+
+    # Consultas
+    def program(self):
+        # AST do documento (a mesma instância de Program a cada chamada) ou None com erros
+        if self.errors:
+            return None
+        if self.rebase_from is not None:
+            self._move_gap(len(self.starts))
+            lines, built, statements = self.lines, self.built, self.statements
+            for i in range(self.rebase_from, len(statements)):
+                if lines[i] != built[i]:
+                    shift_lines(statements[i], lines[i] - built[i])
+                    built[i] = lines[i]
+            self.rebase_from = None
+        return self.root
+
+    def offset(self, line, column):
+        # Posição no texto de (linha, coluna), com linha a partir de 1 e coluna a partir de 0
+        text = self.text
+        position, current = 0, 1
+        if self.starts:
+            i = self._search(self.lines, self.line_shift, line, bisect_right) - 1
+            if i >= 0:
+                position = text.rfind('\n', 0, self._start(i)) + 1
+                current = self._line(i)
+        while current < line:
+            position = text.index('\n', position) + 1
+            current += 1
+        return position + column
+
+    # Edição
+    def edit(self, start, end, text):
+        # Troca text[start:end] por text; retorna True se o documento analisa sem erros
+        old = self.text
+        new = self.text = old[:start] + text + old[end:]
+        if not self.starts:
+            return self._rebuild()
+        footer = len(self.statements)
+        k = self._unit_at(start)
+        j = self._unit_at(end)
+        if k < 0 or end > self._start(footer):
+            return self._rebuild()
+        s = j + 1 if j < footer else footer
+        if self.damaged is not None:
+            k = min(k, self.damaged)
+            s = max(s, self.damaged)
+
+        delta = len(text) - (end - start)
+        line_delta = text.count('\n') - old.count('\n', start, end)
+        edit_end = start + len(text)
+        while s < footer and new.find('\n', edit_end, self._start(s) + delta) == -1:
+            s += 1
+
+        region_start = self._start(k) - self.leads[k]
+        line = self._line(k) - old.count('\n', region_start, self._start(k))
+        column = region_start - new.rfind('\n', 0, region_start) - 1
+        if s < footer:
+            result = self._reparse_range(k, s, region_start, line, column, delta, line_delta)
+            if result is not None:
+                return result
+        return self._reparse_tail(k, region_start, line, column, delta, line_delta)
+
+    def _reparse_range(self, k, s, region_start, line, column, delta, line_delta):
+        # Refaz as unidades k..s-1; None quando a região precisa ir até o rodapé
+        stop = self._start(s) + delta
+        line_end = self.text.find('\n', stop)
+        tokens, lexical = self._lex(region_start, len(self.text) if line_end == -1 else line_end, line, column)
+        sentinel = len(tokens) - 2
+        while sentinel >= 0 and tokens[sentinel].start > stop:
+            sentinel -= 1
+        if sentinel < 0 or tokens[sentinel].start != stop:
+            return None
+        first = tokens[sentinel]
+        lexical = [error for error in lexical if (error[1], error[2]) < (first.line, first.column)]
+        if lexical:
+            return self._damage(k, s, region_start, delta, line_delta, LexicalErrors.message(*lexical[0]))
+
+        parser = self._parser(tokens)
+        statements, ends = [], []
+        try:
+            while parser.pos < sentinel:
+                if parser.types[parser.pos] == T.RBRACE:
+                    return None
+                statements.append(parser.parse_statement())
+                ends.append(parser.pos)
+        except Exception:
+            # O erro só é o da compilação se a mensagem não olhou além dos tokens da região
+            if parser.pos + 1 >= len(parser.tokens) - 1:
+                return None
+            return self._damage(k, s, region_start, delta, line_delta, SyntaxErrors.message(*parser.listener.errors[0]))
+        if parser.pos != sentinel:
+            return None
+        self._splice(k, s, parser.tokens, 0, ends, region_start, statements, delta, line_delta)
+        return True
+
+    def _reparse_tail(self, k, region_start, line, column, delta, line_delta):
+        # Refaz da unidade k até o fim do arquivo, com o rodapé
+        footer = len(self.statements)
+        tokens, lexical = self._lex(region_start, len(self.text), line, column)
+        if lexical:
+            return self._damage(k, footer, region_start, delta, line_delta, LexicalErrors.message(*lexical[0]))
+        parser = self._parser(tokens)
+        ends = []
+        try:
+            statements = parser.parse_program_body(ends)
+        except Exception:
+            return self._damage(k, footer, region_start, delta, line_delta, SyntaxErrors.message(*parser.listener.errors[0]))
+        self._splice(k, footer + 1, parser.tokens, 0, ends, region_start, statements, delta, line_delta)
+        return True
+
+    def _rebuild(self):
+        # Análise do arquivo inteiro
+        self.starts = self.lines = self.leads = self.built = None
+        self.statements = self.root = None
+        self.gap, self.shift, self.line_shift = 0, 0, 0
+        self.damaged = self.rebase_from = None
+        tokens, lexical = self._lex(0, len(self.text), 1, 0)
+        if lexical:
+            self.errors = [LexicalErrors.message(*lexical[0])]
+            return False
+        parser = self._parser(tokens)
+        ends = []
+        try:
+            root = parser.parse_program(ends)
+        except Exception:
+            self.errors = [SyntaxErrors.message(*parser.listener.errors[0])]
+            return False
+        self.errors = []
+        self.starts, self.lines, self.leads, self.built = [], [], [], []
+        self.root = root
+        self.statements = root.statements
+        self._add_units(self.starts, self.lines, self.leads, parser.tokens, 2, ends, parser.tokens[1].stop + 1, True)
+        self.built = self.lines[:-1]
+        self.gap = len(self.starts)
+        return True
+
+    # Análise de um trecho
+    def _lex(self, begin, end, line, column):
+        # Tokens de text[begin:end] com posição, linha e coluna no documento, e os erros léxicos
+        # já nas coordenadas do documento
+        diagnostics = Diagnostics()
+        lexer = PoglinRegexLexer(TextStream(self.text[begin:end]))
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(diagnostics)
+        stream = CommonTokenStream(lexer)
+        stream.fill()
+        tokens = stream.tokens
+        if begin:
+            for token in tokens:
+                token._text = token.text # O stream do trecho não vale para as posições do documento
+                token.start += begin
+                token.stop += begin
+                if token.line == 1:
+                    token.column += column
+                token.line += line - 1
+        errors = [(symbol, error_line + line - 1, error_column + column if error_line == 1 else error_column, msg)
+                  for symbol, error_line, error_column, msg in diagnostics.errors]
+        return tokens, errors
+
+    def _parser(self, tokens):
+        parser = RecursiveDescentParser(_TokenList(tokens))
+        parser.listener = Diagnostics(stop=True)
+        return parser
+
+    # Unidades
+    def _add_units(self, starts, lines, leads, tokens, index, ends, span_start, footer):
+        # Uma unidade por comando (tokens[index:ends[0]], tokens[ends[0]:ends[1]], ...) e, com
+        # footer, o '}' que vem depois; retorna onde termina o último comando
+        for end in ends + [None] if footer else ends:
+            token = tokens[index]
+            starts.append(token.start)
+            lines.append(token.line)
+            leads.append(token.start - span_start)
+            if end is not None:
+                span_start = tokens[end - 1].stop + 1
+                index = end
+        return span_start
+
+    def _splice(self, k, s, tokens, index, ends, region_start, statements, delta, line_delta):
+        # Troca as unidades k..s-1 pelas dos comandos novos (s = len(starts) inclui o rodapé)
+        starts, lines, leads = [], [], []
+        span_end = self._add_units(starts, lines, leads, tokens, index, ends, region_start, s == len(self.starts))
+        self._replace(k, s, starts, lines, leads, statements, span_end, delta, line_delta)
+        self.damaged = None
+        self.errors = []
+
+    def _damage(self, k, s, region_start, delta, line_delta, message):
+        # A região não analisa: os comandos dela saem da AST e o texto fica no espaço antes da
+        # unidade s, que entra na próxima edição
+        self._replace(k, s, [], [], [], [], region_start, delta, line_delta)
+        self.damaged = k
+        self.errors = [message]
+        return False
+
+    def _replace(self, k, s, starts, lines, leads, statements, span_end, delta, line_delta):
+        self._move_gap(s)
+        self.starts[k:s] = starts
+        self.lines[k:s] = lines
+        self.leads[k:s] = leads
+        self.built[k:s] = lines[:len(statements)]
+        self.statements[k:s] = statements
+        self.gap = gap = k + len(starts)
+        if gap == len(self.starts):
+            self.shift = self.line_shift = 0
+        else:
+            self.shift += delta
+            self.line_shift += line_delta
+            self.leads[gap] = self._start(gap) - span_end
+        if line_delta or self.rebase_from is not None:
+            self.rebase_from = k if self.rebase_from is None else min(self.rebase_from, k)
+
+    def _move_gap(self, index):
+        # Aplica o deslocamento pendente às unidades entre o gap atual e index
+        gap = self.gap
+        if self.shift or self.line_shift:
+            shift, line_shift = self.shift, self.line_shift
+            if index > gap:
+                self.starts[gap:index] = [start + shift for start in self.starts[gap:index]]
+                self.lines[gap:index] = [line + line_shift for line in self.lines[gap:index]]
+            elif index < gap:
+                self.starts[index:gap] = [start - shift for start in self.starts[index:gap]]
+                self.lines[index:gap] = [line - line_shift for line in self.lines[index:gap]]
+        self.gap = index
+
+    def _start(self, i):
+        return self.starts[i] + self.shift if i >= self.gap else self.starts[i]
+
+    def _line(self, i):
+        return self.lines[i] + self.line_shift if i >= self.gap else self.lines[i]
+
+    def _search(self, values, shift, value, bisect):
+        # bisect sobre valores com o deslocamento pendente a partir do gap
+        gap = self.gap
+        i = bisect(values, value, 0, gap)
+        if i < gap:
+            return i
+        return bisect(values, value - shift, gap, len(values))
+
+    def _unit_at(self, position):
+        # Unidade cujo trecho contém position; -1 no cabeçalho
+        i = self._search(self.starts, self.shift, position, bisect_left)
+        if i < len(self.starts) and self._start(i) - self.leads[i] <= position:
+            return i
+        return i - 1
+
+class _TokenList:
+    # Tokens já lidos, com a interface que o RecursiveDescentParser usa do CommonTokenStream
+    __slots__ = ('tokens',)
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def fill(self):
+        pass
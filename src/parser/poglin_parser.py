@@ -1,37 +1,120 @@
 import sys
+import time
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 from src.lexer.poglinParser import poglinParser 
+from src.parser.profiling import ProfilingATNSimulator, format_profile
+from src.parser.tree_collapse import PassThroughCollapser
 
 class CustomErrorListener(ErrorListener):
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        error_message = f"ERRO SINTÁTICO [Linha {line}, Coluna {column}]: {msg.replace('at ', 'encontrado ')}"
-        print(error_message, file=sys.stderr)
+        print(self.message(offendingSymbol, line, column, msg), file=sys.stderr)
         raise Exception("Erro Sintático Encontrado.")
 
+    @staticmethod
+    def message(offendingSymbol, line, column, msg):
+        return f"ERRO SINTÁTICO [Linha {line}, Coluna {column}]: {msg.replace('at ', 'encontrado ')}"
+
+    @staticmethod
+    def nesting_message(line, column):
+        return (f"ERRO SINTÁTICO [Linha {line}, Coluna {column}]: aninhamento profundo demais para o parser "
+                f"do ANTLR (limite de recursão do Python); use --rd-parser")
+
 class PoglinParserAnalyzer:
-    def __init__(self, token_stream):
+    def __init__(self, token_stream, two_stage=True, profile=False, collapse=False):
         self.token_stream = token_stream
         self.parser_successful = False
         self.parse_tree = None
         self.parser = None # Armazena a instância do parser para acesso posterior
+        self.two_stage = two_stage # Tenta SLL antes de cair para LL completo
+        self.prediction_mode = None # Modo de predição que produziu a árvore ('SLL' ou 'LL')
+        self.retries = 0 # Quantas vezes o parse foi refeito com LL completo
+        self.profile = profile # Usa o ProfilingATNSimulator para medir cada decisão
+        self.parse_seconds = 0.0
+        self.collapse = collapse # Colapsa as regras de repasse da cadeia de expressões durante o parse
 
     def analyze(self):
         self.parser = poglinParser(self.token_stream)
-        self.parser.removeErrorListeners()
-        self.parser.addErrorListener(CustomErrorListener())
+        if self.profile:
+            self.parser._interp = ProfilingATNSimulator(self.parser, self.parser.atn, self.parser.decisionsToDFA, self.parser.sharedContextCache)
+        if self.collapse:
+            self.parser.addParseListener(PassThroughCollapser())
 
+        start = time.perf_counter()
         try:
-            # Chama a regra inicial da gramática 'program'
-            self.parse_tree = self.parser.program()
+            if self.two_stage:
+                self.parse_tree = self._parse_two_stage()
+            else:
+                self._configure_full_ll()
+                self.parse_tree = self.parser.program()
             self.parser_successful = True
+        except RecursionError:
+            # O parser gerado desce uma chamada Python por regra: um aninhamento de blocos ou
+            # parênteses além do limite de recursão não é um erro de sintaxe do programa
+            self.parser_successful = False
+            token = self.parser.getCurrentToken()
+            print(CustomErrorListener.nesting_message(token.line, token.column), file=sys.stderr)
         except Exception as e:
             self.parser_successful = False
             # A mensagem de erro já foi impressa pelo CustomErrorListener
+        self.parse_seconds = time.perf_counter() - start
 
         return self.parser_successful
 
+    def _configure_full_ll(self):
+        self.parser.removeErrorListeners()
+        self.parser.addErrorListener(CustomErrorListener())
+        self.parser._errHandler = DefaultErrorStrategy()
+        self.parser._interp.predictionMode = PredictionMode.LL
+        self.prediction_mode = "LL"
+
+    def _parse_two_stage(self):
+        # 1º estágio: predição SLL com BailErrorStrategy. Sem listeners, qualquer erro
+        # (real ou causado pela predição mais fraca) apenas cancela o parse.
+        self.parser.removeErrorListeners()
+        self.parser._errHandler = BailErrorStrategy()
+        self.parser._interp.predictionMode = PredictionMode.SLL
+        self.prediction_mode = "SLL"
+        try:
+            return self.parser.program()
+        except ParseCancellationException:
+            pass
+
+        # 2º estágio: rebobina o stream e refaz o parse com LL completo e o tratamento
+        # de erros padrão, que reporta o erro sintático real (se houver).
+        self.retries += 1
+        self.token_stream.seek(0)
+        # O reset() do runtime Python chama setTrace(False), que tenta remover um tracer
+        # inexistente quando há listeners de parse; eles saem e voltam em volta do reset
+        listeners = self.parser._parseListeners
+        self.parser._parseListeners = None
+        self.parser.reset()
+        self.parser._parseListeners = listeners
+        self._configure_full_ll()
+        return self.parser.program()
+
     def get_parse_tree(self):
         return self.parse_tree
 
+    def get_prediction_mode(self):
+        return self.prediction_mode
+
+    def get_retries(self):
+        return self.retries
+
+    def get_profile_report(self):
+        if not self.profile or self.parser is None:
+            return None
+        return format_profile(self.parser, self.parser._interp, self.parse_seconds)
+
+    def release(self):
+        # Depois da conversão para a AST tipada (src/ast/lowering.py) a árvore de parse não é
+        # mais usada. O parser também sai: o ATN simulator guarda o último stream e contexto.
+        self.parse_tree = None
+        self.parser = None
+        self.token_stream = None
+
     def is_successful(self):
         return self.parser_successful
\ No newline at end of file
@@ -0,0 +1,96 @@
+import time
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+# O runtime Python do ANTLR não traz o ProfilingATNSimulator do runtime Java; esta é uma
+# versão reduzida dele. Para cada decisão que passa pelo adaptivePredict, registra quantas
+# vezes ela foi chamada, o tempo gasto na predição e quantos tokens foram olhados à frente,
+# separando o SLL (DFA/ATN sem contexto) do LL completo (fallback com contexto).
+# Decisões LL(1), que o código gerado resolve com um simples teste de LA(1), não passam por
+# aqui e não aparecem no perfil.
+
+class DecisionInfo:
+    __slots__ = ('decision', 'invocations', 'time_ns',
+                 'sll_total_look', 'sll_max_look', 'll_fallbacks', 'll_total_look', 'll_max_look',
+                 'sll_dfa_transitions', 'sll_atn_transitions', 'll_atn_transitions')
+
+    def __init__(self, decision):
+        self.decision = decision
+        self.invocations = 0
+        self.time_ns = 0
+        self.sll_total_look = 0
+        self.sll_max_look = 0
+        self.ll_fallbacks = 0
+        self.ll_total_look = 0
+        self.ll_max_look = 0
+        self.sll_dfa_transitions = 0 # Passos resolvidos pelo DFA em cache
+        self.sll_atn_transitions = 0 # Passos que precisaram simular o ATN (DFA ainda sem a aresta)
+        self.ll_atn_transitions = 0
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    def __init__(self, parser, atn, decisionToDFA, sharedContextCache):
+        super().__init__(parser, atn, decisionToDFA, sharedContextCache)
+        self.decisions = [DecisionInfo(i) for i in range(len(atn.decisionToState))]
+        self.current_decision = -1
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+
+    def adaptivePredict(self, input, decision, outerContext):
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+        self.current_decision = decision
+        start_index = input.index
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info = self.decisions[decision]
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            sll_look = self.sll_stop_index - start_index + 1
+            info.sll_total_look += sll_look
+            info.sll_max_look = max(info.sll_max_look, sll_look)
+            if self.ll_stop_index >= 0:
+                ll_look = self.ll_stop_index - start_index + 1
+                info.ll_fallbacks += 1
+                info.ll_total_look += ll_look
+                info.ll_max_look = max(info.ll_max_look, ll_look)
+            self.current_decision = -1
+
+    def getExistingTargetState(self, previousD, t):
+        # Chamado a cada token olhado no SLL: a posição atual é o limite do lookahead
+        self.sll_stop_index = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None:
+            self.decisions[self.current_decision].sll_dfa_transitions += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        info = self.decisions[self.current_decision]
+        if fullCtx:
+            self.ll_stop_index = self._input.index
+            info.ll_atn_transitions += 1
+        else:
+            info.sll_atn_transitions += 1
+        return super().computeReachSet(closure, t, fullCtx)
+
+def format_profile(parser, simulator, parse_seconds):
+    # Tabela com uma linha por decisão invocada, da mais cara para a mais barata
+    rule_names = parser.ruleNames
+    decision_states = parser.atn.decisionToState
+    used = [info for info in simulator.decisions if info.invocations]
+    lines = ["--- Perfil de predição do parser ---"]
+    if not used:
+        lines.append(f"Nenhuma decisão passou pelo adaptivePredict ({len(decision_states)} decisões, todas resolvidas por LA(1)).")
+    else:
+        lines.append(f"{'dec':>4} {'regra':<26} {'invoc.':>8} {'look SLL méd/máx':>17} "
+                     f"{'LL fallb.':>9} {'look LL méd/máx':>16} {'DFA/ATN':>13} {'tempo (ms)':>11}")
+        for info in sorted(used, key=lambda info: info.time_ns, reverse=True):
+            rule = rule_names[decision_states[info.decision].ruleIndex]
+            sll = f"{info.sll_total_look / info.invocations:.2f}/{info.sll_max_look}"
+            ll = f"{info.ll_total_look / info.ll_fallbacks:.2f}/{info.ll_max_look}" if info.ll_fallbacks else "-"
+            transitions = f"{info.sll_dfa_transitions}/{info.sll_atn_transitions + info.ll_atn_transitions}"
+            lines.append(f"{info.decision:>4} {rule:<26} {info.invocations:>8} {sll:>17} "
+                         f"{info.ll_fallbacks:>9} {ll:>16} {transitions:>13} {info.time_ns / 1e6:>11.3f}")
+    prediction_ns = sum(info.time_ns for info in used)
+    lines.append(f"Tempo em predição: {prediction_ns / 1e6:.3f} ms de {parse_seconds * 1e3:.3f} ms de parse")
+    return "\n".join(lines)
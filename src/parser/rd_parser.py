@@ -0,0 +1,391 @@
+from antlr4.Token import Token
+from src.lexer.poglinLexer import poglinLexer as T
+from src.parser.poglin_parser import CustomErrorListener
+from src.lexer.token_streams import UnbufferedTokenStream
+from src.ast.flat_ast import FlatASTBuilder
+from src.ast.nodes import (Program, VarDecl, Assign, Read, Print, If, While, Pog,
+                           BinaryExpr, UnaryExpr, IntLiteral, StringLiteral, Name,
+                           BINARY_OPERATORS)
+
+# Precedência de cada tipo de token operador binário
+PRECEDENCE = {getattr(T, name): BINARY_OPERATORS[T.literalNames[getattr(T, name)][1:-1]]
+              for name in ('OR', 'AND', 'EQUALS', 'NEQUALS', 'LT', 'LTE', 'GT', 'GTE',
+                           'PLUS', 'MINUS', 'MULT', 'DIV')}
+
+STATEMENT_START = (T.VAR, T.ID, T.PRINTLN, T.IF, T.WHILE, T.POG)
+EXPRESSION_START = (T.NOT, T.LPAREN, T.ID, T.INT, T.STRING)
+
+# Tokens que podem vir logo depois de cada token esperado. Quando o token atual está
+# nesse conjunto, o erro é reportado como "missing", igual à inserção de um token do
+# DefaultErrorStrategy do ANTLR (aqui aproximado sem olhar o contexto da regra).
+FOLLOWS = {
+    T.START: (T.LBRACE,),
+    T.LBRACE: STATEMENT_START + (T.RBRACE,),
+    T.RBRACE: STATEMENT_START + (T.RBRACE, T.ELSE, T.END),
+    T.SEMI: STATEMENT_START + (T.RBRACE,),
+    T.LPAREN: EXPRESSION_START + (T.RPAREN,),
+    T.RPAREN: (T.LBRACE, T.SEMI, T.RPAREN) + tuple(PRECEDENCE),
+    T.ID: (T.COLON, T.ASSIGN),
+    T.COLON: (T.INT_TYPE, T.STRING_TYPE),
+    T.ASSIGN: EXPRESSION_START + (T.READLINE,),
+}
+
+class StreamedTokens:
+    # Acesso por índice absoluto (tokens[i], types[i]) sobre um UnbufferedTokenStream. O
+    # parser só olha para frente (pos e pos + 1), então pedir o índice i consome o stream
+    # até i e os tokens anteriores saem da janela.
+    __slots__ = ('stream', 'types')
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.types = StreamedTypes(self)
+
+    def __getitem__(self, i):
+        stream = self.stream
+        while stream.index < i and stream.LA(1) != Token.EOF:
+            stream.consume()
+        return stream.LT(1 + i - stream.index)
+
+class StreamedTypes:
+    __slots__ = ('tokens',)
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def __getitem__(self, i):
+        return self.tokens[i].type
+
+class ASTBuilder:
+    # Monta a AST tipada de src/ast/nodes.py a partir dos tokens que o parser reconheceu.
+    # O FlatASTBuilder (src/ast/flat_ast.py) tem a mesma interface e monta a AST em arrays.
+    def program(self, start, statements):
+        return Program(statements, start.line, start.column)
+
+    def var_decl(self, name, var_type, value):
+        return VarDecl(name.text, var_type.text, value, name.line, name.column)
+
+    def assign(self, name, value):
+        return Assign(name.text, value, name.line, name.column)
+
+    def read(self, name):
+        return Read(name.text, name.line, name.column)
+
+    def print(self, keyword, value):
+        return Print(value, keyword.line, keyword.column)
+
+    def if_(self, keyword, condition, then_body, else_body):
+        return If(condition, then_body, else_body, keyword.line, keyword.column)
+
+    def while_(self, keyword, condition, body):
+        return While(condition, body, keyword.line, keyword.column)
+
+    def pog(self, keyword):
+        return Pog(keyword.line, keyword.column)
+
+    def binary(self, ops, operands):
+        return BinaryExpr([op.text for op in ops], [(op.line, op.column) for op in ops], operands)
+
+    def unary(self, op, operand):
+        return UnaryExpr(op.text, operand, op.line, op.column)
+
+    def int_literal(self, token):
+        return IntLiteral(int(token.text), token.line, token.column)
+
+    def string_literal(self, token):
+        return StringLiteral(token.text, token.line, token.column)
+
+    def name(self, token):
+        return Name(token.text, token.line, token.column)
+
+class RecursiveDescentParser:
+    # Parser descendente recursivo para os comandos e precedence climbing para a cadeia
+    # logicalOr ... multiplicative -> unary da gramática. Constrói a AST tipada direto dos
+    # tokens, sem árvore de parse. Erros são reportados no mesmo formato das mensagens do
+    # ANTLR ("mismatched input", "missing", "extraneous input") via CustomErrorListener.
+    # Os blocos de if/while e as expressões entre parênteses não recursam no Python: cada
+    # nível aberto fica numa pilha explícita, então o aninhamento não esbarra no limite de
+    # recursão.
+    def __init__(self, token_stream, builder=None):
+        self.build = builder or ASTBuilder()
+        if isinstance(token_stream, UnbufferedTokenStream):
+            self.tokens = StreamedTokens(token_stream)
+            self.types = self.tokens.types
+        else:
+            token_stream.fill()
+            self.tokens = [t for t in token_stream.tokens if t.channel == Token.DEFAULT_CHANNEL]
+            self.types = [t.type for t in self.tokens]
+        self.pos = 0
+        self.listener = CustomErrorListener()
+
+    # Utilitários
+    def _advance(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, token_type):
+        if self.types[self.pos] == token_type:
+            token = self.tokens[self.pos]
+            self.pos += 1
+            return token
+        self._mismatch((token_type,), single=True)
+
+    def _display(self, token_type):
+        if token_type == Token.EOF:
+            return "<EOF>"
+        literal = T.literalNames[token_type] if token_type < len(T.literalNames) else "<INVALID>"
+        return literal if literal != "<INVALID>" else T.symbolicNames[token_type]
+
+    def _expecting(self, token_types):
+        if len(token_types) == 1:
+            return self._display(token_types[0])
+        return "{" + ", ".join(self._display(t) for t in sorted(token_types)) + "}"
+
+    def _token_display(self, token):
+        if token.type == Token.EOF:
+            return "'<EOF>'"
+        text = token.text.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        return f"'{text}'"
+
+    def _error(self, token, msg):
+        # O listener imprime "ERRO SINTÁTICO [Linha, Coluna]: ..." e interrompe o parse
+        self.listener.syntaxError(self, token, token.line, token.column, msg, None)
+
+    def _mismatch(self, expected, single=False):
+        token = self.tokens[self.pos]
+        following = self.types[self.pos + 1] if token.type != Token.EOF else Token.EOF
+        if token.type != Token.EOF and following in expected:
+            self._error(token, f"extraneous input {self._token_display(token)} expecting {self._expecting(expected)}")
+        if single and token.type in FOLLOWS.get(expected[0], ()):
+            self._error(token, f"missing {self._display(expected[0])} at {self._token_display(token)}")
+        self._error(token, f"mismatched input {self._token_display(token)} expecting {self._expecting(expected)}")
+
+    # Comandos
+    def parse_program(self, ends=None):
+        start = self._expect(T.START)
+        self._expect(T.LBRACE)
+        return self.build.program(start, self.parse_program_body(ends))
+
+    def parse_program_body(self, ends=None):
+        # Comandos do bloco do programa até '}' 'end'. ends, se dado, recebe o índice do token
+        # seguinte a cada comando (usado pela análise incremental, src/parser/incremental.py)
+        statements = self._statements(ends)
+        self._expect(T.RBRACE)
+        self._expect(T.END) # Como a regra 'program' da gramática, não exige EOF depois de 'end'
+        return statements
+
+    def parse_statement(self):
+        # Um único comando, na posição atual
+        parse = self._statement_parsers.get(self.types[self.pos])
+        if parse is None:
+            self._mismatch(STATEMENT_START + (T.RBRACE,))
+        return parse(self)
+
+    def _statements(self, ends=None):
+        # statement* seguido de '}'
+        statements = []
+        types = self.types
+        while True:
+            token_type = types[self.pos]
+            if token_type == T.RBRACE:
+                return statements
+            parse = self._statement_parsers.get(token_type)
+            if parse is None:
+                self._mismatch(STATEMENT_START + (T.RBRACE,))
+            statements.append(parse(self))
+            if ends is not None:
+                ends.append(self.pos)
+
+    def _var_declaration(self):
+        self._advance() # 'var'
+        name = self._expect(T.ID)
+        self._expect(T.COLON)
+        if self.types[self.pos] not in (T.INT_TYPE, T.STRING_TYPE):
+            self._mismatch((T.INT_TYPE, T.STRING_TYPE))
+        var_type = self._advance()
+        self._expect(T.ASSIGN)
+        value = self._expression()
+        self._expect(T.SEMI)
+        return self.build.var_decl(name, var_type, value)
+
+    def _assignment_or_read(self):
+        name = self._advance()
+        self._expect(T.ASSIGN)
+        if self.types[self.pos] == T.READLINE:
+            self._advance()
+            self._expect(T.LPAREN)
+            self._expect(T.RPAREN)
+            self._expect(T.SEMI)
+            return self.build.read(name)
+        if self.types[self.pos] not in EXPRESSION_START:
+            # Mesmo conjunto esperado da regra fatorada: ID '=' (expression | readLine '(' ')') ';'
+            self._mismatch(EXPRESSION_START + (T.READLINE,))
+        value = self._expression()
+        self._expect(T.SEMI)
+        return self.build.assign(name, value)
+
+    def _print_statement(self):
+        keyword = self._advance()
+        self._expect(T.LPAREN)
+        value = self._expression()
+        self._expect(T.RPAREN)
+        self._expect(T.SEMI)
+        return self.build.print(keyword, value)
+
+    def _compound_statement(self):
+        # if/while e os comandos dos seus blocos. Cada if/while aberto fica na pilha como
+        # (palavra-chave, condição, corpo do then já lido ou None, comandos do bloco de fora)
+        types = self.types
+        stack = []
+        statements = None
+        while True:
+            token_type = types[self.pos]
+            if token_type == T.IF or token_type == T.WHILE:
+                keyword = self._advance()
+                self._expect(T.LPAREN)
+                condition = self._expression()
+                self._expect(T.RPAREN)
+                self._expect(T.LBRACE)
+                stack.append((keyword, condition, None, statements))
+                statements = []
+                continue
+            if token_type != T.RBRACE:
+                parse = self._statement_parsers.get(token_type)
+                if parse is None:
+                    self._mismatch(STATEMENT_START + (T.RBRACE,))
+                statements.append(parse(self))
+                continue
+            self._advance() # '}' do bloco mais interno
+            keyword, condition, then_body, outer = stack.pop()
+            if keyword.type == T.WHILE:
+                node = self.build.while_(keyword, condition, statements)
+            elif then_body is None and types[self.pos] == T.ELSE:
+                self._advance()
+                self._expect(T.LBRACE)
+                stack.append((keyword, condition, statements, outer))
+                statements = []
+                continue
+            elif then_body is None:
+                node = self.build.if_(keyword, condition, statements, None)
+            else:
+                node = self.build.if_(keyword, condition, then_body, statements)
+            if not stack:
+                return node
+            statements = outer
+            statements.append(node)
+
+    def _pog_statement(self):
+        keyword = self._advance()
+        self._expect(T.SEMI)
+        return self.build.pog(keyword)
+
+    _statement_parsers = {
+        T.VAR: _var_declaration,
+        T.ID: _assignment_or_read,
+        T.PRINTLN: _print_statement,
+        T.IF: _compound_statement,
+        T.WHILE: _compound_statement,
+        T.POG: _pog_statement,
+    }
+
+    # Expressões
+    def _expression(self, min_precedence=1):
+        # Precedence climbing: operadores de um mesmo nível são acumulados num único
+        # BinaryExpr n-ário; um operador de nível menor (mas >= min_precedence) faz do
+        # resultado o primeiro operando do próximo nó.
+        # Cada expressão em andamento é um quadro [precedência mínima, '!' do início, nível
+        # aberto, operadores e operandos do nível, entre parênteses?]. O operando à direita de
+        # um operador e o conteúdo de '(' ... ')' abrem um quadro novo na pilha; quando ele
+        # termina, o valor volta como operando ou como o primary do quadro de baixo.
+        types = self.types
+        build = self.build
+        stack = []
+        frame = [min_precedence, [], None, None, None, False]
+        while True:
+            # unary: '!'* primary
+            nots = frame[1]
+            while types[self.pos] == T.NOT:
+                nots.append(self._advance())
+            token_type = types[self.pos]
+            if token_type == T.LPAREN:
+                self._advance()
+                stack.append(frame)
+                frame = [1, [], None, None, None, True]
+                continue
+            if token_type == T.INT:
+                value = build.int_literal(self._advance())
+            elif token_type == T.STRING:
+                value = build.string_literal(self._advance())
+            elif token_type == T.ID:
+                value = build.name(self._advance())
+            else:
+                self._mismatch(EXPRESSION_START)
+            primary = True
+            while True:
+                min_precedence, nots, level, ops, operands, parenthesized = frame
+                if primary:
+                    for op in reversed(nots):
+                        value = build.unary(op, value)
+                    left = value
+                else:
+                    operands.append(value)
+                precedence = PRECEDENCE.get(types[self.pos])
+                if ops is not None:
+                    if precedence == level:
+                        ops.append(self._advance())
+                        break
+                    left = build.binary(ops, operands)
+                    frame[3] = ops = None
+                if precedence is not None and precedence >= min_precedence:
+                    frame[2:5] = precedence, [self._advance()], [left]
+                    break
+                # Expressão do quadro completa: left
+                if parenthesized:
+                    self._expect(T.RPAREN)
+                if not stack:
+                    return left
+                frame = stack.pop()
+                value = left
+                primary = parenthesized
+            # Operando à direita do operador que acabou de entrar no nível aberto
+            stack.append(frame)
+            frame = [frame[2] + 1, [], None, None, None, False]
+
+class PoglinRDParserAnalyzer:
+    # Mesma interface do PoglinParserAnalyzer, mas produz a AST tipada em vez da árvore de parse
+    def __init__(self, token_stream, flat=False):
+        self.token_stream = token_stream
+        self.parser_successful = False
+        self.ast = None
+        self.flat = flat # Monta a AST em arrays (FlatAST) em vez de um objeto por nó
+        self.flat_ast = None
+        self.parser = None
+
+    def analyze(self):
+        try:
+            self.parser = RecursiveDescentParser(self.token_stream, FlatASTBuilder() if self.flat else None)
+            self.ast = self.parser.parse_program()
+            if self.flat:
+                # As fases visitam a visão da raiz, que tem a interface dos nós tipados
+                self.flat_ast = self.ast
+                self.ast = self.flat_ast.root()
+            self.parser_successful = True
+        except Exception as e:
+            self.parser_successful = False
+            # A mensagem de erro já foi impressa pelo CustomErrorListener
+
+        return self.parser_successful
+
+    def get_ast(self):
+        return self.ast
+
+    def get_flat_ast(self):
+        return self.flat_ast
+
+    def release(self):
+        # Mantém só a AST: o parser guarda a visão dos tokens
+        self.parser = None
+        self.token_stream = None
+
+    def is_successful(self):
+        return self.parser_successful
@@ -0,0 +1,29 @@
+from antlr4.tree.Tree import ParseTreeListener
+from src.lexer.poglinParser import poglinParser
+
+# Regras da cadeia de precedência que, sem operador, só repassam o único filho. Um literal
+# como '5' vira expression -> logicalOr -> logicalAnd -> equality -> relational -> additive
+# -> multiplicative -> unary -> primary: nove contextos para um token.
+PASS_THROUGH = frozenset((
+    poglinParser.LogicalOrExpressionContext,
+    poglinParser.LogicalAndExpressionContext,
+    poglinParser.EqualityExpressionContext,
+    poglinParser.RelationalExpressionContext,
+    poglinParser.AdditiveExpressionContext,
+    poglinParser.MultiplicativeExpressionContext,
+    poglinParser.UnaryExpressionContext,
+))
+
+class PassThroughCollapser(ParseTreeListener):
+    # Listener de parse (parser.addParseListener): ao sair de uma regra de repasse com um só
+    # filho, troca o contexto pelo filho na lista do pai, que ainda está sendo montado e tem
+    # esse contexto como último filho. A troca é em cascata: cada nível recebe o filho já
+    # colapsado do nível de baixo, então '5' fica expression -> primary.
+    # ExpressionContext é mantido porque os acessores gerados (ctx.expression()) o procuram
+    # pelo tipo; PrimaryContext é mantido porque distingue literal, nome e parênteses.
+    def exitEveryRule(self, ctx):
+        if type(ctx) in PASS_THROUGH and ctx.children is not None and len(ctx.children) == 1:
+            parent = ctx.parentCtx
+            child = ctx.children[0]
+            child.parentCtx = parent
+            parent.children[-1] = child
@@ -0,0 +1,575 @@
+from src.ast.nodes import NodeVisitor
+
+# Interpretação abstrata do programa já validado pela semântica (--intervals). Cada variável
+# Int tem um intervalo [lo, hi] dos valores que pode ter naquele ponto (constantes são
+# intervalos de um valor só); Strings não são acompanhadas. A análise segue o fluxo:
+#   - if: cada ramo parte do estado refinado pela condição (x < 10 limita x) e os estados no
+#     fim dos ramos são unidos;
+#   - while: a cabeça do laço é iterada até um ponto fixo, com alargamento (widening: o limite
+#     que continua crescendo vai para o extremo do Int) depois de WIDENING_DELAY iterações e
+#     uma iteração descendente no fim (narrowing: 'i < 10' volta a limitar i em 10); a saída é
+#     a cabeça refinada pela negação da condição.
+# Reporta divisões cujo divisor é sempre 0 (erro) ou pode ser 0 (aviso) e marca em dead os
+# corpos de if/else/while que nunca executam (e os ifs sem else com condição sempre
+# verdadeira), que o TAC deixa de gerar junto com o teste da condição.
+#
+# O estado é um dict id do símbolo -> intervalo com uma trilha de desfazer: um ramo escreve
+# direto no estado e, no fim, as escritas dele são recolhidas e desfeitas, então o custo de um
+# if é proporcional ao que os ramos mudam, não ao número de variáveis vivas. Os ids vêm do
+# replay da tabela de símbolos (SymbolTable.rewind), como no TAC.
+#
+# Laços aninhados: só o laço mais externo em análise itera até o ponto fixo com os
+# diagnósticos ligados. Dentro dessas iterações (modo quiet) um laço interno é percorrido uma
+# vez e toda variável de fora atribuída em qualquer ponto do corpo dele vai para TOP (não só as
+# que essa passada mudou: uma atribuição pode só ser alcançada nas iterações seguintes); quando
+# o corpo de fora é percorrido pela última vez, o laço interno faz o seu próprio ponto fixo.
+# Assim cada comando é percorrido O(iterações x profundidade de laços) vezes.
+
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+TOP = (INT_MIN, INT_MAX)
+TRUE, FALSE, BOOL = (1, 1), (0, 0), (0, 1)
+WIDENING_DELAY = 2
+
+# Comparação equivalente com os lados trocados e a negação de cada comparação
+MIRRORED = {'<': '>', '<=': '>=', '>': '<', '>=': '<=', '==': '==', '!=': '!='}
+NEGATED = {'<': '>=', '<=': '>', '>': '<=', '>=': '<', '==': '!=', '!=': '=='}
+
+def clamp(lo, hi):
+    # Fora do Int de 32 bits o valor dá a volta: qualquer Int
+    if lo < INT_MIN or hi > INT_MAX:
+        return TOP
+    return (lo, hi)
+
+def join(a, b):
+    return (min(a[0], b[0]), max(a[1], b[1]))
+
+def widen(old, new):
+    return (old[0] if new[0] >= old[0] else INT_MIN, old[1] if new[1] <= old[1] else INT_MAX)
+
+def nonzero(value):
+    return value[0] > 0 or value[1] < 0
+
+def truth_value(always_true, always_false):
+    return TRUE if always_true else FALSE if always_false else BOOL
+
+def format_interval(value):
+    lo = "-inf" if value[0] == INT_MIN else value[0]
+    hi = "+inf" if value[1] == INT_MAX else value[1]
+    return f"[{lo}, {hi}]"
+
+def truncated_division(a, b):
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+def divide(a, b):
+    # a / b com b sem o 0: o quociente (truncado) é monótono em cada argumento enquanto o
+    # sinal do divisor não muda, então basta olhar os cantos de cada parte do divisor
+    quotients = []
+    if b[0] < 0:
+        quotients += [truncated_division(x, y) for x in a for y in (b[0], min(b[1], -1))]
+    if b[1] > 0:
+        quotients += [truncated_division(x, y) for x in a for y in (max(b[0], 1), b[1])]
+    if not quotients:
+        return TOP
+    return clamp(min(quotients), max(quotients))
+
+def binary(op, a, b):
+    # Intervalo de 'a op b' (None: String); '/' é tratado pelo analisador
+    if op == '==' or op == '!=':
+        if a is None or b is None:
+            return BOOL
+        equal = a[0] == a[1] == b[0] == b[1]
+        different = a[1] < b[0] or b[1] < a[0]
+        return truth_value(equal, different) if op == '==' else truth_value(different, equal)
+    if a is None or b is None:
+        return None # '+' com String: concatenação
+    if op == '+':
+        return clamp(a[0] + b[0], a[1] + b[1])
+    if op == '-':
+        return clamp(a[0] - b[1], a[1] - b[0])
+    if op == '*':
+        products = [x * y for x in a for y in b]
+        return clamp(min(products), max(products))
+    if op == '<':
+        return truth_value(a[1] < b[0], a[0] >= b[1])
+    if op == '<=':
+        return truth_value(a[1] <= b[0], a[0] > b[1])
+    if op == '>':
+        return truth_value(a[0] > b[1], a[1] <= b[0])
+    if op == '>=':
+        return truth_value(a[0] >= b[1], a[1] < b[0])
+    if op == '&&':
+        return truth_value(nonzero(a) and nonzero(b), a == FALSE or b == FALSE)
+    if op == '||':
+        return truth_value(nonzero(a) or nonzero(b), a == FALSE and b == FALSE)
+    return TOP
+
+def assigned_names(statements):
+    # Nomes atribuídos em qualquer ponto dos comandos, incluindo blocos aninhados
+    names = set()
+    stack = list(statements)
+    while stack:
+        node = stack.pop()
+        method = node.visit_method
+        if method == 'visitAssign':
+            names.add(node.name)
+        elif method == 'visitIf':
+            stack.extend(node.then_body)
+            if node.else_body is not None:
+                stack.extend(node.else_body)
+        elif method == 'visitWhile':
+            stack.extend(node.body)
+    return names
+
+def restrict(value, op, bound):
+    # Parte de value que satisfaz 'value op bound'; None se nenhuma
+    lo, hi = value
+    if op == '<':
+        hi = min(hi, bound[1] - 1)
+    elif op == '<=':
+        hi = min(hi, bound[1])
+    elif op == '>':
+        lo = max(lo, bound[0] + 1)
+    elif op == '>=':
+        lo = max(lo, bound[0])
+    elif op == '==':
+        lo, hi = max(lo, bound[0]), min(hi, bound[1])
+    elif bound[0] == bound[1]: # '!=' com constante: só corta nas pontas
+        if lo == bound[0]:
+            lo += 1
+        if hi == bound[0]:
+            hi -= 1
+    return (lo, hi) if lo <= hi else None
+
+class IntervalAnalyzer(NodeVisitor):
+    def __init__(self, symbol_table):
+        super().__init__()
+        self.symbol_table = symbol_table
+        self.values = {}        # id do símbolo Int -> intervalo
+        self.trail = []         # (id, intervalo anterior ou None) de cada escrita em values
+        self.reachable = True   # False: o ponto atual nunca executa (só refaz as declarações)
+        self.quiet = False      # True: iterações de ponto fixo, sem diagnósticos nem marcas
+        self.errors = []
+        self.warnings = []
+        # (linha, coluna) do if/while -> (bloco morto: 'then', 'else' ou 'body', posição do
+        # replay de símbolos logo depois dele)
+        self.dead = {}
+        self.writes = {}        # (linha, coluna) do while -> nomes atribuídos no corpo
+
+    def report_error(self, message, line, column):
+        self.errors.append(f"ERRO SEMÂNTICO [Linha {line}, Coluna {column}]: {message}")
+
+    def report_warning(self, message, line, column):
+        self.warnings.append(f"AVISO [Linha {line}, Coluna {column}]: {message}")
+
+    def get_errors(self):
+        return self.errors
+
+    # Estado: escritas com trilha de desfazer
+    def assign(self, symbol_id, value):
+        self.trail.append((symbol_id, self.values.get(symbol_id)))
+        self.values[symbol_id] = value
+
+    def undo(self, mark):
+        values = self.values
+        trail = self.trail
+        while len(trail) > mark:
+            symbol_id, previous = trail.pop()
+            if previous is None:
+                del values[symbol_id]
+            else:
+                values[symbol_id] = previous
+
+    def leave_branch(self, mark, first_id):
+        # Valores no fim do ramo das variáveis de fora dele que o ramo mudou (None se o fim do
+        # ramo é inalcançável); desfaz o ramo
+        changes = None
+        if self.reachable:
+            values = self.values
+            changes = {symbol_id: values[symbol_id] for symbol_id, _ in self.trail[mark:] if symbol_id < first_id}
+        self.undo(mark)
+        self.reachable = True
+        return changes
+
+    def merge(self, left, right):
+        if left is None or right is None:
+            # Só um ramo chega ao fim (ou nenhum)
+            changes = left if right is None else right
+            if changes is None:
+                self.reachable = False
+            for symbol_id, value in (changes or {}).items():
+                self.assign(symbol_id, value)
+            return
+        values = self.values
+        for symbol_id in left.keys() | right.keys():
+            current = values[symbol_id]
+            self.assign(symbol_id, join(left.get(symbol_id, current), right.get(symbol_id, current)))
+
+    def iterate(self, changes, iteration, entry):
+        # Junta à cabeça do laço o estado no fim do corpo; True se a cabeça mudou. entry guarda
+        # o valor de antes do laço de cada variável que a cabeça mudou
+        changed = False
+        values = self.values
+        for symbol_id, value in (changes or {}).items():
+            current = values[symbol_id]
+            new = join(current, value)
+            if iteration >= WIDENING_DELAY:
+                new = widen(current, new)
+            if new != current:
+                entry.setdefault(symbol_id, current)
+                self.assign(symbol_id, new)
+                changed = True
+        return changed
+
+    def narrow_head(self, entry, changes):
+        # Cabeça = antes do laço ∪ fim do corpo na cabeça estável: ainda contém todo estado
+        # alcançável e desfaz o excesso do alargamento
+        values = self.values
+        for symbol_id, before in entry.items():
+            current = values[symbol_id]
+            value = before if changes is None else join(before, changes.get(symbol_id, current))
+            if value != current:
+                self.assign(symbol_id, value)
+
+    def havoc(self, node):
+        # Variáveis Int visíveis no while que o corpo atribui em algum ponto vão para TOP
+        key = (node.line, node.column)
+        names = self.writes.get(key)
+        if names is None:
+            names = self.writes[key] = assigned_names(node.body)
+        symbol_table = self.symbol_table
+        for name in names:
+            symbol_id = symbol_table.lookup(name)
+            if symbol_id is not None and symbol_table.types[symbol_id] == 'Int':
+                self.assign(symbol_id, TOP)
+
+    def mark_dead(self, node, block):
+        if not self.quiet:
+            self.dead[(node.line, node.column)] = (block, self.symbol_table.replay_position())
+
+    # Condições
+    def enter_branch(self, condition, truth, value):
+        # Estado no início do ramo em que a condição vale truth
+        if (value == FALSE) if truth else nonzero(value):
+            self.reachable = False
+        else:
+            self.refine(condition, truth)
+
+    def refine(self, condition, truth):
+        # Restringe as variáveis comparadas na condição (só comparações com um nome ou literal
+        # de cada lado, e cadeias de && verdadeiras ou de || falsas)
+        stack = [(condition, truth)]
+        while stack and self.reachable:
+            node, truth = stack.pop()
+            method = node.visit_method
+            if method == 'visitUnaryExpr':
+                stack.append((node.operand, not truth))
+            elif method == 'visitName':
+                self.refine_name(node, '!=' if truth else '==', FALSE)
+            elif method == 'visitBinaryExpr':
+                ops = node.ops
+                if all(op == ('&&' if truth else '||') for op in ops):
+                    stack.extend((operand, truth) for operand in node.operands)
+                elif len(ops) == 1 and ops[0] in NEGATED:
+                    op = ops[0] if truth else NEGATED[ops[0]]
+                    left, right = node.operands
+                    left_value, right_value = self.operand_value(left), self.operand_value(right)
+                    if left_value is not None and right_value is not None:
+                        self.refine_name(left, op, right_value)
+                        self.refine_name(right, MIRRORED[op], left_value)
+
+    def operand_value(self, node):
+        if node.visit_method == 'visitIntLiteral':
+            return clamp(node.value, node.value)
+        if node.visit_method == 'visitName':
+            return self.name_value(node.name)
+        return None
+
+    def refine_name(self, node, op, bound):
+        if node.visit_method != 'visitName' or not self.reachable:
+            return
+        symbol_id = self.symbol_table.lookup(node.name)
+        value = self.values.get(symbol_id)
+        if value is None:
+            return
+        restricted = restrict(value, op, bound)
+        if restricted is None:
+            self.reachable = False
+        elif restricted != value:
+            self.assign(symbol_id, restricted)
+
+    # Expressões
+    def name_value(self, name):
+        symbol_id = self.symbol_table.lookup(name)
+        if self.symbol_table.types[symbol_id] != 'Int':
+            return None
+        return self.values.get(symbol_id, TOP)
+
+    def binary_step(self, op, left, right, line, column):
+        if op != '/':
+            return binary(op, left, right)
+        if right[0] <= 0 <= right[1] and not self.quiet:
+            if right == FALSE:
+                self.report_error("Divisão por zero garantida: o divisor vale sempre 0.", line, column)
+            else:
+                self.report_warning(f"Possível divisão por zero: o divisor pode valer 0 (intervalo {format_interval(right)}).", line, column)
+        return divide(left, right)
+
+    def initialize(self, node, symbol_id, value):
+        # A variável já está declarada quando a inicialização é avaliada (como na semântica e
+        # no TAC): 'var x : Int = x' lê o x novo, ainda sem valor (TOP)
+        if node.var_type == 'Int':
+            self.assign(symbol_id, value)
+
+    def store(self, name, value):
+        symbol_id = self.symbol_table.lookup(name)
+        if self.symbol_table.types[symbol_id] == 'Int':
+            self.assign(symbol_id, value)
+
+    # Visita da AST tipada (src/ast/nodes.py)
+    def visitProgram(self, node):
+        self.symbol_table.rewind()
+        self.symbol_table.enter_scope()
+        self.visit_block(node.statements)
+        return len(self.errors) == 0
+
+    def visit_block(self, statements):
+        for statement in statements:
+            self.visit(statement)
+
+    def visit_scope(self, statements):
+        self.symbol_table.enter_scope()
+        self.visit_block(statements)
+        self.symbol_table.exit_scope()
+
+    def visitVarDecl(self, node):
+        symbol_id = self.symbol_table.declare(node.name, node.var_type)
+        if self.reachable:
+            self.initialize(node, symbol_id, self.visit(node.value))
+        return None
+
+    def visitAssign(self, node):
+        if self.reachable:
+            self.store(node.name, self.visit(node.value))
+        return None
+
+    def visitRead(self, node):
+        return None
+
+    def visitPrint(self, node):
+        if self.reachable:
+            self.visit(node.value)
+        return None
+
+    def visitPog(self, node):
+        return None
+
+    def visitIf(self, node):
+        if not self.reachable:
+            self.visit_scope(node.then_body)
+            if node.else_body is not None:
+                self.visit_scope(node.else_body)
+            return None
+        value = self.visit(node.condition)
+        first_id = self.symbol_table.replay
+
+        mark = len(self.trail)
+        self.enter_branch(node.condition, True, value)
+        self.visit_scope(node.then_body)
+        then_changes = self.leave_branch(mark, first_id)
+        if value == FALSE:
+            self.mark_dead(node, 'then')
+
+        self.enter_branch(node.condition, False, value)
+        if node.else_body is not None:
+            self.visit_scope(node.else_body)
+        if nonzero(value):
+            self.mark_dead(node, 'else') # Sem else, só a condição morre: o then é emitido direto
+        else_changes = self.leave_branch(mark, first_id)
+
+        self.merge(then_changes, else_changes)
+        return None
+
+    def visitWhile(self, node):
+        if not self.reachable:
+            self.visit_scope(node.body)
+            return None
+        quiet = self.quiet
+        start = self.symbol_table.replay_position()
+        first_id = start[0]
+        self.quiet = True
+        value = self.visit(node.condition)
+        if value == FALSE:
+            self.quiet = quiet
+            self.visit(node.condition) # Diagnósticos da condição, avaliada uma vez só
+            self.reachable = False
+            self.visit_scope(node.body)
+            self.reachable = True
+            self.mark_dead(node, 'body')
+            return None
+
+        iteration = 0
+        entry = {}
+        while True:
+            mark = len(self.trail)
+            self.enter_branch(node.condition, True, value)
+            self.visit_scope(node.body)
+            changes = self.leave_branch(mark, first_id)
+            if quiet:
+                # Dentro do ponto fixo de um laço de fora: uma passada só
+                self.havoc(node)
+                value = self.visit(node.condition)
+                break
+            if not self.iterate(changes, iteration, entry):
+                # Cabeça estável: última passada, com os diagnósticos
+                self.quiet = False
+                self.symbol_table.seek(start)
+                value = self.visit(node.condition)
+                mark = len(self.trail)
+                self.enter_branch(node.condition, True, value)
+                self.visit_scope(node.body)
+                self.narrow_head(entry, self.leave_branch(mark, first_id))
+                self.quiet = True
+                value = self.visit(node.condition)
+                break
+            iteration += 1
+            self.symbol_table.seek(start)
+            value = self.visit(node.condition)
+
+        self.quiet = quiet
+        self.enter_branch(node.condition, False, value)
+        return None
+
+    def visitBinaryExpr(self, node):
+        # Dobra à esquerda: operands[0] ops[0] operands[1] ops[1] ...
+        value = self.visit(node.operands[0])
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            value = self.binary_step(op, value, self.visit(operand), line, column)
+        return value
+
+    def visitUnaryExpr(self, node):
+        value = self.visit(node.operand)
+        return truth_value(value == FALSE, nonzero(value))
+
+    def visitIntLiteral(self, node):
+        return clamp(node.value, node.value)
+
+    def visitStringLiteral(self, node):
+        return None
+
+    def visitName(self, node):
+        return self.name_value(node.name)
+
+    # Versões sem recursão (NodeVisitor.walk): mesma ordem de visitas dos métodos acima
+    def walkProgram(self, node):
+        self.symbol_table.rewind()
+        self.symbol_table.enter_scope()
+        for statement in node.statements:
+            yield statement
+        return len(self.errors) == 0
+
+    def walk_scope(self, statements):
+        self.symbol_table.enter_scope()
+        for statement in statements:
+            yield statement
+        self.symbol_table.exit_scope()
+
+    def walkVarDecl(self, node):
+        symbol_id = self.symbol_table.declare(node.name, node.var_type)
+        if self.reachable:
+            self.initialize(node, symbol_id, (yield node.value))
+        return None
+
+    def walkAssign(self, node):
+        if self.reachable:
+            self.store(node.name, (yield node.value))
+        return None
+
+    def walkPrint(self, node):
+        if self.reachable:
+            yield node.value
+        return None
+
+    def walkIf(self, node):
+        if not self.reachable:
+            yield from self.walk_scope(node.then_body)
+            if node.else_body is not None:
+                yield from self.walk_scope(node.else_body)
+            return None
+        value = yield node.condition
+        first_id = self.symbol_table.replay
+
+        mark = len(self.trail)
+        self.enter_branch(node.condition, True, value)
+        yield from self.walk_scope(node.then_body)
+        then_changes = self.leave_branch(mark, first_id)
+        if value == FALSE:
+            self.mark_dead(node, 'then')
+
+        self.enter_branch(node.condition, False, value)
+        if node.else_body is not None:
+            yield from self.walk_scope(node.else_body)
+        if nonzero(value):
+            self.mark_dead(node, 'else') # Sem else, só a condição morre: o then é emitido direto
+        else_changes = self.leave_branch(mark, first_id)
+
+        self.merge(then_changes, else_changes)
+        return None
+
+    def walkWhile(self, node):
+        if not self.reachable:
+            yield from self.walk_scope(node.body)
+            return None
+        quiet = self.quiet
+        start = self.symbol_table.replay_position()
+        first_id = start[0]
+        self.quiet = True
+        value = yield node.condition
+        if value == FALSE:
+            self.quiet = quiet
+            yield node.condition
+            self.reachable = False
+            yield from self.walk_scope(node.body)
+            self.reachable = True
+            self.mark_dead(node, 'body')
+            return None
+
+        iteration = 0
+        entry = {}
+        while True:
+            mark = len(self.trail)
+            self.enter_branch(node.condition, True, value)
+            yield from self.walk_scope(node.body)
+            changes = self.leave_branch(mark, first_id)
+            if quiet:
+                self.havoc(node)
+                value = yield node.condition
+                break
+            if not self.iterate(changes, iteration, entry):
+                self.quiet = False
+                self.symbol_table.seek(start)
+                value = yield node.condition
+                mark = len(self.trail)
+                self.enter_branch(node.condition, True, value)
+                yield from self.walk_scope(node.body)
+                self.narrow_head(entry, self.leave_branch(mark, first_id))
+                self.quiet = True
+                value = yield node.condition
+                break
+            iteration += 1
+            self.symbol_table.seek(start)
+            value = yield node.condition
+
+        self.quiet = quiet
+        self.enter_branch(node.condition, False, value)
+        return None
+
+    def walkBinaryExpr(self, node):
+        value = yield node.operands[0]
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            value = self.binary_step(op, value, (yield operand), line, column)
+        return value
+
+    def walkUnaryExpr(self, node):
+        value = yield node.operand
+        return truth_value(value == FALSE, nonzero(value))
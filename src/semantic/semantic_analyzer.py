@@ -1,16 +1,39 @@
 import sys
-from src.lexer.poglinParser import poglinParser
-from src.lexer.poglinVisitor import poglinVisitor
 from src.semantic.symbol_table import SymbolTable
-
-class SemanticAnalyzer(poglinVisitor):
-    def __init__(self):
+from src.ast.nodes import NodeVisitor
+
+# Tipos das expressões como tags inteiras: a visita de uma expressão devolve só a tag (ERROR é
+# o resultado compartilhado de toda expressão com erro). A posição usada nas mensagens vem do
+# nó da expressão (result_position) e o valor de um literal, do próprio nó. A tabela de
+# símbolos continua guardando o nome do tipo, que TAC, LLVM e o cache leem.
+INT, STRING, ERROR, UNKNOWN = range(4)
+TYPE_NAMES = ('Int', 'String', 'Error', 'Unknown')
+TYPE_TAGS = {name: tag for tag, name in enumerate(TYPE_NAMES)}
+
+def result_position(expr):
+    # Posição do resultado de uma expressão: a do último operador de uma cadeia binária (onde o
+    # tipo final foi decidido) ou a do próprio nó
+    if expr.visit_method == 'visitBinaryExpr':
+        return expr.positions[-1]
+    return expr.line, expr.column
+
+class SemanticAnalyzer(NodeVisitor):
+    # expressions: ExpressionTable (src/ast/hash_cons.py) já internada. Com ela, o tipo de cada
+    # expressão analisada sem erro fica memorizado pelo id da forma, e uma expressão igual
+    # adiante não é visitada de novo enquanto as variáveis que ela lê não forem redeclaradas
+    # nem saírem de escopo.
+    def __init__(self, expressions=None):
+        super().__init__()
         self.symbol_table = SymbolTable()
         self.errors = []
+        self.expressions = expressions
+        self.memo = {}          # id da forma -> tag do tipo
+        self.memo_by_name = {}  # variável -> ids de forma memorizados que a leem
+        self.visits_avoided = 0
 
         self.poglin_types_map = {
-            'Int': 'Int',
-            'String': 'String'
+            'Int': INT,
+            'String': STRING
         }
 
     def report_error(self, message, line, column):
@@ -21,309 +44,284 @@ class SemanticAnalyzer(poglinVisitor):
     def get_errors(self):
         return self.errors
 
-    def visitProgram(self, ctx: poglinParser.ProgramContext):
+    def memoized(self, node):
+        # Tipo memorizado da forma do nó; None se não houver
+        shape_id = self.expressions.shape_of[node]
+        type_tag = self.memo.get(shape_id)
+        if type_tag is not None:
+            self.visits_avoided += self.expressions.sizes[shape_id] - 1
+        return type_tag
+
+    def memoize(self, node, type_tag, errors_before):
+        # Só memoriza subárvores sem nenhum erro reportado: uma cópia adiante precisa reportar
+        # os mesmos erros na sua própria posição
+        if type_tag == ERROR or len(self.errors) != errors_before:
+            return
+        shape_id = self.expressions.shape_of[node]
+        self.memo[shape_id] = type_tag
+        for name in self.expressions.names[shape_id]:
+            self.memo_by_name.setdefault(name, []).append(shape_id)
+
+    def invalidate(self, names):
+        for name in names:
+            for shape_id in self.memo_by_name.pop(name, ()):
+                self.memo.pop(shape_id, None)
+
+    def exit_scope(self):
+        # As variáveis do escopo que termina deixam de existir (ou voltam a ser as de fora)
+        if self.memo_by_name:
+            self.invalidate(self.symbol_table.current_scope())
+        self.symbol_table.exit_scope()
+
+    def declare_variable(self, var_name, declared_type_text, var_line, var_column):
+        if self.symbol_table.is_declared_in_current_scope(var_name):
+            self.report_error(f"Variável '{var_name}' já declarada no escopo atual.", var_line, var_column)
+            return None
+        declared_type = self.poglin_types_map.get(declared_type_text, UNKNOWN)
+        self.symbol_table.declare(var_name, TYPE_NAMES[declared_type], var_line)
+        if var_name in self.memo_by_name:
+            self.invalidate((var_name,))
+        return declared_type
+
+    def check_initialization(self, var_name, declared_type, expr_type, expr, var_line, var_column):
+        if expr_type != ERROR:
+            if expr_type != declared_type:
+                self.report_error(
+                    f"Tipo incompatível na inicialização de '{var_name}': esperado '{TYPE_NAMES[declared_type]}', encontrado '{TYPE_NAMES[expr_type]}'.",
+                    *result_position(expr)
+                )
+        else:
+            self.report_error(f"Expressão de inicialização inválida para '{var_name}'.", var_line, var_column)
+
+    def resolve_assignment_target(self, var_name, var_line, var_column):
+        var_type = self.symbol_table.get_type(var_name)
+        if var_type is None:
+            self.report_error(f"Variável '{var_name}' não declarada.", var_line, var_column)
+            return None
+        return TYPE_TAGS[var_type]
+
+    def check_read(self, var_name, var_line, var_column):
+        var_type = self.resolve_assignment_target(var_name, var_line, var_column)
+        if var_type is not None and var_type != STRING:
+            self.report_error(f"Variável '{var_name}' do tipo '{TYPE_NAMES[var_type]}' não pode receber entrada de 'readLine()'. Esperado 'String'.", var_line, var_column)
+
+    def check_assignment(self, var_name, var_type, expr_type, expr, var_line, var_column):
+        if expr_type != ERROR:
+            if expr_type != var_type:
+                self.report_error(
+                    f"Atribuição inválida para '{var_name}': esperado '{TYPE_NAMES[var_type]}', encontrado '{TYPE_NAMES[expr_type]}'.",
+                    *result_position(expr)
+                )
+        else:
+            self.report_error(f"Expressão inválida ou com erro na atribuição para '{var_name}'.", var_line, var_column)
+
+    def check_condition(self, keyword, cond_type, cond):
+        if cond_type != INT:
+            self.report_error(f"Condição '{keyword}' espera um valor Int (booleano), encontrado '{TYPE_NAMES[cond_type]}'.", *result_position(cond))
+
+    def check_binary(self, op, left_type, right_type, right, line, column):
+        # Tipo do resultado de 'left op right' (reportando o erro, se houver)
+        if op == '||' or op == '&&':
+            if left_type != INT or right_type != INT:
+                op_name = 'OR' if op == '||' else 'AND'
+                self.report_error(f"Operador '{op}' ({op_name}) espera operandos Int (booleanos), encontrado '{TYPE_NAMES[left_type]}' e '{TYPE_NAMES[right_type]}'.", line, column)
+                return ERROR
+            return INT
+
+        if op == '==' or op == '!=':
+            if left_type != right_type:
+                self.report_error(f"Operador '{op}' espera operandos do mesmo tipo, encontrado '{TYPE_NAMES[left_type]}' e '{TYPE_NAMES[right_type]}'.", line, column)
+                return ERROR
+            return INT
+
+        if op == '+':
+            if (left_type == STRING and right_type == STRING) or \
+               (left_type == STRING and right_type == INT) or \
+               (left_type == INT and right_type == STRING):
+                return STRING
+
+        if left_type != INT or right_type != INT:
+            self.report_error(f"Operador '{op}' espera operandos Int, encontrado '{TYPE_NAMES[left_type]}' e '{TYPE_NAMES[right_type]}'.", line, column)
+            return ERROR
+
+        if op == '/' and right.visit_method == 'visitIntLiteral' and right.value == 0:
+            self.report_error(f"Divisão por zero detectada.", line, column)
+            return ERROR
+
+        return INT
+
+    def check_not(self, op, operand_type, line, column):
+        if operand_type != INT:
+            self.report_error(f"Operador '{op}' espera operando Int, encontrado '{TYPE_NAMES[operand_type]}'.", line, column)
+            return ERROR
+        return INT
+
+    def resolve_name(self, var_name, var_line, var_column):
+        var_type = self.symbol_table.get_type(var_name)
+        if var_type is None:
+            self.report_error(f"Variável '{var_name}' não declarada.", var_line, var_column)
+            return ERROR
+        return TYPE_TAGS[var_type]
+
+    # Visita da AST tipada (src/ast/nodes.py)
+    def visitProgram(self, node):
         self.symbol_table.enter_scope()
-        self.visitChildren(ctx)
+        self.visit_block(node.statements)
 
         # Captura o escopo global (não joga fora as variáveis declaradas)
-        self.symbol_table.global_snapshot = self.symbol_table.scopes[-1].copy()
+        self.symbol_table.global_snapshot = self.symbol_table.current_scope()
 
         # self.symbol_table.exit_scope()  # <- Comentado para preservar os símbolos
         return len(self.errors) == 0
 
-    def visitStatement(self, ctx: poglinParser.StatementContext):
-        if ctx.VAR():
-            var_name = ctx.ID().getText()
-            var_line = ctx.ID().symbol.line
-            var_column = ctx.ID().symbol.column
-            
-            if self.symbol_table.is_declared_in_current_scope(var_name):
-                self.report_error(f"Variável '{var_name}' já declarada no escopo atual.", var_line, var_column)
-                return None
-            
-            declared_type_text = ctx.type_().getText()
-            declared_poglin_type = self.poglin_types_map.get(declared_type_text, 'Unknown')
-
-            self.symbol_table.declare(var_name, declared_poglin_type) 
-
-            expr_type_info = self.visit(ctx.expression())
-            
-            if expr_type_info and expr_type_info['type'] != 'Error':
-                expr_type = expr_type_info['type']
-                
-                if expr_type != declared_poglin_type:
-                    self.report_error(
-                        f"Tipo incompatível na inicialização de '{var_name}': esperado '{declared_poglin_type}', encontrado '{expr_type}'.",
-                        expr_type_info['line'], expr_type_info['column']
-                    )
-            else:
-                self.report_error(f"Expressão de inicialização inválida para '{var_name}'.", var_line, var_column)
-            
-            return None
+    def visit_block(self, statements):
+        for statement in statements:
+            self.visit(statement)
 
-        elif ctx.READLINE():
-            var_name = ctx.ID().getText()
-            var_line = ctx.ID().symbol.line
-            var_column = ctx.ID().symbol.column
-
-            if not self.symbol_table.is_declared(var_name):
-                self.report_error(f"Variável '{var_name}' não declarada.", var_line, var_column)
-                return None
-            
-            var_type = self.symbol_table.get_type(var_name)
-            if var_type != 'String':
-                self.report_error(f"Variável '{var_name}' do tipo '{var_type}' não pode receber entrada de 'readLine()'. Esperado 'String'.", var_line, var_column)
-            
+    def visitVarDecl(self, node):
+        declared_type = self.declare_variable(node.name, node.var_type, node.line, node.column)
+        if declared_type is None:
             return None
+        self.check_initialization(node.name, declared_type, self.visit(node.value), node.value, node.line, node.column)
+        return None
 
-        elif ctx.ID() and ctx.ASSIGN() and ctx.expression():
-            var_name = ctx.ID().getText()
-            var_line = ctx.ID().symbol.line
-            var_column = ctx.ID().symbol.column
-
-            if not self.symbol_table.is_declared(var_name):
-                self.report_error(f"Variável '{var_name}' não declarada.", var_line, var_column)
-                return None
-            
-            var_type = self.symbol_table.get_type(var_name)
-            expr_type_info = self.visit(ctx.expression())
-            
-            if expr_type_info and expr_type_info['type'] != 'Error':
-                expr_type = expr_type_info['type']
-                if expr_type != var_type:
-                    self.report_error(
-                        f"Atribuição inválida para '{var_name}': esperado '{var_type}', encontrado '{expr_type}'.",
-                        expr_type_info['line'], expr_type_info['column']
-                    )
-            else:
-                self.report_error(f"Expressão inválida ou com erro na atribuição para '{var_name}'.", var_line, var_column)
-            
-            return None
+    def visitRead(self, node):
+        self.check_read(node.name, node.line, node.column)
+        return None
 
-        elif ctx.PRINTLN():
-            expr_type_info = self.visit(ctx.expression())
-            if expr_type_info and expr_type_info['type'] == 'Error':
-                pass
+    def visitAssign(self, node):
+        var_type = self.resolve_assignment_target(node.name, node.line, node.column)
+        if var_type is None:
             return None
-            
-        elif ctx.IF():
-            cond_type_info = self.visit(ctx.expression())
-            if cond_type_info and cond_type_info['type'] != 'Int':
-                self.report_error(f"Condição 'if' espera um valor Int (booleano), encontrado '{cond_type_info['type']}'.", cond_type_info['line'], cond_type_info['column'])
+        self.check_assignment(node.name, var_type, self.visit(node.value), node.value, node.line, node.column)
+        return None
 
+    def visitPrint(self, node):
+        self.visit(node.value)
+        return None
+
+    def visitIf(self, node):
+        self.check_condition('if', self.visit(node.condition), node.condition)
+        self.symbol_table.enter_scope()
+        self.visit_block(node.then_body)
+        self.exit_scope()
+        if node.else_body is not None:
             self.symbol_table.enter_scope()
-            in_current_block = False
-            brace_count = 0
-            for child in ctx.children:
-                if child == ctx.LBRACE(0):
-                    in_current_block = True
-                    brace_count += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_count == 1:
-                    in_current_block = False
-                    brace_count -= 1
-                    break 
-                if in_current_block and isinstance(child, poglinParser.StatementContext):
-                    self.visit(child)
-            self.symbol_table.exit_scope()
-
-            if ctx.ELSE():
-                self.symbol_table.enter_scope()
-                in_current_block = False
-                brace_count = 0
-                for child in ctx.children:
-                    if child == ctx.LBRACE(1):
-                        in_current_block = True
-                        brace_count += 1
-                        continue
-                    if child == ctx.RBRACE(1) and brace_count == 1:
-                        in_current_block = False
-                        brace_count -= 1
-                        break
-                    if in_current_block and isinstance(child, poglinParser.StatementContext):
-                        self.visit(child)
-                self.symbol_table.exit_scope()
-            return None
+            self.visit_block(node.else_body)
+            self.exit_scope()
+        return None
 
-        elif ctx.WHILE():
-            cond_type_info = self.visit(ctx.expression())
-            if cond_type_info and cond_type_info['type'] != 'Int':
-                self.report_error(f"Condição 'while' espera um valor Int (booleano), encontrado '{cond_type_info['type']}'.", cond_type_info['line'], cond_type_info['column'])
+    def visitWhile(self, node):
+        self.check_condition('while', self.visit(node.condition), node.condition)
+        self.symbol_table.enter_scope()
+        self.visit_block(node.body)
+        self.exit_scope()
+        return None
+
+    def visitPog(self, node):
+        return None
+
+    def visitBinaryExpr(self, node):
+        if self.expressions is not None:
+            type_tag = self.memoized(node)
+            if type_tag is not None:
+                return type_tag
+            errors_before = len(self.errors)
+        # Dobra à esquerda: operands[0] ops[0] operands[1] ops[1] ...
+        type_tag = self.visit(node.operands[0])
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            type_tag = self.check_binary(op, type_tag, self.visit(operand), operand, line, column)
+        if self.expressions is not None:
+            self.memoize(node, type_tag, errors_before)
+        return type_tag
+
+    def visitUnaryExpr(self, node):
+        if self.expressions is not None:
+            type_tag = self.memoized(node)
+            if type_tag is not None:
+                return type_tag
+            errors_before = len(self.errors)
+        type_tag = self.check_not(node.op, self.visit(node.operand), node.line, node.column)
+        if self.expressions is not None:
+            self.memoize(node, type_tag, errors_before)
+        return type_tag
+
+    def visitIntLiteral(self, node):
+        return INT
+
+    def visitStringLiteral(self, node):
+        return STRING
+
+    def visitName(self, node):
+        return self.resolve_name(node.name, node.line, node.column)
+
+    # Versões sem recursão (NodeVisitor.walk): mesma ordem de verificações dos métodos acima
+    def walkProgram(self, node):
+        self.symbol_table.enter_scope()
+        for statement in node.statements:
+            yield statement
+        self.symbol_table.global_snapshot = self.symbol_table.current_scope()
+        return len(self.errors) == 0
 
-            self.symbol_table.enter_scope()
-            in_current_block = False
-            brace_count = 0
-            for child in ctx.children:
-                if child == ctx.LBRACE(0):
-                    in_current_block = True
-                    brace_count += 1
-                    continue
-                if child == ctx.RBRACE(0) and brace_count == 1:
-                    in_current_block = False
-                    brace_count -= 1
-                    break
-                if in_current_block and isinstance(child, poglinParser.StatementContext):
-                    self.visit(child)
-            self.symbol_table.exit_scope()
+    def walkVarDecl(self, node):
+        declared_type = self.declare_variable(node.name, node.var_type, node.line, node.column)
+        if declared_type is None:
             return None
-        
-        elif ctx.POG():
+        self.check_initialization(node.name, declared_type, (yield node.value), node.value, node.line, node.column)
+        return None
+
+    def walkAssign(self, node):
+        var_type = self.resolve_assignment_target(node.name, node.line, node.column)
+        if var_type is None:
             return None
+        self.check_assignment(node.name, var_type, (yield node.value), node.value, node.line, node.column)
+        return None
+
+    def walkPrint(self, node):
+        yield node.value
+        return None
 
-        return self.visitChildren(ctx)
-
-
-    def visitExpression(self, ctx: poglinParser.ExpressionContext):
-        return self.visit(ctx.logicalOrExpression())
-
-    def visitLogicalOrExpression(self, ctx: poglinParser.LogicalOrExpressionContext):
-        left_type_info = self.visit(ctx.logicalAndExpression(0))
-        
-        # Acessa o token do operador de forma segura (verifica se a lista tem elementos)
-        op_tokens = ctx.OR() # Retorna uma lista, pode ser vazia
-        if op_tokens: # Se a lista não estiver vazia
-            op_token_instance = op_tokens[0] # Pega a primeira instância do token
-            right_type_info = self.visit(ctx.logicalAndExpression(1))
-            
-            if left_type_info and right_type_info:
-                if left_type_info['type'] != 'Int' or right_type_info['type'] != 'Int':
-                    self.report_error(f"Operador '{op_token_instance.getText()}' (OR) espera operandos Int (booleanos), encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        
-        return left_type_info
-
-    def visitLogicalAndExpression(self, ctx: poglinParser.LogicalAndExpressionContext):
-        left_type_info = self.visit(ctx.equalityExpression(0))
-        op_tokens = ctx.AND() # Retorna uma lista
-        if op_tokens:
-            op_token_instance = op_tokens[0]
-            right_type_info = self.visit(ctx.equalityExpression(1))
-
-            if left_type_info and right_type_info:
-                if left_type_info['type'] != 'Int' or right_type_info['type'] != 'Int':
-                    self.report_error(f"Operador '{op_token_instance.getText()}' (AND) espera operandos Int (booleanos), encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        return left_type_info
-
-    def visitEqualityExpression(self, ctx: poglinParser.EqualityExpressionContext):
-        left_type_info = self.visit(ctx.relationalExpression(0))
-        op_token_instance = None
-        if ctx.EQUALS(): op_token_instance = ctx.EQUALS()[0] # Acessa o primeiro elemento da lista
-        elif ctx.NEQUALS(): op_token_instance = ctx.NEQUALS()[0] # Acessa o primeiro elemento da lista
-
-        if op_token_instance:
-            right_type_info = self.visit(ctx.relationalExpression(1))
-            
-            if left_type_info and right_type_info:
-                if left_type_info['type'] != right_type_info['type']:
-                    self.report_error(f"Operador '{op_token_instance.getText()}' espera operandos do mesmo tipo, encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        return left_type_info
-
-    def visitRelationalExpression(self, ctx: poglinParser.RelationalExpressionContext):
-        left_type_info = self.visit(ctx.additiveExpression(0))
-        op_token_instance = None
-        if ctx.LT(): op_token_instance = ctx.LT()[0] # Acessa o primeiro elemento da lista
-        elif ctx.LTE(): op_token_instance = ctx.LTE()[0] # Acessa o primeiro elemento da lista
-        elif ctx.GT(): op_token_instance = ctx.GT()[0] # Acessa o primeiro elemento da lista
-        elif ctx.GTE(): op_token_instance = ctx.GTE()[0] # Acessa o primeiro elemento da lista
-
-        if op_token_instance:
-            right_type_info = self.visit(ctx.additiveExpression(1))
-
-            if left_type_info and right_type_info:
-                if left_type_info['type'] != 'Int' or right_type_info['type'] != 'Int':
-                    self.report_error(f"Operador '{op_token_instance.getText()}' espera operandos Int, encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        return left_type_info
-
-    def visitAdditiveExpression(self, ctx: poglinParser.AdditiveExpressionContext):
-        left_type_info = self.visit(ctx.multiplicativeExpression(0))
-        op_token_instance = None
-        if ctx.PLUS(): op_token_instance = ctx.PLUS()[0] # Acessa o primeiro elemento da lista
-        elif ctx.MINUS(): op_token_instance = ctx.MINUS()[0] # Acessa o primeiro elemento da lista
-
-        if op_token_instance:
-            right_type_info = self.visit(ctx.multiplicativeExpression(1))
-
-            if left_type_info and right_type_info:
-                if op_token_instance.getText() == '+':
-                    if (left_type_info['type'] == 'String' and right_type_info['type'] == 'String') or \
-                       (left_type_info['type'] == 'String' and right_type_info['type'] == 'Int') or \
-                       (left_type_info['type'] == 'Int' and right_type_info['type'] == 'String'):
-                        return {'type': 'String', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                
-                if left_type_info['type'] != 'Int' or right_type_info['type'] != 'Int':
-                    self.report_error(f"Operador '{op_token_instance.getText()}' espera operandos Int, encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        
-        return left_type_info
-
-    def visitMultiplicativeExpression(self, ctx: poglinParser.MultiplicativeExpressionContext):
-        left_type_info = self.visit(ctx.unaryExpression(0))
-        op_token_instance = None
-        if ctx.MULT(): op_token_instance = ctx.MULT()[0] # Acessa o primeiro elemento da lista
-        elif ctx.DIV(): op_token_instance = ctx.DIV()[0] # Acessa o primeiro elemento da lista
-
-        if op_token_instance:
-            right_type_info = self.visit(ctx.unaryExpression(1))
-
-            if left_type_info and right_type_info:
-                if left_type_info['type'] != 'Int' or right_type_info['type'] != 'Int':
-                    self.report_error(f"Operador '{op_token_instance.getText()}' espera operandos Int, encontrado '{left_type_info['type']}' e '{right_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-                
-                if op_token_instance.getText() == '/' and 'value' in right_type_info and right_type_info['value'] == 0:
-                    self.report_error(f"Divisão por zero detectada.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                    return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-
-                return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        return left_type_info
-
-    def visitUnaryExpression(self, ctx: poglinParser.UnaryExpressionContext):
-        op_tokens = ctx.NOT() # Retorna uma lista
-        if op_tokens:
-            op_token_instance = op_tokens[0] # Acessa o primeiro elemento da lista
-            operand_type_info = self.visit(ctx.unaryExpression())
-            if operand_type_info and operand_type_info['type'] != 'Int':
-                self.report_error(f"Operador '{op_token_instance.getText()}' espera operando Int, encontrado '{operand_type_info['type']}'.", op_token_instance.symbol.line, op_token_instance.symbol.column)
-                return {'type': 'Error', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-            return {'type': 'Int', 'line': op_token_instance.symbol.line, 'column': op_token_instance.symbol.column}
-        
-        return self.visit(ctx.primary())
-
-    def visitPrimary(self, ctx: poglinParser.PrimaryContext):
-        if ctx.INT():
-            return {'type': 'Int', 'value': int(ctx.INT().getText()), 'line': ctx.INT().symbol.line, 'column': ctx.INT().symbol.column}
-        elif ctx.STRING():
-            string_value = ctx.STRING().getText()
-            return {'type': 'String', 'value': string_value[1:-1], 'line': ctx.STRING().symbol.line, 'column': ctx.STRING().symbol.column}
-        elif ctx.ID():
-            var_name = ctx.ID().getText()
-            var_line = ctx.ID().symbol.line
-            var_column = ctx.ID().symbol.column
-            
-            var_type = self.symbol_table.get_type(var_name)
-            
-            if var_type is None:
-                self.report_error(f"Variável '{var_name}' não declarada.", var_line, var_column)
-                return {'type': 'Error', 'line': var_line, 'column': var_column}
-            
-            return {'type': var_type, 'line': var_line, 'column': var_column}
-
-        elif ctx.expression():
-            return self.visit(ctx.expression())
-        
-        self.report_error("Expressão primária não reconhecida ou inválida.", ctx.start.line, ctx.start.column)
-        return {'type': 'Error', 'line': ctx.start.line, 'column': ctx.start.column}
\ No newline at end of file
+    def walkIf(self, node):
+        self.check_condition('if', (yield node.condition), node.condition)
+        self.symbol_table.enter_scope()
+        for statement in node.then_body:
+            yield statement
+        self.exit_scope()
+        if node.else_body is not None:
+            self.symbol_table.enter_scope()
+            for statement in node.else_body:
+                yield statement
+            self.exit_scope()
+        return None
+
+    def walkWhile(self, node):
+        self.check_condition('while', (yield node.condition), node.condition)
+        self.symbol_table.enter_scope()
+        for statement in node.body:
+            yield statement
+        self.exit_scope()
+        return None
+
+    def walkBinaryExpr(self, node):
+        if self.expressions is not None:
+            type_tag = self.memoized(node)
+            if type_tag is not None:
+                return type_tag
+            errors_before = len(self.errors)
+        type_tag = yield node.operands[0]
+        for op, (line, column), operand in zip(node.ops, node.positions, node.operands[1:]):
+            type_tag = self.check_binary(op, type_tag, (yield operand), operand, line, column)
+        if self.expressions is not None:
+            self.memoize(node, type_tag, errors_before)
+        return type_tag
+
+    def walkUnaryExpr(self, node):
+        if self.expressions is not None:
+            type_tag = self.memoized(node)
+            if type_tag is not None:
+                return type_tag
+            errors_before = len(self.errors)
+        type_tag = self.check_not(node.op, (yield node.operand), node.line, node.column)
+        if self.expressions is not None:
+            self.memoize(node, type_tag, errors_before)
+        return type_tag
@@ -1,41 +1,103 @@
+# Tabela de símbolos com ids estáveis. Cada declaração ganha um id inteiro (a ordem em que foi
+# declarada) e uma linha no array denso de símbolos (names/types/scopes/lines, indexados pelo
+# id), que TAC e LLVM consultam direto. A resolução de nomes usa uma pilha de sombreamento por
+# nome (bindings: nome -> ids visíveis, o do escopo mais interno no topo), então achar um nome
+# é O(1) em vez de percorrer os escopos. As declarações ficam num log de desfazer; sair de um
+# escopo desempilha do log as declarações feitas nele (O(1) amortizado por declaração).
+
 class SymbolTable:
     def __init__(self):
-        self.scopes = [{}]
+        # Array denso: id -> nome, tipo, escopo e linha da declaração
+        self.names = []
+        self.types = []
+        self.scopes = []
+        self.lines = []
+        self.bindings = {}   # nome -> pilha de ids
+        self.undo = []       # ids declarados, na ordem, dos escopos abertos
+        self.marks = [0]     # tamanho do log na entrada de cada escopo aberto
+        self.scope_ids = [0] # id de cada escopo aberto
+        self.scope_count = 1
+        self.replay = None   # próximo id a reaproveitar depois de rewind()
 
     def enter_scope(self):
-        self.scopes.append({})
+        self.marks.append(len(self.undo))
+        self.scope_ids.append(self.scope_count)
+        self.scope_count += 1
 
     def exit_scope(self):
-        if len(self.scopes) > 1:
-            self.scopes.pop()
+        if len(self.marks) > 1:
+            mark = self.marks.pop()
+            self.scope_ids.pop()
+            bindings = self.bindings
+            names = self.names
+            for symbol_id in reversed(self.undo[mark:]):
+                stack = bindings[names[symbol_id]]
+                stack.pop()
+                if not stack:
+                    del bindings[names[symbol_id]]
+            del self.undo[mark:]
         else:
             raise Exception("Tentativa de sair do escopo global")
 
-    def declare(self, name, var_type):
+    def declare(self, name, var_type, line=None):
         if self.is_declared_in_current_scope(name):
             raise Exception(f"Variável '{name}' já declarada no escopo atual")
-        self.scopes[-1][name] = var_type
+        if self.replay is None:
+            symbol_id = len(self.names)
+            self.names.append(name)
+            self.types.append(var_type)
+            self.scopes.append(self.scope_ids[-1])
+            self.lines.append(line)
+        else:
+            symbol_id = self.replay
+            self.replay += 1
+        self.bindings.setdefault(name, []).append(symbol_id)
+        self.undo.append(symbol_id)
+        return symbol_id
+
+    def rewind(self):
+        # Volta aos escopos iniciais mantendo os símbolos: as próximas declarações, feitas na
+        # mesma ordem da análise semântica, recebem de novo os mesmos ids. Usado pelo TAC para
+        # resolver cada nome para o símbolo que a semântica resolveu.
+        self.bindings = {}
+        self.undo = []
+        self.marks = [0]
+        self.scope_ids = [0]
+        self.scope_count = 1
+        self.replay = 0
+
+    def replay_position(self):
+        # (próximo id, próximo escopo) do replay
+        return self.replay, self.scope_count
+
+    def seek(self, position):
+        # Continua o replay em position (de replay_position): refaz um trecho já percorrido
+        # (ponto fixo de um while) ou pula um trecho que não será percorrido (bloco morto).
+        # Só vale entre comandos do mesmo escopo, com os escopos do trecho já fechados.
+        self.replay, self.scope_count = position
+
+    def lookup(self, name):
+        # Id do símbolo visível com esse nome, ou None
+        stack = self.bindings.get(name)
+        return stack[-1] if stack else None
 
     def is_declared(self, name):
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return True
-        return False
+        return name in self.bindings
 
     def is_declared_in_current_scope(self, name):
-        return name in self.scopes[-1]
+        stack = self.bindings.get(name)
+        return bool(stack) and self.scopes[stack[-1]] == self.scope_ids[-1]
 
     def get_type(self, name):
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        return None
+        stack = self.bindings.get(name)
+        return self.types[stack[-1]] if stack else None
+
+    def current_scope(self):
+        # nome -> tipo das declarações do escopo mais interno
+        return {self.names[symbol_id]: self.types[symbol_id] for symbol_id in self.undo[self.marks[-1]:]}
 
     def exists(self, name):
         return self.is_declared(name)
 
     def all(self):
-        all_vars = set()
-        for scope in self.scopes:
-            all_vars.update(scope.keys())
-        return all_vars
+        return set(self.bindings)